@@ -0,0 +1,31 @@
+"""Add keyset pagination index on business objects
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-09-02 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_business_objects_tenant_active_created_id",
+        "business_objects",
+        ["tenant_id", "is_active", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_business_objects_tenant_active_created_id", table_name="business_objects"
+    )
@@ -0,0 +1,33 @@
+"""Add content hash to analyses for result caching
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-09-16 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "analyses", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        "ix_analyses_object_content_hash",
+        "analyses",
+        ["business_object_id", "content_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analyses_object_content_hash", table_name="analyses")
+    op.drop_column("analyses", "content_hash")
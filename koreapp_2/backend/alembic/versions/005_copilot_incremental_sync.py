@@ -0,0 +1,68 @@
+"""Add Copilot connector sync state and indexed item hashes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-09-30 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "copilot_sync_states",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tenant_id", sa.String(length=255), nullable=False),
+        sa.Column("connection_id", sa.String(length=255), nullable=False),
+        sa.Column("watermark", sa.DateTime(), nullable=True),
+        sa.Column("last_full_sync_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "connection_id",
+            name="uq_copilot_sync_states_tenant_connection",
+        ),
+    )
+
+    op.create_table(
+        "copilot_indexed_items",
+        sa.Column("connection_id", sa.String(length=255), nullable=False),
+        sa.Column("business_object_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tenant_id", sa.String(length=255), nullable=False),
+        sa.Column("payload_hash", sa.String(length=64), nullable=False),
+        sa.Column("indexed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("connection_id", "business_object_id"),
+    )
+    op.create_index(
+        op.f("ix_copilot_indexed_items_tenant_id"),
+        "copilot_indexed_items",
+        ["tenant_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_business_objects_tenant_updated_at",
+        "business_objects",
+        ["tenant_id", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_business_objects_tenant_updated_at", table_name="business_objects"
+    )
+    op.drop_index(
+        op.f("ix_copilot_indexed_items_tenant_id"), table_name="copilot_indexed_items"
+    )
+    op.drop_table("copilot_indexed_items")
+    op.drop_table("copilot_sync_states")
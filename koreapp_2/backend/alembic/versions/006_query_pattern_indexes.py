@@ -0,0 +1,85 @@
+"""Add composite and partial indexes matching service query patterns
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-10-07 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_business_objects_tenant_created_id_active",
+            "business_objects",
+            ["tenant_id", "created_at", "id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_business_objects_tenant_active_created_id",
+            table_name="business_objects",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_analyses_object_tenant_created",
+            "analyses",
+            ["business_object_id", "tenant_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_relationships_source_tenant",
+            "relationships",
+            ["source_id", "tenant_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_relationships_target_tenant",
+            "relationships",
+            ["target_id", "tenant_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_relationships_target_tenant",
+            table_name="relationships",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_relationships_source_tenant",
+            table_name="relationships",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_analyses_object_tenant_created",
+            table_name="analyses",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_business_objects_tenant_active_created_id",
+            "business_objects",
+            ["tenant_id", "is_active", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_business_objects_tenant_created_id_active",
+            table_name="business_objects",
+            postgresql_concurrently=True,
+        )
@@ -1,7 +1,20 @@
-from typing import Any, Dict, List
-from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timedelta
+from uuid import UUID
 
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.models.copilot_sync import CopilotIndexedItem, CopilotSyncState
+from app.services.microsoft_graph import microsoft_graph_service
 
 logger = get_logger(__name__)
 
@@ -69,22 +82,25 @@ class CopilotConnectorSchema:
 
     @staticmethod
     def create_external_item(business_object: Any, base_url: str) -> Dict[str, Any]:
+        object_id = str(business_object.id)
+        name = business_object.name
+        description = business_object.description or ""
         return {
-            "id": str(business_object.id),
+            "id": object_id,
             "content": {
-                "value": f"{business_object.name}\n\n{business_object.description or ''}",
+                "value": f"{name}\n\n{description}",
                 "type": "text"
             },
             "properties": {
-                "title": business_object.name,
-                "description": business_object.description or "",
+                "title": name,
+                "description": description,
                 "objectType": business_object.type,
                 "complexity": business_object.complexity,
                 "status": business_object.status,
                 "owner": business_object.owner or "",
                 "lastModified": business_object.updated_at.isoformat(),
                 "tags": business_object.tags.split(",") if business_object.tags else [],
-                "deepLink": f"{base_url}/objects/{business_object.id}"
+                "deepLink": f"{base_url}/objects/{object_id}"
             },
             "acl": [
                 {
@@ -101,6 +117,42 @@ class CopilotConnectorSchema:
         }
 
 
+class SerializedDocument:
+    def __init__(self, content: Dict[str, Any]):
+        self.body = json.dumps(content, separators=(",", ":")).encode()
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+
+INDEXED_COLUMNS = [
+    BusinessObjectModel.id,
+    BusinessObjectModel.name,
+    BusinessObjectModel.description,
+    BusinessObjectModel.type,
+    BusinessObjectModel.complexity,
+    BusinessObjectModel.status,
+    BusinessObjectModel.owner,
+    BusinessObjectModel.tags,
+    BusinessObjectModel.tenant_id,
+    BusinessObjectModel.created_by,
+    BusinessObjectModel.updated_at,
+]
+
+
+def iter_external_items(
+    business_objects: Iterable[Any], base_url: str
+) -> Iterator[Dict[str, Any]]:
+    for business_object in business_objects:
+        yield CopilotConnectorSchema.create_external_item(business_object, base_url)
+
+
+def payload_hash(item: Dict[str, Any]) -> str:
+    properties = {
+        key: value for key, value in item["properties"].items() if key != "lastModified"
+    }
+    payload = json.dumps({**item, "properties": properties}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 class CopilotActionSchema:
     @staticmethod
     def generate_openapi_spec(base_url: str) -> Dict[str, Any]:
@@ -251,8 +303,12 @@ class CopilotIntegrationService:
     def __init__(self):
         self.connector_schema = CopilotConnectorSchema()
         self.action_schema = CopilotActionSchema()
+        self._documents = LRUCache(maxsize=settings.COPILOT_DOCUMENT_CACHE_SIZE)
 
     async def create_connection_schema(self, connection_id: str) -> Dict[str, Any]:
+        return self._connection_schema(connection_id)
+
+    def _connection_schema(self, connection_id: str) -> Dict[str, Any]:
         return {
             "id": connection_id,
             "name": "AI Agent Platform Connector",
@@ -267,17 +323,237 @@ class CopilotIntegrationService:
     async def index_business_objects(
         self, business_objects: List[Any], base_url: str
     ) -> List[Dict[str, Any]]:
-        indexed_items = []
-        
-        for obj in business_objects:
-            external_item = self.connector_schema.create_external_item(obj, base_url)
-            indexed_items.append(external_item)
+        indexed_items = list(iter_external_items(business_objects, base_url))
             
         logger.info(f"Indexed {len(indexed_items)} business objects for Copilot")
         return indexed_items
 
+    def validate_connection(self, tenant_id: str, connection_id: str) -> None:
+        if settings.COPILOT_CONNECTIONS.get(connection_id) != tenant_id:
+            raise ValueError("Connection not found")
+
+    async def sync_tenant(
+        self,
+        db: AsyncSession,
+        *,
+        tenant_id: str,
+        connection_id: str,
+        base_url: str,
+        access_token: str,
+        full: bool = False,
+        chunk_size: int = settings.COPILOT_INDEX_CHUNK_SIZE,
+        concurrency: int = settings.COPILOT_INDEX_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        state = await self._get_sync_state(db, tenant_id, connection_id)
+        since = None if full else state.watermark
+        started_at = datetime.utcnow()
+        watermark = await self._next_watermark(db)
+
+        stats = {"indexed": 0, "deleted": 0, "skipped": 0, "failed": 0}
+        completed: List[Tuple[UUID, Optional[str]]] = []
+
+        operations = self._sync_operations(
+            db, tenant_id, connection_id, base_url, since, full, chunk_size,
+            completed, stats,
+        )
+        await self._run_operations(
+            operations, connection_id, access_token, concurrency, completed, stats
+        )
+        await self._record_completed(db, tenant_id, connection_id, completed)
+
+        if not stats["failed"]:
+            state.watermark = watermark
+        if full:
+            state.last_full_sync_at = started_at
+        await db.commit()
+
+        logger.info(
+            f"Copilot {'full' if full else 'incremental'} sync for tenant {tenant_id}: "
+            f"{stats['indexed']} indexed, {stats['deleted']} deleted, "
+            f"{stats['skipped']} unchanged, {stats['failed']} failed"
+        )
+        return {**stats, "full": full, "watermark": state.watermark}
+
+    async def _get_sync_state(
+        self, db: AsyncSession, tenant_id: str, connection_id: str
+    ) -> CopilotSyncState:
+        result = await db.execute(
+            select(CopilotSyncState).where(
+                CopilotSyncState.tenant_id == tenant_id,
+                CopilotSyncState.connection_id == connection_id,
+            )
+        )
+        state = result.scalar_one_or_none()
+        if state is None:
+            state = CopilotSyncState(tenant_id=tenant_id, connection_id=connection_id)
+            db.add(state)
+            await db.flush()
+        return state
+
+    async def _next_watermark(self, db: AsyncSession) -> datetime:
+        result = await db.execute(select(func.timezone("UTC", func.now())))
+        margin = timedelta(seconds=settings.COPILOT_SYNC_WATERMARK_MARGIN)
+        return result.scalar() - margin
+
+    async def _sync_operations(
+        self,
+        db: AsyncSession,
+        tenant_id: str,
+        connection_id: str,
+        base_url: str,
+        since: Optional[datetime],
+        full: bool,
+        chunk_size: int,
+        completed: List[Tuple[UUID, Optional[str]]],
+        stats: Dict[str, int],
+    ) -> AsyncIterator[Tuple[str, Any, Optional[str]]]:
+        query = select(*INDEXED_COLUMNS, BusinessObjectModel.is_active).where(
+            BusinessObjectModel.tenant_id == tenant_id
+        )
+        if since is not None:
+            query = query.where(BusinessObjectModel.updated_at >= since)
+
+        result = await db.stream(query.execution_options(yield_per=chunk_size))
+        async for partition in result.partitions():
+            await self._record_completed(db, tenant_id, connection_id, completed)
+
+            known = await self._indexed_hashes(
+                db, connection_id, [row.id for row in partition]
+            )
+            for row in partition:
+                if not row.is_active:
+                    if full or row.id in known:
+                        yield "delete", row.id, None
+                    continue
+
+                item = self.connector_schema.create_external_item(row, base_url)
+                digest = payload_hash(item)
+                if not full and known.get(row.id) == digest:
+                    stats["skipped"] += 1
+                    continue
+                yield "put", item, digest
+
+    async def _indexed_hashes(
+        self, db: AsyncSession, connection_id: str, object_ids: List[UUID]
+    ) -> Dict[UUID, str]:
+        result = await db.execute(
+            select(
+                CopilotIndexedItem.business_object_id, CopilotIndexedItem.payload_hash
+            ).where(
+                CopilotIndexedItem.connection_id == connection_id,
+                CopilotIndexedItem.business_object_id.in_(object_ids),
+            )
+        )
+        return dict(result.all())
+
+    async def _record_completed(
+        self,
+        db: AsyncSession,
+        tenant_id: str,
+        connection_id: str,
+        completed: List[Tuple[UUID, Optional[str]]],
+    ) -> None:
+        if not completed:
+            return
+        batch = completed[:]
+        completed.clear()
+
+        upserts = [
+            {
+                "connection_id": connection_id,
+                "business_object_id": object_id,
+                "tenant_id": tenant_id,
+                "payload_hash": digest,
+                "indexed_at": datetime.utcnow(),
+            }
+            for object_id, digest in batch
+            if digest is not None
+        ]
+        deleted = [object_id for object_id, digest in batch if digest is None]
+
+        if upserts:
+            statement = insert(CopilotIndexedItem).values(upserts)
+            await db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["connection_id", "business_object_id"],
+                    set_={
+                        "payload_hash": statement.excluded.payload_hash,
+                        "indexed_at": statement.excluded.indexed_at,
+                    },
+                )
+            )
+        if deleted:
+            await db.execute(
+                delete(CopilotIndexedItem).where(
+                    CopilotIndexedItem.connection_id == connection_id,
+                    CopilotIndexedItem.business_object_id.in_(deleted),
+                )
+            )
+
+    async def _run_operations(
+        self,
+        operations: AsyncIterator[Tuple[str, Any, Optional[str]]],
+        connection_id: str,
+        access_token: str,
+        concurrency: int,
+        completed: List[Tuple[UUID, Optional[str]]],
+        stats: Dict[str, int],
+    ) -> None:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+        async def worker() -> None:
+            while True:
+                operation = await queue.get()
+                if operation is None:
+                    return
+                action, payload, digest = operation
+                try:
+                    if action == "put":
+                        await microsoft_graph_service.put_external_item(
+                            access_token, connection_id, payload
+                        )
+                        completed.append((UUID(payload["id"]), digest))
+                        stats["indexed"] += 1
+                    else:
+                        await microsoft_graph_service.delete_external_item(
+                            access_token, connection_id, str(payload)
+                        )
+                        completed.append((payload, None))
+                        stats["deleted"] += 1
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.warning(f"Copilot {action} failed for {operation[1]}: {e}")
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            async for operation in operations:
+                await queue.put(operation)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
     def get_openapi_spec(self, base_url: str) -> Dict[str, Any]:
         return self.action_schema.generate_openapi_spec(base_url)
 
+    def openapi_document(self, base_url: str) -> SerializedDocument:
+        key = ("openapi", base_url)
+        document = self._documents.get(key)
+        if document is None:
+            spec = self.action_schema.generate_openapi_spec(base_url)
+            document = SerializedDocument(spec)
+            self._documents.set(key, document)
+        return document
+
+    def connection_schema_document(self, connection_id: str) -> SerializedDocument:
+        key = ("connection_schema", connection_id)
+        document = self._documents.get(key)
+        if document is None:
+            document = SerializedDocument(self._connection_schema(connection_id))
+            self._documents.set(key, document)
+        return document
+
 
 copilot_integration_service = CopilotIntegrationService()
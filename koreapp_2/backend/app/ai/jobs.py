@@ -0,0 +1,243 @@
+import asyncio
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.orchestrator import AIOrchestrator
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.database import AsyncSessionLocal
+from app.schemas.analysis import AnalysisCreate
+from app.services.analysis import analysis_service
+from app.services.analysis_cache import analysis_cache_service
+from app.services.business_object import business_object_service
+
+logger = get_logger(__name__)
+
+AI_OPTIMIZATION_TYPE = "ai_optimization"
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AIJob:
+    def __init__(
+        self,
+        kind: str,
+        object_id: UUID,
+        tenant_id: str,
+        created_by: str,
+    ):
+        self.id = uuid4()
+        self.kind = kind
+        self.object_id = object_id
+        self.tenant_id = tenant_id
+        self.created_by = created_by
+        self.status = JobStatus.QUEUED
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.done = asyncio.Event()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "object_id": self.object_id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class AIJobQueue:
+    def __init__(
+        self,
+        workers: int,
+        tenant_concurrency: int,
+        max_pending: int,
+        max_retained: int,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.workers = workers
+        self.tenant_concurrency = tenant_concurrency
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self.session_factory = session_factory
+        self._jobs: "OrderedDict[UUID, AIJob]" = OrderedDict()
+        self._pending: "OrderedDict[str, Deque[AIJob]]" = OrderedDict()
+        self._pending_count = 0
+        self._running: Dict[str, int] = {}
+        self._condition = asyncio.Condition()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"ai-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(
+        self,
+        kind: str,
+        object_id: UUID,
+        tenant_id: str,
+        created_by: str,
+    ) -> AIJob:
+        async with self._condition:
+            if self._pending_count >= self.max_pending:
+                raise asyncio.QueueFull("AI job queue is full")
+
+            job = AIJob(kind, object_id, tenant_id, created_by)
+            self._jobs[job.id] = job
+            self._pending.setdefault(tenant_id, deque()).append(job)
+            self._pending_count += 1
+            self._evict_finished()
+            self._condition.notify()
+        return job
+
+    def get(self, job_id: UUID, tenant_id: str) -> Optional[AIJob]:
+        job = self._jobs.get(job_id)
+        if job is None or job.tenant_id != tenant_id:
+            return None
+        return job
+
+    def _evict_finished(self) -> None:
+        if len(self._jobs) <= self.max_retained:
+            return
+        for job_id, job in list(self._jobs.items()):
+            if len(self._jobs) <= self.max_retained:
+                break
+            if job.done.is_set():
+                del self._jobs[job_id]
+
+    def _next_job(self) -> Optional[AIJob]:
+        for tenant_id, jobs in self._pending.items():
+            if self._running.get(tenant_id, 0) >= self.tenant_concurrency:
+                continue
+
+            job = jobs.popleft()
+            if jobs:
+                self._pending.move_to_end(tenant_id)
+            else:
+                del self._pending[tenant_id]
+            self._pending_count -= 1
+            self._running[tenant_id] = self._running.get(tenant_id, 0) + 1
+            return job
+        return None
+
+    async def _worker(self) -> None:
+        while True:
+            async with self._condition:
+                job = self._next_job()
+                while job is None:
+                    await self._condition.wait()
+                    job = self._next_job()
+
+            try:
+                await self._run(job)
+            finally:
+                async with self._condition:
+                    self._running[job.tenant_id] -= 1
+                    if not self._running[job.tenant_id]:
+                        del self._running[job.tenant_id]
+                    self._condition.notify_all()
+
+    async def _run(self, job: AIJob) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        try:
+            job.result = await self._execute(job)
+            job.status = JobStatus.COMPLETED
+        except asyncio.CancelledError:
+            job.status = JobStatus.FAILED
+            job.error = "cancelled"
+            raise
+        except Exception as e:
+            logger.exception(f"AI job {job.id} failed")
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.utcnow()
+            job.done.set()
+
+    async def _execute(self, job: AIJob) -> Dict[str, Any]:
+        async with self.session_factory() as db:
+            business_object = await business_object_service.get(
+                db=db, id=job.object_id, tenant_id=job.tenant_id
+            )
+        if business_object is None:
+            raise ValueError("Business object not found")
+
+        if job.kind == "analyze":
+            result, _ = await analysis_cache_service.get_or_analyze(
+                self.session_factory,
+                business_object=business_object,
+                orchestrator=AIOrchestrator(),
+                tenant_id=job.tenant_id,
+                created_by=job.created_by,
+            )
+            return result
+
+        result = await AIOrchestrator().optimize_object(business_object)
+        async with self.session_factory() as db:
+            await analysis_service.create(
+                db=db,
+                obj_in=optimization_analysis_create(business_object.id, result),
+                tenant_id=job.tenant_id,
+                created_by=job.created_by,
+            )
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._tasks),
+            "pending": self._pending_count,
+            "running": sum(self._running.values()),
+            "retained": len(self._jobs),
+        }
+
+
+def optimization_analysis_create(
+    object_id: UUID, result: Dict[str, Any]
+) -> AnalysisCreate:
+    return AnalysisCreate(
+        business_object_id=object_id,
+        analysis_type=AI_OPTIMIZATION_TYPE,
+        summary=result["optimization_summary"],
+        recommendations=[{"text": action} for action in result["priority_actions"]],
+        metrics={
+            "expected_improvements": result["expected_improvements"],
+            "implementation_timeline": result["implementation_timeline"],
+            "risk_assessment": result["risk_assessment"],
+            "agent_results": result["agent_results"],
+        },
+    )
+
+
+ai_job_queue = AIJobQueue(
+    workers=settings.AI_JOB_WORKERS,
+    tenant_concurrency=settings.AI_JOB_TENANT_CONCURRENCY,
+    max_pending=settings.AI_JOB_QUEUE_SIZE,
+    max_retained=settings.AI_JOB_RETENTION,
+)
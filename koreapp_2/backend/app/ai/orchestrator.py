@@ -1,7 +1,9 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 import asyncio
+from contextlib import aclosing
 from datetime import datetime
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.models.business_object import BusinessObject
 
@@ -29,6 +31,127 @@ class AIAgent:
         }
 
 
+class AgentStep:
+    def __init__(
+        self,
+        agent: str,
+        task: str,
+        depends_on: Sequence[str] = (),
+        timeout: Optional[float] = None,
+    ):
+        self.agent = agent
+        self.task = task
+        self.depends_on = tuple(depends_on)
+        self.timeout = timeout
+
+
+class AgentExecutionPlan:
+    def __init__(self, steps: List[AgentStep]):
+        self.steps = self._topological_order(steps)
+
+    @staticmethod
+    def _topological_order(steps: List[AgentStep]) -> List[AgentStep]:
+        by_agent = {step.agent: step for step in steps}
+        if len(by_agent) != len(steps):
+            raise ValueError("Each agent may appear only once in a plan")
+
+        ordered: List[AgentStep] = []
+        visiting: set = set()
+        done: set = set()
+
+        def visit(step: AgentStep) -> None:
+            if step.agent in done:
+                return
+            if step.agent in visiting:
+                raise ValueError(f"Dependency cycle detected at agent '{step.agent}'")
+            visiting.add(step.agent)
+            for dependency in step.depends_on:
+                if dependency not in by_agent:
+                    raise ValueError(
+                        f"Agent '{step.agent}' depends on unknown agent '{dependency}'"
+                    )
+                visit(by_agent[dependency])
+            visiting.discard(step.agent)
+            done.add(step.agent)
+            ordered.append(step)
+
+        for step in steps:
+            visit(step)
+        return ordered
+
+    async def run(
+        self, agents: Dict[str, AIAgent], context: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        results = {}
+        async for agent, result in self.stream(agents, context):
+            results[agent] = result
+        return {step.agent: results[step.agent] for step in self.steps}
+
+    async def stream(
+        self, agents: Dict[str, AIAgent], context: Dict[str, Any]
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        tasks: Dict[str, asyncio.Task] = {}
+        for step in self.steps:
+            tasks[step.agent] = asyncio.create_task(
+                self._run_step(step, agents[step.agent], context, tasks),
+                name=f"agent:{step.agent}",
+            )
+
+        try:
+            for finished in asyncio.as_completed(list(tasks.values())):
+                yield await finished
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def _run_step(
+        self,
+        step: AgentStep,
+        agent: AIAgent,
+        context: Dict[str, Any],
+        tasks: Dict[str, asyncio.Task],
+    ) -> Tuple[str, Dict[str, Any]]:
+        if step.depends_on:
+            upstream = {
+                dependency: (await tasks[dependency])[1]
+                for dependency in step.depends_on
+            }
+            context = {**context, "upstream_results": upstream}
+
+        timeout = step.timeout or settings.AI_AGENT_TIMEOUT
+        try:
+            result = await asyncio.wait_for(agent.execute(step.task, context), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Agent {agent.name} timed out after {timeout}s")
+            result = {
+                "agent": agent.name,
+                "role": agent.role,
+                "task": step.task,
+                "status": "timed_out",
+                "timeout": timeout,
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+        return step.agent, result
+
+
+ANALYSIS_PLAN = AgentExecutionPlan([
+    AgentStep("planner", "Analyze business object and create improvement plan"),
+    AgentStep("db_architect", "Review data architecture and suggest optimizations"),
+    AgentStep("backend_engineer", "Analyze implementation and suggest improvements"),
+    AgentStep(
+        "qa_tester",
+        "Generate test scenarios and validation criteria",
+        depends_on=["backend_engineer"],
+    ),
+])
+
+OPTIMIZATION_PLAN = AgentExecutionPlan([
+    AgentStep("planner", "Create optimization strategy"),
+    AgentStep("backend_engineer", "Generate technical optimization recommendations"),
+])
+
+
 class AIOrchestrator:
     def __init__(self):
         self.agents = {
@@ -55,7 +178,26 @@ class AIOrchestrator:
         }
 
     async def analyze_object(self, business_object: BusinessObject) -> Dict[str, Any]:
-        context = {
+        agent_results = await ANALYSIS_PLAN.run(
+            self.agents, self._analysis_context(business_object)
+        )
+        return self._analysis_result(business_object, agent_results)
+
+    async def analyze_object_stream(
+        self, business_object: BusinessObject
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        agent_results = {}
+        context = self._analysis_context(business_object)
+        async with aclosing(ANALYSIS_PLAN.stream(self.agents, context)) as steps:
+            async for agent, result in steps:
+                agent_results[agent] = result
+                yield "agent", {"agent_key": agent, **result}
+
+        ordered = {step.agent: agent_results[step.agent] for step in ANALYSIS_PLAN.steps}
+        yield "result", self._analysis_result(business_object, ordered)
+
+    def _analysis_context(self, business_object: BusinessObject) -> Dict[str, Any]:
+        return {
             "object_id": str(business_object.id),
             "object_name": business_object.name,
             "object_type": business_object.type,
@@ -63,22 +205,9 @@ class AIOrchestrator:
             "description": business_object.description
         }
 
-        planner_result = await self.agents["planner"].execute(
-            "Analyze business object and create improvement plan", context
-        )
-
-        db_result = await self.agents["db_architect"].execute(
-            "Review data architecture and suggest optimizations", context
-        )
-
-        backend_result = await self.agents["backend_engineer"].execute(
-            "Analyze implementation and suggest improvements", context
-        )
-
-        qa_result = await self.agents["qa_tester"].execute(
-            "Generate test scenarios and validation criteria", context
-        )
-
+    def _analysis_result(
+        self, business_object: BusinessObject, agent_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
         return {
             "summary": f"Comprehensive analysis completed for {business_object.name}",
             "insights": [
@@ -94,29 +223,40 @@ class AIOrchestrator:
                 "Review security permissions and access controls"
             ],
             "confidence_score": 0.87,
-            "agent_results": {
-                "planner": planner_result,
-                "db_architect": db_result,
-                "backend_engineer": backend_result,
-                "qa_tester": qa_result
-            }
+            "agent_results": agent_results
         }
 
     async def optimize_object(self, business_object: BusinessObject) -> Dict[str, Any]:
-        context = {
+        agent_results = await OPTIMIZATION_PLAN.run(
+            self.agents, self._optimization_context(business_object)
+        )
+        return self._optimization_result(business_object, agent_results)
+
+    async def optimize_object_stream(
+        self, business_object: BusinessObject
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        agent_results = {}
+        context = self._optimization_context(business_object)
+        async with aclosing(OPTIMIZATION_PLAN.stream(self.agents, context)) as steps:
+            async for agent, result in steps:
+                agent_results[agent] = result
+                yield "agent", {"agent_key": agent, **result}
+
+        ordered = {
+            step.agent: agent_results[step.agent] for step in OPTIMIZATION_PLAN.steps
+        }
+        yield "result", self._optimization_result(business_object, ordered)
+
+    def _optimization_context(self, business_object: BusinessObject) -> Dict[str, Any]:
+        return {
             "object_id": str(business_object.id),
             "object_name": business_object.name,
             "optimization_target": "performance_and_efficiency"
         }
 
-        optimization_plan = await self.agents["planner"].execute(
-            "Create optimization strategy", context
-        )
-
-        technical_recommendations = await self.agents["backend_engineer"].execute(
-            "Generate technical optimization recommendations", context
-        )
-
+    def _optimization_result(
+        self, business_object: BusinessObject, agent_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
         return {
             "optimization_summary": f"Optimization plan generated for {business_object.name}",
             "priority_actions": [
@@ -133,30 +273,36 @@ class AIOrchestrator:
             },
             "implementation_timeline": "2-3 weeks",
             "risk_assessment": "Low risk with proper testing",
-            "agent_results": {
-                "planner": optimization_plan,
-                "backend_engineer": technical_recommendations
-            }
+            "agent_results": agent_results
         }
 
     async def chat(self, message: str, context: Dict[str, Any], user_id: str) -> str:
         logger.info(f"Processing chat message from user {user_id}: {message}")
 
+        agent, task = self._route_chat(message)
+        await agent.execute(task, {**context, "user_message": message})
+        return self._chat_response(message)
+
+    async def chat_stream(
+        self, message: str, context: Dict[str, Any], user_id: str
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        logger.info(f"Streaming chat message from user {user_id}: {message}")
+
+        agent, task = self._route_chat(message)
+        result = await agent.execute(task, {**context, "user_message": message})
+        yield "agent", result
+        yield "message", {"text": self._chat_response(message)}
+
+    def _route_chat(self, message: str) -> Tuple[AIAgent, str]:
         if "analyze" in message.lower():
-            agent = self.agents["planner"]
-            task = "Provide analysis based on user query"
+            return self.agents["planner"], "Provide analysis based on user query"
         elif "optimize" in message.lower():
-            agent = self.agents["backend_engineer"] 
-            task = "Provide optimization recommendations"
+            return self.agents["backend_engineer"], "Provide optimization recommendations"
         elif "test" in message.lower():
-            agent = self.agents["qa_tester"]
-            task = "Provide testing guidance"
-        else:
-            agent = self.agents["planner"]
-            task = "Provide general assistance"
-
-        result = await agent.execute(task, {**context, "user_message": message})
+            return self.agents["qa_tester"], "Provide testing guidance"
+        return self.agents["planner"], "Provide general assistance"
 
+    def _chat_response(self, message: str) -> str:
         responses = {
             "analyze": "Based on my analysis, I can see several opportunities for improvement. The system shows good performance characteristics, but there are areas where we can optimize further. Would you like me to dive deeper into any specific aspect?",
             "optimize": "I've identified several optimization opportunities that could significantly improve performance. Key areas include database query optimization, caching strategies, and asynchronous processing. Shall I provide detailed recommendations for any of these areas?",
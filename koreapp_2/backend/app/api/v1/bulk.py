@@ -0,0 +1,91 @@
+from typing import Any, Dict, List, Sequence, Tuple, Type
+from uuid import UUID
+
+import orjson
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.core.config import settings
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+uuid_adapter = TypeAdapter(UUID)
+
+
+async def read_bulk_payload(request: Request) -> List[Any]:
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+            payload = [orjson.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            payload = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON payload: {e}")
+
+    if not isinstance(payload, list):
+        raise HTTPException(
+            status_code=400, detail="Bulk payload must be a JSON array or NDJSON"
+        )
+    if not payload:
+        raise HTTPException(status_code=400, detail="Bulk payload is empty")
+    if len(payload) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Bulk payload exceeds {settings.BULK_MAX_ITEMS} items",
+        )
+    return payload
+
+
+def _item_id(item: Any) -> Any:
+    try:
+        return uuid_adapter.validate_python(item.get("id"))
+    except (AttributeError, ValidationError):
+        return None
+
+
+def item_error(
+    index: int, errors: List[Dict[str, Any]], id: Any = None
+) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "id": id,
+        "errors": [
+            {"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]}
+            for error in errors
+        ],
+    }
+
+
+def not_found_error(index: int, id: UUID, loc: str = "id") -> Dict[str, Any]:
+    return item_error(
+        index,
+        [{"loc": (loc,), "msg": "Business object not found", "type": "not_found"}],
+        id,
+    )
+
+
+def null_errors(item: BaseModel, fields: Sequence[str]) -> List[Dict[str, Any]]:
+    return [
+        {"loc": (field,), "msg": "Field may not be null", "type": "null_not_allowed"}
+        for field in fields
+        if field in item.model_fields_set and getattr(item, field) is None
+    ]
+
+
+def validate_items(
+    payload: List[Any], schema: Type[BaseModel], non_nullable: Sequence[str] = ()
+) -> Tuple[List[Tuple[int, BaseModel]], List[Dict[str, Any]]]:
+    valid = []
+    errors = []
+    for index, item in enumerate(payload):
+        try:
+            obj_in = schema.model_validate(item)
+        except ValidationError as e:
+            errors.append(item_error(index, e.errors(), _item_id(item)))
+            continue
+        nulls = null_errors(obj_in, non_nullable)
+        if nulls:
+            errors.append(item_error(index, nulls, _item_id(item)))
+        else:
+            valid.append((index, obj_in))
+    return valid, errors
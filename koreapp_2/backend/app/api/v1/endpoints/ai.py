@@ -1,40 +1,120 @@
-from typing import Any, Dict
+import asyncio
+import json
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db, get_current_active_user
+from app.db.database import AsyncSessionLocal
+from app.models.business_object import BusinessObject as BusinessObjectModel
 from app.schemas.user import User
+from app.services.analysis_cache import analysis_cache_service
 from app.services.business_object import business_object_service
+from app.ai.jobs import ai_job_queue
 from app.ai.orchestrator import AIOrchestrator
 
 router = APIRouter()
 
 
+def _sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+def _sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_events(
+    source: AsyncIterator[Tuple[str, Dict[str, Any]]]
+) -> AsyncIterator[str]:
+    async with aclosing(source):
+        try:
+            async for event, data in source:
+                yield _sse_event(event, data)
+        except Exception as e:
+            yield _sse_event("error", {"detail": str(e)})
+            return
+    yield _sse_event("done", {})
+
+
+async def _get_object(object_id: UUID, tenant_id: str) -> BusinessObjectModel:
+    async with AsyncSessionLocal() as db:
+        obj = await business_object_service.get(
+            db=db, id=object_id, tenant_id=tenant_id
+        )
+    if not obj:
+        raise HTTPException(status_code=404, detail="Business object not found")
+    return obj
+
+
 @router.post("/analyze/{object_id}")
 async def analyze_object(
     *,
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     object_id: UUID,
 ) -> Any:
-    obj = await business_object_service.get(
-        db=db, id=object_id, tenant_id=current_user.tenant_id
-    )
-    if not obj:
-        raise HTTPException(status_code=404, detail="Business object not found")
+    obj = await _get_object(object_id, current_user.tenant_id)
     
-    orchestrator = AIOrchestrator()
-    analysis = await orchestrator.analyze_object(obj)
+    analysis, cached = await analysis_cache_service.get_or_analyze(
+        AsyncSessionLocal,
+        business_object=obj,
+        orchestrator=AIOrchestrator(),
+        tenant_id=current_user.tenant_id,
+        created_by=current_user.id,
+    )
     
     return {
         "object_id": object_id,
         "analysis": analysis,
+        "cached": cached,
         "status": "completed"
     }
 
 
+@router.post("/analyze/{object_id}/stream")
+async def analyze_object_stream(
+    *,
+    current_user: User = Depends(get_current_active_user),
+    object_id: UUID,
+) -> Any:
+    obj = await _get_object(object_id, current_user.tenant_id)
+
+    async with AsyncSessionLocal() as db:
+        cached = await analysis_cache_service.lookup(
+            db=db, business_object=obj, tenant_id=current_user.tenant_id
+        )
+
+    async def events() -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        if cached is not None:
+            yield "result", {"object_id": object_id, "analysis": cached, "cached": True}
+            return
+
+        async with aclosing(AIOrchestrator().analyze_object_stream(obj)) as stream:
+            async for event, data in stream:
+                if event == "result":
+                    async with AsyncSessionLocal() as session:
+                        await analysis_cache_service.store(
+                            db=session,
+                            business_object=obj,
+                            result=data,
+                            tenant_id=current_user.tenant_id,
+                            created_by=current_user.id,
+                        )
+                    data = {"object_id": object_id, "analysis": data, "cached": False}
+                yield event, data
+
+    return _sse_response(_stream_events(events()))
+
+
 @router.post("/chat")
 async def chat_with_ai(
     *,
@@ -54,18 +134,31 @@ async def chat_with_ai(
     }
 
 
+@router.post("/chat/stream")
+async def chat_with_ai_stream(
+    *,
+    current_user: User = Depends(get_current_active_user),
+    message: Dict[str, Any],
+) -> Any:
+    orchestrator = AIOrchestrator()
+    return _sse_response(
+        _stream_events(
+            orchestrator.chat_stream(
+                message=message.get("message", ""),
+                context=message.get("context", {}),
+                user_id=current_user.id,
+            )
+        )
+    )
+
+
 @router.post("/optimize/{object_id}")
 async def optimize_object(
     *,
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     object_id: UUID,
 ) -> Any:
-    obj = await business_object_service.get(
-        db=db, id=object_id, tenant_id=current_user.tenant_id
-    )
-    if not obj:
-        raise HTTPException(status_code=404, detail="Business object not found")
+    obj = await _get_object(object_id, current_user.tenant_id)
     
     orchestrator = AIOrchestrator()
     optimization = await orchestrator.optimize_object(obj)
@@ -75,3 +168,62 @@ async def optimize_object(
         "optimization": optimization,
         "status": "completed"
     }
+
+
+@router.post("/optimize/{object_id}/stream")
+async def optimize_object_stream(
+    *,
+    current_user: User = Depends(get_current_active_user),
+    object_id: UUID,
+) -> Any:
+    obj = await _get_object(object_id, current_user.tenant_id)
+
+    orchestrator = AIOrchestrator()
+    return _sse_response(_stream_events(orchestrator.optimize_object_stream(obj)))
+
+
+@router.post("/jobs/{kind}/{object_id}", status_code=202)
+async def submit_ai_job(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    kind: str,
+    object_id: UUID,
+) -> Any:
+    if kind not in ("analyze", "optimize"):
+        raise HTTPException(status_code=404, detail="Unknown job type")
+
+    obj = await business_object_service.get(
+        db=db, id=object_id, tenant_id=current_user.tenant_id
+    )
+    if not obj:
+        raise HTTPException(status_code=404, detail="Business object not found")
+
+    try:
+        job = await ai_job_queue.submit(
+            kind, obj.id, tenant_id=current_user.tenant_id, created_by=current_user.id
+        )
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="AI job queue is full")
+
+    return {"job_id": job.id, "status": job.status}
+
+
+@router.get("/jobs/{job_id}")
+async def get_ai_job(
+    *,
+    current_user: User = Depends(get_current_active_user),
+    job_id: UUID,
+    wait: float = Query(0, ge=0, le=30),
+) -> Any:
+    job = ai_job_queue.get(job_id, tenant_id=current_user.tenant_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if wait and not job.done.is_set():
+        try:
+            await asyncio.wait_for(job.done.wait(), wait)
+        except asyncio.TimeoutError:
+            pass
+
+    return job.to_dict()
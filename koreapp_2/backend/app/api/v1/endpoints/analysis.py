@@ -1,34 +1,145 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.bulk import not_found_error, read_bulk_payload, validate_items
 from app.core.deps import get_db, get_current_active_user
 from app.schemas.user import User
-from app.schemas.analysis import Analysis, AnalysisCreate
+from app.schemas.analysis import (
+    Analysis,
+    AnalysisBulkResult,
+    AnalysisCreate,
+    LatestAnalysesRequest,
+    ObjectAnalyses,
+)
 from app.services.analysis import analysis_service
 from app.services.business_object import business_object_service
 
 router = APIRouter()
 
 
+async def _latest_analyses(
+    db: AsyncSession,
+    current_user: User,
+    object_ids: List[UUID],
+    per_object: int,
+    analysis_type: Optional[str],
+    fast: bool,
+) -> Any:
+    try:
+        latest = await analysis_service.get_latest_for_objects(
+            db=db,
+            object_ids=object_ids,
+            tenant_id=current_user.tenant_id,
+            per_object=per_object,
+            analysis_type=analysis_type,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    items = [
+        {"business_object_id": object_id, "analyses": analyses}
+        for object_id, analyses in latest.items()
+    ]
+    if fast:
+        return ORJSONResponse(items)
+    return items
+
+
+@router.get("/latest", response_model=List[ObjectAnalyses])
+async def get_latest_analyses(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    object_ids: List[UUID] = Query(...),
+    per_object: int = Query(1, ge=1, le=20),
+    analysis_type: str = Query(None),
+    fast: bool = Query(False),
+) -> Any:
+    return await _latest_analyses(
+        db, current_user, object_ids, per_object, analysis_type, fast
+    )
+
+
+@router.post("/latest", response_model=List[ObjectAnalyses])
+async def query_latest_analyses(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    query: LatestAnalysesRequest,
+    fast: bool = Query(False),
+) -> Any:
+    return await _latest_analyses(
+        db,
+        current_user,
+        query.object_ids,
+        query.per_object,
+        query.analysis_type,
+        fast,
+    )
+
+
+@router.post("/bulk", response_model=AnalysisBulkResult)
+async def bulk_create_analyses(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    request: Request,
+) -> Any:
+    payload = await read_bulk_payload(request)
+    valid, errors = validate_items(payload, AnalysisCreate)
+
+    existing = set()
+    if valid:
+        existing = await business_object_service.get_active_ids(
+            db=db,
+            ids=list({item.business_object_id for _, item in valid}),
+            tenant_id=current_user.tenant_id,
+        )
+    errors.extend(
+        not_found_error(index, item.business_object_id, "business_object_id")
+        for index, item in valid
+        if item.business_object_id not in existing
+    )
+    errors.sort(key=lambda error: error["index"])
+
+    items = []
+    objs_in = [item for _, item in valid if item.business_object_id in existing]
+    if objs_in:
+        items = await analysis_service.bulk_create(
+            db=db,
+            objs_in=objs_in,
+            tenant_id=current_user.tenant_id,
+            created_by=current_user.id,
+        )
+    return {"items": items, "errors": errors}
+
+
 @router.get("/{object_id}", response_model=List[Analysis])
 async def get_object_analyses(
     *,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     object_id: UUID,
+    fast: bool = Query(False),
 ) -> Any:
     obj = await business_object_service.get(
-        db=db, id=object_id, tenant_id=current_user.tenant_id
+        db=db,
+        id=object_id,
+        tenant_id=current_user.tenant_id,
+        use_replica=True,
     )
     if not obj:
         raise HTTPException(status_code=404, detail="Business object not found")
     
     analyses = await analysis_service.get_by_object(
-        db=db, object_id=object_id, tenant_id=current_user.tenant_id
+        db=db, object_id=object_id, tenant_id=current_user.tenant_id, as_rows=fast
     )
+    if fast:
+        return ORJSONResponse(analyses)
     return analyses
 
 
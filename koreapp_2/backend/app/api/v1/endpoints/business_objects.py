@@ -1,22 +1,44 @@
-from typing import Any, List
+from typing import Any, Dict
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.bulk import (
+    item_error,
+    not_found_error,
+    read_bulk_payload,
+    uuid_adapter,
+    validate_items,
+)
 from app.core.deps import get_db, get_current_active_user
 from app.schemas.user import User
 from app.schemas.business_object import (
     BusinessObject,
+    BusinessObjectBulkDeleteResult,
+    BusinessObjectBulkResult,
+    BusinessObjectBulkUpdate,
     BusinessObjectCreate,
+    BusinessObjectExpanded,
     BusinessObjectUpdate,
     BusinessObjectList,
 )
-from app.services.business_object import business_object_service
+from app.services.business_object import (
+    PAGE_OFFSET,
+    business_object_service,
+    expand,
+    parse_include,
+)
 
 router = APIRouter()
 
 
+def _expanded_response(model: BaseModel) -> ORJSONResponse:
+    return ORJSONResponse(model.model_dump(mode="json", exclude_unset=True))
+
+
 @router.get("/", response_model=BusinessObjectList)
 async def read_business_objects(
     *,
@@ -24,19 +46,49 @@ async def read_business_objects(
     current_user: User = Depends(get_current_active_user),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    search: str = Query(None),
+    paginate: str = Query(
+        PAGE_OFFSET,
+        description=(
+            "offset: skip/limit pages with total and page counts. "
+            "cursor: keyset pages; pass next_cursor back as cursor to continue."
+        ),
+    ),
+    cursor: str = Query(None, description="next_cursor of the previous page (paginate=cursor)"),
+    include_total: bool = Query(True),
+    search: str = Query(
+        None,
+        description=(
+            "Prefix full-text and typo-tolerant name search, ordered by relevance. "
+            "Only supported with paginate=offset."
+        ),
+    ),
     type_filter: str = Query(None),
     status_filter: str = Query(None),
+    fast: bool = Query(False),
+    include: str = Query(None),
 ) -> Any:
-    objects = await business_object_service.get_multi(
-        db=db,
-        tenant_id=current_user.tenant_id,
-        skip=skip,
-        limit=limit,
-        search=search,
-        type_filter=type_filter,
-        status_filter=status_filter,
-    )
+    try:
+        include = parse_include(include)
+        objects = await business_object_service.get_multi(
+            db=db,
+            tenant_id=current_user.tenant_id,
+            skip=skip,
+            limit=limit,
+            paginate=paginate,
+            cursor=cursor,
+            include_total=include_total,
+            search=search,
+            type_filter=type_filter,
+            status_filter=status_filter,
+            as_rows=fast,
+            include=include,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if fast:
+        return ORJSONResponse(objects)
+    if include:
+        return _expanded_response(objects)
     return objects
 
 
@@ -53,18 +105,127 @@ async def create_business_object(
     return obj
 
 
+@router.post("/bulk", response_model=BusinessObjectBulkResult)
+async def bulk_create_business_objects(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    request: Request,
+) -> Any:
+    payload = await read_bulk_payload(request)
+    valid, errors = validate_items(payload, BusinessObjectCreate)
+    items = []
+    if valid:
+        items = await business_object_service.bulk_create(
+            db=db,
+            objs_in=[obj_in for _, obj_in in valid],
+            tenant_id=current_user.tenant_id,
+            created_by=current_user.id,
+        )
+    return {"items": items, "errors": errors}
+
+
+@router.patch("/bulk", response_model=BusinessObjectBulkResult)
+async def bulk_update_business_objects(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    request: Request,
+) -> Any:
+    payload = await read_bulk_payload(request)
+    valid, errors = validate_items(
+        payload, BusinessObjectBulkUpdate, non_nullable=("name", "type")
+    )
+
+    positions: Dict[UUID, int] = {}
+    updates = []
+    for index, item in valid:
+        if item.id in positions:
+            errors.append(
+                item_error(
+                    index,
+                    [{"loc": ("id",), "msg": "Duplicate id in batch", "type": "duplicate"}],
+                    item.id,
+                )
+            )
+            continue
+        positions[item.id] = index
+        updates.append(
+            (item.id, BusinessObjectUpdate(**item.model_dump(exclude={"id"}, exclude_unset=True)))
+        )
+
+    items = []
+    if updates:
+        items = await business_object_service.bulk_update(
+            db=db, items=updates, tenant_id=current_user.tenant_id
+        )
+    updated = {item["id"] for item in items}
+    errors.extend(
+        not_found_error(index, id) for id, index in positions.items() if id not in updated
+    )
+    errors.sort(key=lambda error: error["index"])
+    return {"items": items, "errors": errors}
+
+
+@router.post("/bulk/delete", response_model=BusinessObjectBulkDeleteResult)
+async def bulk_delete_business_objects(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    request: Request,
+) -> Any:
+    payload = await read_bulk_payload(request)
+
+    positions: Dict[UUID, int] = {}
+    errors = []
+    for index, item in enumerate(payload):
+        value = item.get("id") if isinstance(item, dict) else item
+        try:
+            id = uuid_adapter.validate_python(value)
+        except ValidationError as e:
+            errors.append(item_error(index, e.errors()))
+            continue
+        positions.setdefault(id, index)
+
+    deleted = []
+    if positions:
+        deleted = await business_object_service.bulk_remove(
+            db=db, ids=list(positions), tenant_id=current_user.tenant_id
+        )
+    removed = set(deleted)
+    errors.extend(
+        not_found_error(index, id) for id, index in positions.items() if id not in removed
+    )
+    errors.sort(key=lambda error: error["index"])
+    return {"deleted": deleted, "errors": errors}
+
+
 @router.get("/{id}", response_model=BusinessObject)
 async def read_business_object(
     *,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     id: UUID,
+    include: str = Query(None),
 ) -> Any:
+    try:
+        include = parse_include(include)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     obj = await business_object_service.get(
-        db=db, id=id, tenant_id=current_user.tenant_id
+        db=db,
+        id=id,
+        tenant_id=current_user.tenant_id,
+        include=include,
+        use_replica=True,
     )
     if not obj:
         raise HTTPException(status_code=404, detail="Business object not found")
+    if include:
+        return _expanded_response(
+            BusinessObjectExpanded.model_validate(expand(obj, include))
+        )
     return obj
 
 
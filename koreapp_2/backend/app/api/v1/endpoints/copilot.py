@@ -0,0 +1,98 @@
+import re
+from typing import Any, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.copilot_integration import SerializedDocument, copilot_integration_service
+from app.core.config import settings
+from app.core.deps import get_current_active_user, get_db
+from app.schemas.user import User
+from app.services.microsoft_graph import microsoft_graph_service
+
+router = APIRouter()
+
+PUBLIC_CACHE_CONTROL = "public, max-age=3600"
+PRIVATE_CACHE_CONTROL = "private, max-age=3600"
+
+ENTITY_TAG = re.compile(r'\*|(?:W/)?"[^"]*"')
+
+
+def _opaque_tags(if_none_match: str) -> List[str]:
+    return [tag.removeprefix("W/") for tag in ENTITY_TAG.findall(if_none_match)]
+
+
+def _document_response(
+    request: Request,
+    document: SerializedDocument,
+    cache_control: str = PUBLIC_CACHE_CONTROL,
+) -> Response:
+    headers = {"ETag": document.etag, "Cache-Control": cache_control}
+    if cache_control == PRIVATE_CACHE_CONTROL:
+        headers["Vary"] = "Authorization"
+    tags = _opaque_tags(request.headers.get("if-none-match", ""))
+    if "*" in tags or document.etag.removeprefix("W/") in tags:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=document.body, media_type="application/json", headers=headers
+    )
+
+
+@router.get("/openapi.json")
+async def get_openapi_spec(request: Request) -> Response:
+    document = copilot_integration_service.openapi_document(
+        str(request.base_url).rstrip("/")
+    )
+    return _document_response(request, document)
+
+
+@router.get("/connections/{connection_id}/schema")
+async def get_connection_schema(
+    *,
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+    connection_id: str,
+) -> Response:
+    try:
+        copilot_integration_service.validate_connection(
+            current_user.tenant_id, connection_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    document = copilot_integration_service.connection_schema_document(connection_id)
+    return _document_response(request, document, PRIVATE_CACHE_CONTROL)
+
+
+@router.post("/connections/{connection_id}/sync")
+async def sync_business_objects(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    connection_id: str,
+    full: bool = Query(False),
+) -> Any:
+    if settings.COPILOT_SYNC_ROLE not in current_user.roles:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    try:
+        copilot_integration_service.validate_connection(
+            current_user.tenant_id, connection_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    try:
+        access_token = await microsoft_graph_service.get_app_access_token()
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    stats = await copilot_integration_service.sync_tenant(
+        db=db,
+        tenant_id=current_user.tenant_id,
+        connection_id=connection_id,
+        base_url=str(request.base_url).rstrip("/"),
+        access_token=access_token,
+        full=full,
+    )
+    return {"connection_id": connection_id, **stats}
@@ -1,10 +1,21 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_db
+from app.ai.jobs import ai_job_queue
+from app.core.deps import get_current_admin_user, get_db, user_cache
+from app.core.jwks import jwks_key_cache
+from app.core.security import token_claims_cache
+from app.db.database import replica_set
+from app.db.pool import pool_monitors
+from app.services.analysis_cache import analysis_cache_service
+from app.services.impact import impact_service
+from app.services.microsoft_graph import microsoft_graph_service
+from app.services.relationship import relationship_service
 
 router = APIRouter()
 
+admin_only = [Depends(get_current_admin_user)]
+
 
 @router.get("/live")
 async def health_live():
@@ -18,3 +29,32 @@ async def health_ready(db: AsyncSession = Depends(get_db)):
         return {"status": "ready", "database": "connected"}
     except Exception as e:
         return {"status": "not ready", "database": "disconnected", "error": str(e)}
+
+
+@router.get("/caches", dependencies=admin_only)
+async def cache_stats():
+    return {
+        "analysis": analysis_cache_service.stats(),
+        "graph_tokens": microsoft_graph_service.token_cache.stats(),
+        "graph_app_tokens": microsoft_graph_service.app_token_cache.stats(),
+        "jwks": jwks_key_cache.stats(),
+        "token_claims": token_claims_cache.stats(),
+        "users": user_cache.stats(),
+        "relationship_graph": relationship_service.stats(),
+        "impact_index": impact_service.stats(),
+    }
+
+
+@router.get("/jobs", dependencies=admin_only)
+async def job_stats():
+    return ai_job_queue.stats()
+
+
+@router.get("/replicas", dependencies=admin_only)
+async def replica_stats():
+    return replica_set.stats()
+
+
+@router.get("/pools", dependencies=admin_only)
+async def pool_stats():
+    return {monitor.name: monitor.stats() for monitor in pool_monitors}
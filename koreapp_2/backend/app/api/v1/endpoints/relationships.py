@@ -0,0 +1,139 @@
+from typing import Any, List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_current_active_user, get_db
+from app.models.relationship import RelationshipType
+from app.schemas.relationship import (
+    ImpactAnalysis,
+    Relationship,
+    RelationshipCreate,
+    RelationshipGraph,
+)
+from app.schemas.user import User
+from app.services.business_object import business_object_service
+from app.services.impact import impact_service
+from app.services.relationship import DOWNSTREAM, relationship_service
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[Relationship])
+async def read_relationships(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    object_id: UUID,
+) -> Any:
+    relationships = await relationship_service.get_by_object(
+        db=db, object_id=object_id, tenant_id=current_user.tenant_id
+    )
+    return relationships
+
+
+@router.post("/", response_model=Relationship)
+async def create_relationship(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    obj_in: RelationshipCreate,
+) -> Any:
+    for object_id in (obj_in.source_id, obj_in.target_id):
+        obj = await business_object_service.get(
+            db=db, id=object_id, tenant_id=current_user.tenant_id
+        )
+        if not obj:
+            raise HTTPException(status_code=404, detail="Business object not found")
+
+    try:
+        relationship = await relationship_service.create(
+            db=db,
+            obj_in=obj_in,
+            tenant_id=current_user.tenant_id,
+            created_by=current_user.id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return relationship
+
+
+@router.delete("/{id}")
+async def delete_relationship(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    id: UUID,
+) -> Any:
+    relationship = await relationship_service.get(
+        db=db, id=id, tenant_id=current_user.tenant_id
+    )
+    if not relationship:
+        raise HTTPException(status_code=404, detail="Relationship not found")
+
+    await relationship_service.remove(db=db, db_obj=relationship)
+    return {"message": "Relationship deleted successfully"}
+
+
+@router.get("/graph/{object_id}", response_model=RelationshipGraph)
+async def read_relationship_graph(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    object_id: UUID,
+    direction: str = Query(DOWNSTREAM),
+    max_depth: int = Query(3, ge=1),
+    types: List[RelationshipType] = Query(None),
+) -> Any:
+    obj = await business_object_service.get(
+        db=db,
+        id=object_id,
+        tenant_id=current_user.tenant_id,
+        use_replica=True,
+    )
+    if not obj:
+        raise HTTPException(status_code=404, detail="Business object not found")
+
+    try:
+        graph = await relationship_service.get_graph(
+            db=db,
+            object_id=object_id,
+            tenant_id=current_user.tenant_id,
+            direction=direction,
+            max_depth=max_depth,
+            types=types,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return graph
+
+
+@router.get("/impact/{object_id}", response_model=ImpactAnalysis)
+async def read_impact(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    object_id: UUID,
+    max_depth: int = Query(None, ge=1),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+) -> Any:
+    obj = await business_object_service.get(
+        db=db,
+        id=object_id,
+        tenant_id=current_user.tenant_id,
+        use_replica=True,
+    )
+    if not obj:
+        raise HTTPException(status_code=404, detail="Business object not found")
+
+    impact = await impact_service.get_impact(
+        db=db,
+        object_id=object_id,
+        tenant_id=current_user.tenant_id,
+        max_depth=max_depth,
+        skip=skip,
+        limit=limit,
+    )
+    return impact
@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings
 
@@ -12,6 +12,28 @@ class Settings(BaseSettings):
     POOL_MAX_OVERFLOW: int = 20
     POOL_TIMEOUT: int = 30
     POOL_RECYCLE: int = 1800
+    DATABASE_PREPARED_STATEMENTS: bool = True
+    DATABASE_PREPARE_THRESHOLD: int = 5
+    POOL_ADAPTIVE_SIZING: bool = False
+    POOL_ADAPTIVE_WINDOW: int = 60
+    POOL_SLOW_CHECKOUT_MS: float = 100.0
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_HEALTH_CHECK_INTERVAL: int = 10
+    REPLICA_HEALTH_CHECK_TIMEOUT: float = 2.0
+    REPLICA_MAX_LAG: float = 30.0
+
+    OBJECT_COUNT_CACHE_SIZE: int = 1024
+    OBJECT_COUNT_CACHE_TTL: int = 30
+    BULK_MAX_ITEMS: int = 10000
+    BULK_CHUNK_SIZE: int = 1000
+    RELATIONSHIP_GRAPH_MAX_DEPTH: int = 10
+    RELATIONSHIP_GRAPH_CACHE_TENANTS: int = 256
+    RELATIONSHIP_GRAPH_CACHE_MAX_EDGES: int = 200000
+    RELATIONSHIP_GRAPH_CACHE_TTL: int = 300
+    IMPACT_INDEX_TENANTS: int = 16
+    IMPACT_INDEX_TTL: int = 900
+    IMPACT_INDEX_MAX_ENTRIES: int = 2000000
+    IMPACT_INDEX_PRECOMPUTE_LIMIT: int = 500
     
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
     ALLOWED_HOSTS: List[str] = ["localhost", "127.0.0.1"]
@@ -29,14 +51,46 @@ class Settings(BaseSettings):
     AZURE_CLIENT_ID: Optional[str] = None
     AZURE_CLIENT_SECRET: Optional[str] = None
     MICROSOFT_GRAPH_SCOPE: str = "https://graph.microsoft.com/.default"
+    MICROSOFT_GRAPH_BASE_URL: str = "https://graph.microsoft.com/v1.0"
+    GRAPH_HTTP2: bool = True
+    GRAPH_HTTP_TIMEOUT: float = 30.0
+    GRAPH_CONNECT_TIMEOUT: float = 5.0
+    GRAPH_MAX_CONNECTIONS: int = 100
+    GRAPH_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    GRAPH_KEEPALIVE_EXPIRY: float = 30.0
+    GRAPH_MAX_RETRIES: int = 3
+    GRAPH_RETRY_BACKOFF: float = 0.5
+    GRAPH_RETRY_MAX_DELAY: float = 30.0
+    GRAPH_BATCH_CONCURRENCY: int = 4
+    GRAPH_TOKEN_CACHE_SIZE: int = 10000
+    GRAPH_TOKEN_REFRESH_MARGIN: int = 300
+    COPILOT_INDEX_CHUNK_SIZE: int = 500
+    COPILOT_INDEX_CONCURRENCY: int = 8
+    COPILOT_SYNC_WATERMARK_MARGIN: int = 300
+    COPILOT_DOCUMENT_CACHE_SIZE: int = 256
+    COPILOT_SYNC_ROLE: str = "admin"
+    ADMIN_ROLE: str = "admin"
+    COPILOT_CONNECTIONS: Dict[str, str] = {}
     
     JWT_ALGORITHM: str = "RS256"
     JWT_AUDIENCE: Optional[str] = None
     JWT_ISSUER: Optional[str] = None
+    AZURE_JWKS_URL: Optional[str] = None
+    JWKS_CACHE_TTL: int = 3600
+    JWKS_REFETCH_INTERVAL: int = 60
+    TOKEN_CLAIMS_CACHE_SIZE: int = 10000
+    USER_CACHE_SIZE: int = 10000
     
     OPENAI_API_KEY: Optional[str] = None
     LANGCHAIN_TRACING_V2: bool = False
     LANGCHAIN_API_KEY: Optional[str] = None
+    AI_AGENT_TIMEOUT: float = 60.0
+    ANALYSIS_CACHE_SIZE: int = 2048
+    ANALYSIS_BATCH_MAX_OBJECTS: int = 500
+    AI_JOB_WORKERS: int = 4
+    AI_JOB_TENANT_CONCURRENCY: int = 2
+    AI_JOB_QUEUE_SIZE: int = 1000
+    AI_JOB_RETENTION: int = 10000
     
     OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None
     LOG_LEVEL: str = "INFO"
@@ -1,15 +1,20 @@
+import time
 from typing import Generator, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import verify_azure_token
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.security import token_digest, verify_azure_token
 from app.db.database import AsyncSessionLocal
 from app.schemas.user import User
 
 security = HTTPBearer()
 
+user_cache = LRUCache(maxsize=settings.USER_CACHE_SIZE)
+
 
 async def get_db() -> Generator[AsyncSession, None, None]:
     async with AsyncSessionLocal() as session:
@@ -19,8 +24,13 @@ async def get_db() -> Generator[AsyncSession, None, None]:
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> User:
+    digest = token_digest(credentials.credentials)
+    user = user_cache.get(digest)
+    if user is not None:
+        return user.model_copy(deep=True)
+
     try:
-        payload = verify_azure_token(credentials.credentials)
+        payload = await verify_azure_token(credentials.credentials)
         user_id = payload.get("oid")
         tenant_id = payload.get("tid")
         email = payload.get("preferred_username") or payload.get("email")
@@ -33,7 +43,7 @@ async def get_current_user(
                 detail="Could not validate credentials"
             )
             
-        return User(
+        user = User(
             id=user_id,
             tenant_id=tenant_id,
             email=email,
@@ -48,6 +58,11 @@ async def get_current_user(
             detail="Could not validate credentials"
         )
 
+    user_cache.set(
+        digest, user, expires_at=time.monotonic() + payload["exp"] - time.time()
+    )
+    return user.model_copy(deep=True)
+
 
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
@@ -55,3 +70,11 @@ async def get_current_active_user(
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def get_current_admin_user(
+    current_user: User = Depends(get_current_active_user),
+) -> User:
+    if settings.ADMIN_ROLE not in current_user.roles:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return current_user
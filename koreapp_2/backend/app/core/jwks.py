@@ -0,0 +1,158 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import jwt
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def default_jwks_url() -> str:
+    tenant = settings.AZURE_TENANT_ID or "common"
+    return f"https://login.microsoftonline.com/{tenant}/discovery/v2.0/keys"
+
+
+class JWKSKeyCache:
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float,
+        refetch_interval: float,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.refetch_interval = refetch_interval
+        self._transport = transport
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self._last_attempt: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.fetches = 0
+        self.fetch_errors = 0
+        self.unknown_kid_refetches = 0
+        self.rate_limited = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop(), name="jwks-refresh")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        if self._expired() and not self._throttled():
+            await self._refresh_or_keep()
+        if not self._keys:
+            self.rate_limited += 1
+            raise jwt.InvalidTokenError("Signing keys unavailable")
+
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        if self._throttled():
+            self.rate_limited += 1
+            raise jwt.InvalidTokenError("Unknown signing key")
+
+        self.unknown_kid_refetches += 1
+        await self._refresh_or_keep()
+        key = self._keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError("Unknown signing key")
+        return key
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            await self._fetch()
+
+    def _expired(self) -> bool:
+        return (
+            self._fetched_at is None or time.monotonic() - self._fetched_at > self.ttl
+        )
+
+    def _throttled(self) -> bool:
+        return (
+            self._last_attempt is not None
+            and time.monotonic() - self._last_attempt < self.refetch_interval
+        )
+
+    async def _refresh_or_keep(self) -> None:
+        seen_attempt = self._last_attempt
+        async with self._lock:
+            if self._last_attempt != seen_attempt:
+                return
+            try:
+                await self._fetch()
+            except Exception:
+                if not self._keys:
+                    raise jwt.InvalidTokenError("Signing keys unavailable")
+                logger.warning("JWKS refresh failed, keeping cached signing keys")
+
+    async def _fetch(self) -> None:
+        self._last_attempt = time.monotonic()
+        self.fetches += 1
+        try:
+            async with httpx.AsyncClient(
+                transport=self._transport, timeout=settings.GRAPH_HTTP_TIMEOUT
+            ) as client:
+                response = await client.get(self.jwks_url)
+                response.raise_for_status()
+                document = response.json()
+        except Exception:
+            self.fetch_errors += 1
+            raise
+
+        keys = {}
+        for jwk in document.get("keys", []):
+            kid = jwk.get("kid")
+            if not kid or jwk.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[kid] = jwt.PyJWK(jwk, algorithm=settings.JWT_ALGORITHM)
+            except jwt.PyJWTError:
+                logger.warning(f"Skipping unusable JWKS key {kid}")
+
+        if not keys:
+            self.fetch_errors += 1
+            raise ValueError("JWKS document contains no signing keys")
+
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Background JWKS refresh failed")
+            await asyncio.sleep(self.ttl / 2)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self._keys),
+            "age_seconds": (
+                round(time.monotonic() - self._fetched_at, 1)
+                if self._fetched_at is not None
+                else None
+            ),
+            "fetches": self.fetches,
+            "fetch_errors": self.fetch_errors,
+            "unknown_kid_refetches": self.unknown_kid_refetches,
+            "rate_limited": self.rate_limited,
+        }
+
+
+jwks_key_cache = JWKSKeyCache(
+    jwks_url=settings.AZURE_JWKS_URL or default_jwks_url(),
+    ttl=settings.JWKS_CACHE_TTL,
+    refetch_interval=settings.JWKS_REFETCH_INTERVAL,
+)
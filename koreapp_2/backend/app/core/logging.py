@@ -3,8 +3,11 @@ import sys
 from typing import Any, Dict
 
 import structlog
-from opentelemetry import trace
+from opentelemetry import metrics, trace
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
@@ -48,6 +51,14 @@ def setup_logging() -> None:
         span_processor = BatchSpanProcessor(otlp_exporter)
         trace.get_tracer_provider().add_span_processor(span_processor)
 
+        metric_reader = PeriodicExportingMetricReader(
+            OTLPMetricExporter(
+                endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT,
+                insecure=True,
+            )
+        )
+        metrics.set_meter_provider(MeterProvider(metric_readers=[metric_reader]))
+
 
 def get_logger(name: str) -> Any:
     return structlog.get_logger(name)
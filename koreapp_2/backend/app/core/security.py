@@ -1,3 +1,5 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Union
 
@@ -5,10 +7,14 @@ import jwt
 from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.cache import LRUCache
 from app.core.config import settings
+from app.core.jwks import jwks_key_cache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+token_claims_cache = LRUCache(maxsize=settings.TOKEN_CLAIMS_CACHE_SIZE)
+
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
@@ -32,35 +38,50 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_azure_token(token: str) -> Dict[str, Any]:
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def verify_azure_token(token: str) -> Dict[str, Any]:
+    digest = token_digest(token)
+    payload = token_claims_cache.get(digest)
+    if payload is not None:
+        return payload
+
     try:
+        header = jwt.get_unverified_header(token)
+        signing_key = await jwks_key_cache.get_signing_key(header.get("kid"))
         payload = jwt.decode(
-            token, 
-            options={"verify_signature": False},
-            algorithms=["RS256"]
+            token,
+            signing_key.key,
+            algorithms=[settings.JWT_ALGORITHM],
+            audience=settings.JWT_AUDIENCE,
+            issuer=settings.JWT_ISSUER,
+            options={"verify_aud": bool(settings.JWT_AUDIENCE), "require": ["exp"]},
         )
-        
-        if settings.JWT_ISSUER and payload.get("iss") != settings.JWT_ISSUER:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token issuer"
-            )
-            
-        if settings.JWT_AUDIENCE and settings.JWT_AUDIENCE not in payload.get("aud", []):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token audience"
-            )
-            
-        return payload
-        
+
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired"
         )
-    except jwt.JWTError:
+    except jwt.InvalidIssuerError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token issuer"
+        )
+    except jwt.InvalidAudienceError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token audience"
+        )
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
         )
+
+    token_claims_cache.set(
+        digest, payload, expires_at=time.monotonic() + payload["exp"] - time.time()
+    )
+    return payload
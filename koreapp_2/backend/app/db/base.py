@@ -1,8 +1,7 @@
-from sqlalchemy.ext.declarative import declarative_base
-
-Base = declarative_base()
+from app.db.base_class import Base
 
 from app.models.business_object import BusinessObject
 from app.models.system import System
 from app.models.relationship import Relationship
 from app.models.analysis import Analysis
+from app.models.copilot_sync import CopilotSyncState, CopilotIndexedItem
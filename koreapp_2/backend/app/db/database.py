@@ -1,19 +1,53 @@
+from typing import Any, Dict
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, instrument_engine
+from app.db.routing import ReplicaSet, RoutingSession
+
+
+def connect_args(url: str) -> Dict[str, Any]:
+    if make_url(url).drivername != "postgresql+psycopg":
+        return {}
+    if not settings.DATABASE_PREPARED_STATEMENTS:
+        return {"prepare_threshold": None}
+    return {"prepare_threshold": settings.DATABASE_PREPARE_THRESHOLD}
+
+
+def create_engine(url: str, name: str):
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.POOL_SIZE,
+        max_overflow=settings.POOL_MAX_OVERFLOW,
+        pool_timeout=settings.POOL_TIMEOUT,
+        pool_recycle=settings.POOL_RECYCLE,
+        connect_args=connect_args(url),
+        echo=False,
+    )
+    instrument_engine(engine, name)
+    return engine
+
+
+engine = create_engine(settings.DATABASE_URL, "primary")
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    pool_size=settings.POOL_SIZE,
-    max_overflow=settings.POOL_MAX_OVERFLOW,
-    pool_timeout=settings.POOL_TIMEOUT,
-    pool_recycle=settings.POOL_RECYCLE,
-    echo=False,
+replica_set = ReplicaSet(
+    [
+        create_engine(url, f"replica-{index}")
+        for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+    ],
+    check_interval=settings.REPLICA_HEALTH_CHECK_INTERVAL,
+    check_timeout=settings.REPLICA_HEALTH_CHECK_TIMEOUT,
+    max_lag=settings.REPLICA_MAX_LAG,
 )
 
 AsyncSessionLocal = sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=replica_set,
     expire_on_commit=False,
 )
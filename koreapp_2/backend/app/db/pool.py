@@ -0,0 +1,258 @@
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+meter = metrics.get_meter(__name__)
+
+ADAPTIVE_HEADROOM = 1.25
+
+checkout_wait = meter.create_histogram(
+    "db.client.connections.wait_time",
+    unit="ms",
+    description="Time spent waiting for a connection from the pool",
+)
+connection_use = meter.create_histogram(
+    "db.client.connections.use_time",
+    unit="ms",
+    description="Time a connection was checked out before being returned",
+)
+connection_lifetime = meter.create_histogram(
+    "db.client.connections.lifetime",
+    unit="s",
+    description="Time between opening and closing a pooled connection",
+)
+checkout_timeouts = meter.create_counter(
+    "db.client.connections.timeouts",
+    description="Checkouts that gave up after POOL_TIMEOUT",
+)
+
+
+class PoolMonitor:
+    def __init__(
+        self,
+        name: str,
+        pool_size: int,
+        max_overflow: int,
+        adaptive: bool = False,
+        window: float = 60.0,
+        slow_checkout_ms: float = 100.0,
+    ):
+        self.name = name
+        self.attributes = {"pool.name": name}
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.adaptive = adaptive
+        self.window = window
+        self.slow_checkout_ms = slow_checkout_ms
+        self.pool: Optional["InstrumentedAsyncAdaptedQueuePool"] = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_wait_ms = 0.0
+        self.peak_in_use = 0
+        self.suggestion: Optional[Dict[str, Any]] = None
+        self._reset_window(time.monotonic())
+
+    def _reset_window(self, now: float) -> None:
+        self._window_started = now
+        self._window_peak = self.in_use()
+        self._window_slow = 0
+        self._window_timeouts = 0
+
+    def in_use(self) -> int:
+        return self.pool.checkedout() if self.pool is not None else 0
+
+    def overflow(self) -> int:
+        return max(self.pool.overflow(), 0) if self.pool is not None else 0
+
+    def idle(self) -> int:
+        return self.pool.checkedin() if self.pool is not None else 0
+
+    def record_checkout(self, wait_ms: float) -> None:
+        self.checkouts += 1
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        checkout_wait.record(wait_ms, self.attributes)
+
+        in_use = self.in_use()
+        self.peak_in_use = max(self.peak_in_use, in_use)
+        if self.adaptive:
+            self._window_peak = max(self._window_peak, in_use)
+            if wait_ms >= self.slow_checkout_ms:
+                self._window_slow += 1
+            self._maybe_evaluate()
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+        checkout_timeouts.add(1, self.attributes)
+        if self.adaptive:
+            self._window_timeouts += 1
+            self._maybe_evaluate()
+
+    def _maybe_evaluate(self) -> None:
+        now = time.monotonic()
+        if now - self._window_started >= self.window:
+            self.evaluate()
+            self._reset_window(now)
+
+    def evaluate(self) -> Optional[Dict[str, Any]]:
+        peak = self._window_peak
+        suggested = max(1, math.ceil(peak * ADAPTIVE_HEADROOM))
+        capacity = self.pool_size + self.max_overflow
+
+        if self._window_timeouts or peak >= capacity:
+            reason = "pool exhausted"
+            suggested = max(suggested, self.pool_size + 1)
+            overflow = max(self.max_overflow, suggested - self.pool_size)
+        elif peak > self.pool_size or self._window_slow:
+            reason = "overflow connections in regular use"
+            suggested = max(suggested, self.pool_size + 1)
+            overflow = self.max_overflow
+        elif suggested < self.pool_size:
+            reason = "pool larger than observed concurrency"
+            overflow = self.max_overflow
+        else:
+            self.suggestion = None
+            return None
+
+        self.suggestion = {
+            "reason": reason,
+            "window_seconds": self.window,
+            "peak_in_use": peak,
+            "slow_checkouts": self._window_slow,
+            "timeouts": self._window_timeouts,
+            "pool_size": suggested,
+            "max_overflow": overflow,
+        }
+        logger.info(
+            f"Pool {self.name} sizing suggestion: POOL_SIZE={suggested} "
+            f"POOL_MAX_OVERFLOW={overflow} ({reason}; peak {peak} in use, "
+            f"configured {self.pool_size}+{self.max_overflow})"
+        )
+        return self.suggestion
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "in_use": self.in_use(),
+            "idle": self.idle(),
+            "overflow": self.overflow(),
+            "peak_in_use": self.peak_in_use,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+            "adaptive": self.adaptive,
+            "suggestion": self.suggestion,
+        }
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    monitor: Optional[PoolMonitor] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            if self.monitor is not None:
+                self.monitor.record_timeout()
+            raise
+        if self.monitor is not None:
+            self.monitor.record_checkout((time.perf_counter() - started) * 1000)
+        return record
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        if self.monitor is not None:
+            self.monitor.pool = pool
+        return pool
+
+
+pool_monitors: List[PoolMonitor] = []
+
+
+def instrument_engine(
+    engine: AsyncEngine,
+    name: str,
+    *,
+    pool_size: int = settings.POOL_SIZE,
+    max_overflow: int = settings.POOL_MAX_OVERFLOW,
+    adaptive: bool = settings.POOL_ADAPTIVE_SIZING,
+    window: float = settings.POOL_ADAPTIVE_WINDOW,
+) -> PoolMonitor:
+    monitor = PoolMonitor(
+        name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        adaptive=adaptive,
+        window=window,
+        slow_checkout_ms=settings.POOL_SLOW_CHECKOUT_MS,
+    )
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        pool.monitor = monitor
+        monitor.pool = pool
+
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record) -> None:
+        connection_record.info["connected_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            connection_use.record(
+                (time.perf_counter() - checked_out_at) * 1000, monitor.attributes
+            )
+
+    @event.listens_for(sync_engine, "close")
+    def on_close(dbapi_connection, connection_record) -> None:
+        connected_at = connection_record.info.pop("connected_at", None)
+        if connected_at is not None:
+            connection_lifetime.record(
+                time.monotonic() - connected_at, monitor.attributes
+            )
+
+    pool_monitors.append(monitor)
+    return monitor
+
+
+def observe_usage(options: CallbackOptions) -> Iterable[Observation]:
+    for monitor in pool_monitors:
+        yield Observation(monitor.in_use(), {**monitor.attributes, "state": "used"})
+        yield Observation(monitor.idle(), {**monitor.attributes, "state": "idle"})
+
+
+def observe_overflow(options: CallbackOptions) -> Iterable[Observation]:
+    for monitor in pool_monitors:
+        yield Observation(monitor.overflow(), monitor.attributes)
+
+
+meter.create_observable_gauge(
+    "db.client.connections.usage",
+    callbacks=[observe_usage],
+    description="Pooled connections by state",
+)
+meter.create_observable_gauge(
+    "db.client.connections.overflow",
+    callbacks=[observe_overflow],
+    description="Connections opened beyond POOL_SIZE",
+)
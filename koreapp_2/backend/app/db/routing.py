@@ -0,0 +1,165 @@
+import asyncio
+from itertools import count
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+USE_REPLICA = "use_replica"
+
+REPLICATION_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """)
+
+
+def replica_name(engine: AsyncEngine) -> str:
+    return engine.url.render_as_string(hide_password=True)
+
+
+class ReplicaSet:
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        check_interval: float,
+        check_timeout: float,
+        max_lag: float,
+    ):
+        self.engines = list(engines)
+        self.healthy: List[AsyncEngine] = list(engines)
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.max_lag = max_lag
+        self._next = count()
+        self._task: Optional[asyncio.Task] = None
+        self.routed_reads = 0
+        self.ejections = 0
+        self.lag: Dict[str, Optional[float]] = {}
+        for engine in self.engines:
+            event.listen(engine.sync_engine, "handle_error", self._on_error(engine))
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> Optional[AsyncEngine]:
+        healthy = self.healthy
+        if not healthy:
+            return None
+        return healthy[next(self._next) % len(healthy)]
+
+    def eject(self, engine: AsyncEngine, reason: str) -> None:
+        if engine in self.healthy:
+            self.healthy = [
+                healthy for healthy in self.healthy if healthy is not engine
+            ]
+            self.ejections += 1
+            logger.warning(f"Ejecting read replica {replica_name(engine)}: {reason}")
+
+    def _on_error(self, engine: AsyncEngine):
+        def handle_error(context) -> None:
+            if context.is_disconnect:
+                self.eject(engine, "connection lost")
+
+        return handle_error
+
+    async def check(self) -> None:
+        results = await asyncio.gather(
+            *(self._probe(engine) for engine in self.engines)
+        )
+        healthy = []
+        for engine, (lag, error) in zip(self.engines, results):
+            self.lag[replica_name(engine)] = lag
+            if error is None:
+                healthy.append(engine)
+                if engine not in self.healthy:
+                    logger.info(f"Read replica {replica_name(engine)} is healthy again")
+            else:
+                self.eject(engine, error)
+        self.healthy = healthy
+
+    async def _probe(self, engine: AsyncEngine):
+        try:
+            lag = await asyncio.wait_for(
+                self._replication_lag(engine), self.check_timeout
+            )
+        except Exception as e:
+            return None, f"health check failed: {e!r}"
+        if lag > self.max_lag:
+            return lag, f"replication lag {lag:.1f}s exceeds {self.max_lag}s"
+        return lag, None
+
+    @staticmethod
+    async def _replication_lag(engine: AsyncEngine) -> float:
+        async with engine.connect() as conn:
+            if engine.dialect.name != "postgresql":
+                await conn.execute(text("SELECT 1"))
+                return 0.0
+            result = await conn.execute(REPLICATION_LAG_SQL)
+            return float(result.scalar())
+
+    def start(self) -> None:
+        if self.engines and self._task is None:
+            self._task = asyncio.create_task(self._check_loop(), name="replica-health")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _check_loop(self) -> None:
+        while True:
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Read replica health check failed")
+            await asyncio.sleep(self.check_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "replicas": len(self.engines),
+            "healthy": [replica_name(engine) for engine in self.healthy],
+            "lag_seconds": self.lag,
+            "routed_reads": self.routed_reads,
+            "ejections": self.ejections,
+        }
+
+
+class RoutingSession(Session):
+    def __init__(
+        self, *args: Any, replicas: Optional[ReplicaSet] = None, **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.sticky_primary = False
+        self._replica: Optional[AsyncEngine] = None
+
+    def get_bind(self, mapper=None, *, clause=None, use_replica=False, **kwargs):
+        if self.replicas and not self.sticky_primary:
+            if self._flushing or (clause is not None and clause.is_dml):
+                self.sticky_primary = True
+            elif use_replica:
+                replica = self._replica_bind()
+                if replica is not None:
+                    self.replicas.routed_reads += 1
+                    return replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _replica_bind(self) -> Optional[AsyncEngine]:
+        if self._replica is None or self._replica not in self.replicas.healthy:
+            self._replica = self.replicas.choose()
+        return self._replica
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def route_replica_reads(orm_execute_state) -> None:
+    if orm_execute_state.execution_options.get(USE_REPLICA):
+        orm_execute_state.bind_arguments[USE_REPLICA] = True
@@ -3,18 +3,29 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from sqlalchemy import text
 
+from app.ai.jobs import ai_job_queue
 from app.core.config import settings
+from app.core.jwks import jwks_key_cache
 from app.core.logging import setup_logging
 from app.api.v1.api import api_router
-from app.db.database import engine
+from app.db.database import engine, replica_set
 from app.db.base import Base
+from app.services.microsoft_graph import microsoft_graph_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
+    ai_job_queue.start()
+    jwks_key_cache.start()
+    replica_set.start()
     yield
+    await replica_set.stop()
+    await jwks_key_cache.stop()
+    await ai_job_queue.stop()
+    await microsoft_graph_service.aclose()
 
 
 app = FastAPI(
@@ -52,7 +63,7 @@ async def health_live():
 async def health_ready():
     try:
         async with engine.begin() as conn:
-            await conn.execute("SELECT 1")
+            await conn.execute(text("SELECT 1"))
         return {"status": "ready", "database": "connected"}
     except Exception as e:
         return {"status": "not ready", "database": "disconnected", "error": str(e)}
@@ -1,15 +1,19 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, JSON, Float
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, JSON, Float, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base_class import Base
 
 
 class Analysis(Base):
     __tablename__ = "analyses"
+    __table_args__ = (
+        Index("ix_analyses_object_content_hash", "business_object_id", "content_hash"),
+        Index("ix_analyses_object_tenant_created", "business_object_id", "tenant_id", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     business_object_id = Column(UUID(as_uuid=True), ForeignKey("business_objects.id"), nullable=False)
@@ -19,6 +23,7 @@ class Analysis(Base):
     recommendations = Column(JSON)
     confidence_score = Column(Float)
     metrics = Column(JSON)
+    content_hash = Column(String(64))
     tenant_id = Column(String(255), nullable=False, index=True)
     created_by = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
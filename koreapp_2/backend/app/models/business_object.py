@@ -2,12 +2,12 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, Enum, Boolean
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, DateTime, Enum, Boolean, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 import enum
 
-from app.db.base import Base
+from app.db.base_class import Base
 
 
 class ObjectType(str, enum.Enum):
@@ -30,8 +30,36 @@ class ComplexityLevel(str, enum.Enum):
     HIGH = "high"
 
 
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', replace(coalesce(tags, ''), ',', ' ')), 'C')"
+)
+
+
 class BusinessObject(Base):
     __tablename__ = "business_objects"
+    __table_args__ = (
+        Index(
+            "ix_business_objects_tenant_created_id_active",
+            "tenant_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_business_objects_tenant_updated_at", "tenant_id", "updated_at"),
+        Index(
+            "ix_business_objects_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_business_objects_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(255), nullable=False, index=True)
@@ -46,6 +74,9 @@ class BusinessObject(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
+    )
 
     analyses = relationship("Analysis", back_populates="business_object")
     source_relationships = relationship(
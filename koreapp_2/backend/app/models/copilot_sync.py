@@ -0,0 +1,35 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import Column, DateTime, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+
+class CopilotSyncState(Base):
+    __tablename__ = "copilot_sync_states"
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "connection_id",
+            name="uq_copilot_sync_states_tenant_connection",
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    tenant_id = Column(String(255), nullable=False)
+    connection_id = Column(String(255), nullable=False)
+    watermark = Column(DateTime)
+    last_full_sync_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class CopilotIndexedItem(Base):
+    __tablename__ = "copilot_indexed_items"
+
+    connection_id = Column(String(255), primary_key=True)
+    business_object_id = Column(UUID(as_uuid=True), primary_key=True)
+    tenant_id = Column(String(255), nullable=False, index=True)
+    payload_hash = Column(String(64), nullable=False)
+    indexed_at = Column(DateTime, default=datetime.utcnow)
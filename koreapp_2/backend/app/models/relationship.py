@@ -1,12 +1,12 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 
-from app.db.base import Base
+from app.db.base_class import Base
 
 
 class RelationshipType(str, enum.Enum):
@@ -19,6 +19,10 @@ class RelationshipType(str, enum.Enum):
 
 class Relationship(Base):
     __tablename__ = "relationships"
+    __table_args__ = (
+        Index("ix_relationships_source_tenant", "source_id", "tenant_id"),
+        Index("ix_relationships_target_tenant", "target_id", "tenant_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     source_id = Column(UUID(as_uuid=True), ForeignKey("business_objects.id"), nullable=False)
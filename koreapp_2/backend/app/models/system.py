@@ -4,7 +4,7 @@ from uuid import uuid4
 from sqlalchemy import Column, String, Text, DateTime, Boolean, JSON
 from sqlalchemy.dialects.postgresql import UUID
 
-from app.db.base import Base
+from app.db.base_class import Base
 
 
 class System(Base):
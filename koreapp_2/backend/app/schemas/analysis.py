@@ -2,7 +2,9 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.schemas.common import BulkItemError
 
 
 class AnalysisBase(BaseModel):
@@ -26,6 +28,17 @@ class AnalysisUpdate(BaseModel):
     metrics: Optional[Dict[str, Any]] = None
 
 
+class AnalysisSummary(BaseModel):
+    id: UUID
+    analysis_type: str
+    summary: Optional[str] = None
+    confidence_score: Optional[float] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class AnalysisInDBBase(AnalysisBase):
     id: UUID
     business_object_id: UUID
@@ -43,3 +56,19 @@ class Analysis(AnalysisInDBBase):
 
 class AnalysisInDB(AnalysisInDBBase):
     pass
+
+
+class ObjectAnalyses(BaseModel):
+    business_object_id: UUID
+    analyses: List[Analysis]
+
+
+class LatestAnalysesRequest(BaseModel):
+    object_ids: List[UUID]
+    per_object: int = Field(1, ge=1, le=20)
+    analysis_type: Optional[str] = None
+
+
+class AnalysisBulkResult(BaseModel):
+    items: List[Analysis]
+    errors: List[BulkItemError]
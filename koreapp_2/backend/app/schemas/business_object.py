@@ -5,6 +5,9 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from app.models.business_object import ObjectType, ObjectStatus, ComplexityLevel
+from app.schemas.analysis import AnalysisSummary
+from app.schemas.common import BulkItemError
+from app.schemas.relationship import RelationshipSummary
 
 
 class BusinessObjectBase(BaseModel):
@@ -31,6 +34,10 @@ class BusinessObjectUpdate(BaseModel):
     tags: Optional[str] = None
 
 
+class BusinessObjectBulkUpdate(BusinessObjectUpdate):
+    id: UUID
+
+
 class BusinessObjectInDBBase(BusinessObjectBase):
     id: UUID
     tenant_id: str
@@ -53,7 +60,28 @@ class BusinessObjectInDB(BusinessObjectInDBBase):
 
 class BusinessObjectList(BaseModel):
     items: List[BusinessObject]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class BusinessObjectExpanded(BusinessObject):
+    analyses: Optional[List[AnalysisSummary]] = None
+    source_relationships: Optional[List[RelationshipSummary]] = None
+    target_relationships: Optional[List[RelationshipSummary]] = None
+
+
+class BusinessObjectExpandedList(BusinessObjectList):
+    items: List[BusinessObjectExpanded]
+
+
+class BusinessObjectBulkResult(BaseModel):
+    items: List[BusinessObject]
+    errors: List[BulkItemError]
+
+
+class BusinessObjectBulkDeleteResult(BaseModel):
+    deleted: List[UUID]
+    errors: List[BulkItemError]
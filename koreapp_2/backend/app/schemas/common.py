@@ -0,0 +1,10 @@
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    errors: List[Dict[str, Any]]
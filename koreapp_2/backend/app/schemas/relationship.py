@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.models.business_object import ObjectType
+from app.models.relationship import RelationshipType
+
+
+class RelationshipBase(BaseModel):
+    source_id: UUID
+    target_id: UUID
+    type: RelationshipType
+    description: Optional[str] = None
+
+
+class RelationshipCreate(RelationshipBase):
+    pass
+
+
+class RelationshipInDBBase(RelationshipBase):
+    id: UUID
+    tenant_id: str
+    created_by: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class Relationship(RelationshipInDBBase):
+    pass
+
+
+class RelationshipInDB(RelationshipInDBBase):
+    pass
+
+
+class RelationshipSummary(BaseModel):
+    id: UUID
+    source_id: UUID
+    target_id: UUID
+    type: RelationshipType
+    description: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class RelationshipGraphNode(BaseModel):
+    object_id: UUID
+    depth: int
+
+
+class RelationshipGraphEdge(BaseModel):
+    source_id: UUID
+    target_id: UUID
+    type: RelationshipType
+    depth: int
+
+
+class RelationshipGraph(BaseModel):
+    object_id: UUID
+    direction: str
+    max_depth: int
+    nodes: List[RelationshipGraphNode]
+    edges: List[RelationshipGraphEdge]
+
+
+class ImpactedObject(BaseModel):
+    object_id: UUID
+    name: Optional[str] = None
+    object_type: Optional[ObjectType] = None
+    distance: int
+    relationship_type: RelationshipType
+
+
+class ImpactAnalysis(BaseModel):
+    object_id: UUID
+    total: int
+    items: List[ImpactedObject]
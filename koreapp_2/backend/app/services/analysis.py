@@ -1,12 +1,40 @@
-from typing import List, Optional
-from uuid import UUID
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.models.analysis import Analysis as AnalysisModel
 from app.schemas.analysis import AnalysisCreate, AnalysisUpdate
 
+RESPONSE_COLUMNS = (
+    AnalysisModel.id,
+    AnalysisModel.business_object_id,
+    AnalysisModel.analysis_type,
+    AnalysisModel.summary,
+    AnalysisModel.insights,
+    AnalysisModel.recommendations,
+    AnalysisModel.confidence_score,
+    AnalysisModel.metrics,
+    AnalysisModel.tenant_id,
+    AnalysisModel.created_by,
+    AnalysisModel.created_at,
+)
+
+OBJECT_ANALYSES = (
+    select(AnalysisModel)
+    .where(
+        AnalysisModel.business_object_id == bindparam("object_id"),
+        AnalysisModel.tenant_id == bindparam("tenant_id"),
+    )
+    .order_by(AnalysisModel.created_at.desc())
+    .execution_options(use_replica=True)
+)
+
+OBJECT_ANALYSIS_ROWS = OBJECT_ANALYSES.with_only_columns(*RESPONSE_COLUMNS)
+
 
 class AnalysisService:
     async def get(
@@ -21,17 +49,89 @@ class AnalysisService:
         return result.scalar_one_or_none()
 
     async def get_by_object(
-        self, db: AsyncSession, *, object_id: UUID, tenant_id: str
-    ) -> List[AnalysisModel]:
+        self,
+        db: AsyncSession,
+        *,
+        object_id: UUID,
+        tenant_id: str,
+        as_rows: bool = False,
+    ) -> Union[List[AnalysisModel], List[Dict[str, Any]]]:
+        result = await db.execute(
+            OBJECT_ANALYSIS_ROWS if as_rows else OBJECT_ANALYSES,
+            {"object_id": object_id, "tenant_id": tenant_id},
+        )
+        if as_rows:
+            return [row._asdict() for row in result]
+        return result.scalars().all()
+
+    async def get_latest_for_objects(
+        self,
+        db: AsyncSession,
+        *,
+        object_ids: Sequence[UUID],
+        tenant_id: str,
+        per_object: int = 1,
+        analysis_type: Optional[str] = None,
+    ) -> Dict[UUID, List[Dict[str, Any]]]:
+        if len(object_ids) > settings.ANALYSIS_BATCH_MAX_OBJECTS:
+            raise ValueError(
+                f"At most {settings.ANALYSIS_BATCH_MAX_OBJECTS} objects can be requested at once"
+            )
+
+        latest: Dict[UUID, List[Dict[str, Any]]] = {object_id: [] for object_id in object_ids}
+        if not latest:
+            return latest
+
+        filters = [
+            AnalysisModel.business_object_id.in_(latest),
+            AnalysisModel.tenant_id == tenant_id,
+        ]
+        if analysis_type:
+            filters.append(AnalysisModel.analysis_type == analysis_type)
+
+        ranked = (
+            select(
+                *RESPONSE_COLUMNS,
+                func.row_number()
+                .over(
+                    partition_by=AnalysisModel.business_object_id,
+                    order_by=(AnalysisModel.created_at.desc(), AnalysisModel.id.desc()),
+                )
+                .label("rank"),
+            )
+            .where(*filters)
+            .subquery()
+        )
+        result = await db.execute(
+            select(*(ranked.c[column.key] for column in RESPONSE_COLUMNS))
+            .where(ranked.c.rank <= per_object)
+            .order_by(ranked.c.business_object_id, ranked.c.rank)
+        )
+        for row in result:
+            latest[row.business_object_id].append(row._asdict())
+        return latest
+
+    async def get_by_content_hash(
+        self,
+        db: AsyncSession,
+        *,
+        object_id: UUID,
+        tenant_id: str,
+        content_hash: str,
+        analysis_type: str,
+    ) -> Optional[AnalysisModel]:
         result = await db.execute(
             select(AnalysisModel)
             .where(
                 AnalysisModel.business_object_id == object_id,
+                AnalysisModel.content_hash == content_hash,
                 AnalysisModel.tenant_id == tenant_id,
+                AnalysisModel.analysis_type == analysis_type,
             )
             .order_by(AnalysisModel.created_at.desc())
+            .limit(1)
         )
-        return result.scalars().all()
+        return result.scalar_one_or_none()
 
     async def create(
         self,
@@ -40,17 +140,48 @@ class AnalysisService:
         obj_in: AnalysisCreate,
         tenant_id: str,
         created_by: str,
+        content_hash: Optional[str] = None,
     ) -> AnalysisModel:
         db_obj = AnalysisModel(
             **obj_in.model_dump(),
             tenant_id=tenant_id,
             created_by=created_by,
+            content_hash=content_hash,
         )
         db.add(db_obj)
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
 
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[AnalysisCreate],
+        tenant_id: str,
+        created_by: str,
+    ) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        rows = [
+            {
+                **obj_in.model_dump(),
+                "id": uuid4(),
+                "tenant_id": tenant_id,
+                "created_by": created_by,
+                "created_at": now,
+            }
+            for obj_in in objs_in
+        ]
+        result = await db.execute(
+            insert(AnalysisModel.__table__)
+            .returning(*RESPONSE_COLUMNS, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=settings.BULK_CHUNK_SIZE),
+            rows,
+        )
+        created = [row._asdict() for row in result]
+        await db.commit()
+        return created
+
     async def update(
         self,
         db: AsyncSession,
@@ -0,0 +1,157 @@
+import hashlib
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.orchestrator import AIOrchestrator
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.analysis import Analysis as AnalysisModel
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.schemas.analysis import AnalysisCreate
+from app.services.analysis import analysis_service
+
+logger = get_logger(__name__)
+
+AI_ANALYSIS_TYPE = "ai_analysis"
+
+
+def content_hash(business_object: BusinessObjectModel) -> str:
+    payload = json.dumps(
+        {
+            "name": business_object.name,
+            "type": business_object.type,
+            "complexity": business_object.complexity,
+            "description": business_object.description,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def analysis_create_from_result(
+    object_id: UUID, result: Dict[str, Any]
+) -> AnalysisCreate:
+    return AnalysisCreate(
+        business_object_id=object_id,
+        analysis_type=AI_ANALYSIS_TYPE,
+        summary=result["summary"],
+        insights=[{"text": insight} for insight in result["insights"]],
+        recommendations=[{"text": item} for item in result["recommendations"]],
+        confidence_score=result["confidence_score"],
+        metrics={"agent_results": result["agent_results"]},
+    )
+
+
+def result_from_analysis(analysis: AnalysisModel) -> Dict[str, Any]:
+    return {
+        "summary": analysis.summary,
+        "insights": [item["text"] for item in analysis.insights or []],
+        "recommendations": [item["text"] for item in analysis.recommendations or []],
+        "confidence_score": analysis.confidence_score,
+        "agent_results": (analysis.metrics or {}).get("agent_results", {}),
+    }
+
+
+class AnalysisCacheService:
+    def __init__(self):
+        self._cache = LRUCache(maxsize=settings.ANALYSIS_CACHE_SIZE)
+        self.db_hits = 0
+        self.computed = 0
+
+    async def get_or_analyze(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        business_object: BusinessObjectModel,
+        orchestrator: AIOrchestrator,
+        tenant_id: str,
+        created_by: str,
+    ) -> Tuple[Dict[str, Any], bool]:
+        async with session_factory() as db:
+            result = await self.lookup(
+                db=db, business_object=business_object, tenant_id=tenant_id
+            )
+        if result is not None:
+            return result, True
+
+        result = await orchestrator.analyze_object(business_object)
+        async with session_factory() as db:
+            await self.store(
+                db=db,
+                business_object=business_object,
+                result=result,
+                tenant_id=tenant_id,
+                created_by=created_by,
+            )
+        return result, False
+
+    async def lookup(
+        self,
+        db: AsyncSession,
+        *,
+        business_object: BusinessObjectModel,
+        tenant_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        digest = content_hash(business_object)
+        entry = self._cache.get(business_object.id)
+        if entry is not None and entry[0] == digest:
+            return entry[1]
+
+        stored = await analysis_service.get_by_content_hash(
+            db=db,
+            object_id=business_object.id,
+            tenant_id=tenant_id,
+            content_hash=digest,
+            analysis_type=AI_ANALYSIS_TYPE,
+        )
+        if stored is None:
+            self.computed += 1
+            return None
+
+        self.db_hits += 1
+        result = result_from_analysis(stored)
+        self._cache.set(business_object.id, (digest, result))
+        return result
+
+    async def store(
+        self,
+        db: AsyncSession,
+        *,
+        business_object: BusinessObjectModel,
+        result: Dict[str, Any],
+        tenant_id: str,
+        created_by: str,
+    ) -> None:
+        digest = content_hash(business_object)
+        await analysis_service.create(
+            db=db,
+            obj_in=analysis_create_from_result(business_object.id, result),
+            tenant_id=tenant_id,
+            created_by=created_by,
+            content_hash=digest,
+        )
+        self._cache.set(business_object.id, (digest, result))
+
+    def invalidate(self, object_id: UUID) -> None:
+        self._cache.pop(object_id)
+
+    def stats(self) -> Dict[str, Any]:
+        memory = self._cache.stats()
+        hits = memory["hits"] + self.db_hits
+        lookups = hits + self.computed
+        return {
+            "size": memory["size"],
+            "maxsize": memory["maxsize"],
+            "evictions": memory["evictions"],
+            "memory_hits": memory["hits"],
+            "db_hits": self.db_hits,
+            "misses": self.computed,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+analysis_cache_service = AnalysisCacheService()
@@ -1,28 +1,253 @@
-from typing import List, Optional
-from uuid import UUID
+import base64
+import re
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, func, or_
+from sqlalchemy import (
+    String,
+    bindparam,
+    cast,
+    column,
+    insert,
+    select,
+    func,
+    or_,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.sql import Select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.analysis import Analysis as AnalysisModel
 from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.models.relationship import Relationship as RelationshipModel
 from app.schemas.business_object import (
     BusinessObjectCreate,
+    BusinessObjectExpandedList,
     BusinessObjectUpdate,
     BusinessObjectList,
 )
+from app.services.analysis_cache import analysis_cache_service
+
+RESPONSE_COLUMNS = (
+    BusinessObjectModel.id,
+    BusinessObjectModel.name,
+    BusinessObjectModel.type,
+    BusinessObjectModel.description,
+    BusinessObjectModel.status,
+    BusinessObjectModel.complexity,
+    BusinessObjectModel.owner,
+    BusinessObjectModel.tags,
+    BusinessObjectModel.tenant_id,
+    BusinessObjectModel.created_by,
+    BusinessObjectModel.created_at,
+    BusinessObjectModel.updated_at,
+    BusinessObjectModel.is_active,
+)
+
+INCLUDE_ANALYSES = "analyses"
+INCLUDE_RELATIONSHIPS = "relationships"
+
+RELATIONSHIP_SUMMARY_COLUMNS = (
+    RelationshipModel.id,
+    RelationshipModel.source_id,
+    RelationshipModel.target_id,
+    RelationshipModel.type,
+    RelationshipModel.description,
+)
+
+INCLUDE_OPTIONS = {
+    INCLUDE_ANALYSES: (
+        selectinload(BusinessObjectModel.analyses).load_only(
+            AnalysisModel.id,
+            AnalysisModel.analysis_type,
+            AnalysisModel.summary,
+            AnalysisModel.confidence_score,
+            AnalysisModel.created_at,
+        ),
+    ),
+    INCLUDE_RELATIONSHIPS: (
+        selectinload(BusinessObjectModel.source_relationships).load_only(
+            *RELATIONSHIP_SUMMARY_COLUMNS
+        ),
+        selectinload(BusinessObjectModel.target_relationships).load_only(
+            *RELATIONSHIP_SUMMARY_COLUMNS
+        ),
+    ),
+}
+
+
+def include_options(include: FrozenSet[str]) -> List[Any]:
+    return [option for name in sorted(include) for option in INCLUDE_OPTIONS[name]]
+
+
+def parse_include(include: Optional[str]) -> FrozenSet[str]:
+    if not include:
+        return frozenset()
+    names = frozenset(name.strip() for name in include.split(",") if name.strip())
+    unknown = names - INCLUDE_OPTIONS.keys()
+    if unknown:
+        raise ValueError(f"Unknown include: {', '.join(sorted(unknown))}")
+    return names
+
+
+def expand(obj: BusinessObjectModel, include: FrozenSet[str]) -> Dict[str, Any]:
+    data = {column.key: getattr(obj, column.key) for column in RESPONSE_COLUMNS}
+    if INCLUDE_ANALYSES in include:
+        data["analyses"] = sorted(
+            obj.analyses, key=lambda analysis: analysis.created_at, reverse=True
+        )
+    if INCLUDE_RELATIONSHIPS in include:
+        data["source_relationships"] = obj.source_relationships
+        data["target_relationships"] = obj.target_relationships
+    return data
+
+
+PAGE_OFFSET = "offset"
+PAGE_CURSOR = "cursor"
+PAGE_FIRST = "first"
+PAGE_AFTER = "after"
+
+PAGINATION_MODES = (PAGE_OFFSET, PAGE_CURSOR)
+
+SEARCH = bindparam("search", type_=String)
+TSQUERY = func.to_tsquery("simple", bindparam("tsquery", type_=String))
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def build_prefix_tsquery(search: str) -> Optional[str]:
+    terms = re.findall(r"\w+", search.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def filtered_statement(
+    columns: Sequence[Any], filters: Tuple[bool, bool, bool]
+) -> Select:
+    search, type_filter, status_filter = filters
+    query = select(*columns).where(
+        BusinessObjectModel.tenant_id == bindparam("tenant_id"),
+        BusinessObjectModel.is_active == True,
+    )
+    if search:
+        query = query.where(
+            or_(
+                BusinessObjectModel.search_vector.op("@@")(TSQUERY),
+                BusinessObjectModel.name.op("%")(SEARCH),
+            )
+        )
+    if type_filter:
+        query = query.where(BusinessObjectModel.type == bindparam("type_filter"))
+    if status_filter:
+        query = query.where(BusinessObjectModel.status == bindparam("status_filter"))
+    return query.execution_options(use_replica=True)
+
+
+def get_statement(include: FrozenSet[str], use_replica: bool = False) -> Select:
+    return (
+        select(BusinessObjectModel)
+        .where(
+            BusinessObjectModel.id == bindparam("id"),
+            BusinessObjectModel.tenant_id == bindparam("tenant_id"),
+            BusinessObjectModel.is_active == True,
+        )
+        .options(*include_options(include))
+        .execution_options(use_replica=use_replica)
+    )
+
+
+def count_statement(filters: Tuple[bool, bool, bool]) -> Select:
+    return (
+        select(func.count())
+        .select_from(filtered_statement((BusinessObjectModel.id,), filters).subquery())
+        .execution_options(use_replica=True)
+    )
+
+
+def page_statement(
+    filters: Tuple[bool, bool, bool], mode: str, as_rows: bool, include: FrozenSet[str]
+) -> Select:
+    query = filtered_statement(
+        RESPONSE_COLUMNS if as_rows else (BusinessObjectModel,), filters
+    )
+    order = [BusinessObjectModel.created_at.desc(), BusinessObjectModel.id.desc()]
+    if filters[0]:
+        order = [
+            func.ts_rank_cd(BusinessObjectModel.search_vector, TSQUERY).desc(),
+            func.similarity(BusinessObjectModel.name, SEARCH).desc(),
+            *order,
+        ]
+    if mode == PAGE_OFFSET:
+        query = query.offset(bindparam("offset"))
+    elif mode == PAGE_AFTER:
+        query = query.where(
+            tuple_(BusinessObjectModel.created_at, BusinessObjectModel.id)
+            < tuple_(
+                bindparam(
+                    "cursor_created_at", type_=BusinessObjectModel.created_at.type
+                ),
+                bindparam("cursor_id", type_=BusinessObjectModel.id.type),
+            )
+        )
+    return (
+        query.options(*include_options(include))
+        .order_by(*order)
+        .limit(bindparam("limit"))
+    )
 
 
 class BusinessObjectService:
+    def __init__(self):
+        self._count_cache = LRUCache(
+            maxsize=settings.OBJECT_COUNT_CACHE_SIZE,
+            ttl=settings.OBJECT_COUNT_CACHE_TTL,
+        )
+        self._count_versions: Dict[str, int] = {}
+        self._statements: Dict[Tuple, Select] = {}
+
     async def get(
-        self, db: AsyncSession, *, id: UUID, tenant_id: str
+        self,
+        db: AsyncSession,
+        *,
+        id: UUID,
+        tenant_id: str,
+        include: FrozenSet[str] = frozenset(),
+        use_replica: bool = False,
     ) -> Optional[BusinessObjectModel]:
-        result = await db.execute(
-            select(BusinessObjectModel).where(
-                BusinessObjectModel.id == id,
-                BusinessObjectModel.tenant_id == tenant_id,
-                BusinessObjectModel.is_active == True,
-            )
+        statement = self._statement(
+            ("get", include, use_replica), lambda: get_statement(include, use_replica)
         )
+        result = await db.execute(statement, {"id": id, "tenant_id": tenant_id})
         return result.scalar_one_or_none()
 
     async def get_multi(
@@ -32,47 +257,157 @@ class BusinessObjectService:
         tenant_id: str,
         skip: int = 0,
         limit: int = 100,
+        paginate: str = PAGE_OFFSET,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
         search: Optional[str] = None,
         type_filter: Optional[str] = None,
         status_filter: Optional[str] = None,
-    ) -> BusinessObjectList:
-        query = select(BusinessObjectModel).where(
-            BusinessObjectModel.tenant_id == tenant_id,
-            BusinessObjectModel.is_active == True,
-        )
+        as_rows: bool = False,
+        include: FrozenSet[str] = frozenset(),
+    ) -> Union[BusinessObjectList, BusinessObjectExpandedList, Dict[str, Any]]:
+        if paginate not in PAGINATION_MODES:
+            raise ValueError(f"Invalid paginate: {paginate}")
+        if cursor and paginate != PAGE_CURSOR:
+            raise ValueError(f"cursor requires paginate={PAGE_CURSOR}")
+        if as_rows and include:
+            raise ValueError("include is not supported in fast mode")
 
-        if search:
-            query = query.where(
-                or_(
-                    BusinessObjectModel.name.ilike(f"%{search}%"),
-                    BusinessObjectModel.description.ilike(f"%{search}%"),
-                )
+        search = search.strip() if search else None
+        if search and paginate == PAGE_CURSOR:
+            raise ValueError(
+                "search results are ordered by relevance and cannot be paged with "
+                f"paginate={PAGE_CURSOR}; use paginate={PAGE_OFFSET}"
+            )
+        tsquery_text = build_prefix_tsquery(search) if search else None
+        if search and not tsquery_text:
+            return self._page(
+                [],
+                as_rows,
+                include,
+                total=0,
+                page=skip // limit + 1,
+                size=limit,
+                pages=0,
             )
 
+        params: Dict[str, Any] = {"tenant_id": tenant_id}
+        if tsquery_text:
+            params["tsquery"] = tsquery_text
+            params["search"] = search
         if type_filter:
-            query = query.where(BusinessObjectModel.type == type_filter)
-
+            params["type_filter"] = type_filter
         if status_filter:
-            query = query.where(BusinessObjectModel.status == status_filter)
+            params["status_filter"] = status_filter
+        filters = (bool(tsquery_text), bool(type_filter), bool(status_filter))
 
-        total_result = await db.execute(
-            select(func.count()).select_from(query.subquery())
-        )
-        total = total_result.scalar()
+        if paginate == PAGE_OFFSET:
+            total = await self._count(db, filters, params)
+            result = await db.execute(
+                self._page_statement(filters, PAGE_OFFSET, as_rows, include),
+                {**params, "offset": skip, "limit": limit},
+            )
+            items = result.all() if as_rows else result.scalars().all()
+
+            return self._page(
+                items,
+                as_rows,
+                include,
+                total=total,
+                page=skip // limit + 1,
+                size=limit,
+                pages=(total + limit - 1) // limit,
+            )
+
+        total = None
+        if include_total:
+            count_key = (
+                tenant_id,
+                self._count_versions.get(tenant_id, 0),
+                search,
+                type_filter,
+                status_filter,
+            )
+            total = self._count_cache.get(count_key)
+            if total is None:
+                total = await self._count(db, filters, params)
+                self._count_cache.set(count_key, total)
+
+        mode = PAGE_FIRST
+        if cursor:
+            mode = PAGE_AFTER
+            params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
 
         result = await db.execute(
-            query.offset(skip).limit(limit).order_by(BusinessObjectModel.created_at.desc())
+            self._page_statement(filters, mode, as_rows, include),
+            {**params, "limit": limit + 1},
         )
-        items = result.scalars().all()
+        items = result.all() if as_rows else result.scalars().all()
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
 
-        return BusinessObjectList(
-            items=items,
+        return self._page(
+            items,
+            as_rows,
+            include,
             total=total,
-            page=skip // limit + 1,
+            page=None,
             size=limit,
-            pages=(total + limit - 1) // limit,
+            pages=None,
+            next_cursor=next_cursor,
+        )
+
+    def _statement(self, key: Tuple, build: Callable[[], Select]) -> Select:
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = build()
+        return statement
+
+    def _page_statement(
+        self,
+        filters: Tuple[bool, bool, bool],
+        mode: str,
+        as_rows: bool,
+        include: FrozenSet[str],
+    ) -> Select:
+        return self._statement(
+            ("page", filters, mode, as_rows, include),
+            lambda: page_statement(filters, mode, as_rows, include),
         )
 
+    @staticmethod
+    def _page(
+        items: List[Any], as_rows: bool, include: FrozenSet[str], **page: Any
+    ) -> Union[BusinessObjectList, BusinessObjectExpandedList, Dict[str, Any]]:
+        if as_rows:
+            return {
+                "items": [row._asdict() for row in items],
+                "next_cursor": None,
+                **page,
+            }
+        if include:
+            return BusinessObjectExpandedList(
+                items=[expand(obj, include) for obj in items],
+                next_cursor=page.pop("next_cursor", None),
+                **page,
+            )
+        return BusinessObjectList(items=items, **page)
+
+    def invalidate_counts(self, tenant_id: str) -> None:
+        self._count_versions[tenant_id] = self._count_versions.get(tenant_id, 0) + 1
+
+    async def _count(
+        self, db: AsyncSession, filters: Tuple[bool, bool, bool], params: Dict[str, Any]
+    ) -> int:
+        statement = self._statement(
+            ("count", filters), lambda: count_statement(filters)
+        )
+        result = await db.execute(statement, params)
+        return result.scalar()
+
     async def create(
         self,
         db: AsyncSession,
@@ -89,6 +424,7 @@ class BusinessObjectService:
         db.add(db_obj)
         await db.commit()
         await db.refresh(db_obj)
+        self.invalidate_counts(tenant_id)
         return db_obj
 
     async def update(
@@ -104,6 +440,8 @@ class BusinessObjectService:
 
         await db.commit()
         await db.refresh(db_obj)
+        self.invalidate_counts(db_obj.tenant_id)
+        analysis_cache_service.invalidate(db_obj.id)
         return db_obj
 
     async def remove(self, db: AsyncSession, *, id: UUID) -> None:
@@ -113,6 +451,125 @@ class BusinessObjectService:
         obj = result.scalar_one()
         obj.is_active = False
         await db.commit()
+        self.invalidate_counts(obj.tenant_id)
+        analysis_cache_service.invalidate(id)
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[BusinessObjectCreate],
+        tenant_id: str,
+        created_by: str,
+    ) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        rows = [
+            {
+                **obj_in.model_dump(),
+                "id": uuid4(),
+                "tenant_id": tenant_id,
+                "created_by": created_by,
+                "created_at": now,
+                "updated_at": now,
+                "is_active": True,
+            }
+            for obj_in in objs_in
+        ]
+
+        result = await db.execute(
+            insert(BusinessObjectModel.__table__)
+            .returning(*RESPONSE_COLUMNS, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=settings.BULK_CHUNK_SIZE),
+            rows,
+        )
+        created = [row._asdict() for row in result]
+        await db.commit()
+        self.invalidate_counts(tenant_id)
+        return created
+
+    async def bulk_update(
+        self,
+        db: AsyncSession,
+        *,
+        items: Sequence[Tuple[UUID, BusinessObjectUpdate]],
+        tenant_id: str,
+    ) -> List[Dict[str, Any]]:
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for id, obj_in in items:
+            update_data = obj_in.model_dump(exclude_unset=True)
+            groups.setdefault(tuple(sorted(update_data)), []).append(
+                {"id": id, **update_data}
+            )
+
+        table = BusinessObjectModel.__table__
+        now = datetime.utcnow()
+        updated = []
+        for fields, rows in groups.items():
+            for start in range(0, len(rows), settings.BULK_CHUNK_SIZE):
+                chunk = rows[start : start + settings.BULK_CHUNK_SIZE]
+                data = values(
+                    column("id", table.c.id.type),
+                    *(column(field, table.c[field].type) for field in fields),
+                    name="data",
+                ).data([tuple(row[key] for key in ("id", *fields)) for row in chunk])
+                result = await db.execute(
+                    update(BusinessObjectModel)
+                    .where(
+                        BusinessObjectModel.id == cast(data.c.id, table.c.id.type),
+                        BusinessObjectModel.tenant_id == tenant_id,
+                        BusinessObjectModel.is_active == True,
+                    )
+                    .values(
+                        {
+                            **{
+                                field: cast(data.c[field], table.c[field].type)
+                                for field in fields
+                            },
+                            "updated_at": now,
+                        }
+                    )
+                    .returning(*RESPONSE_COLUMNS)
+                )
+                updated.extend(row._asdict() for row in result)
+        await db.commit()
+        self.invalidate_counts(tenant_id)
+
+        for row in updated:
+            analysis_cache_service.invalidate(row["id"])
+        return updated
+
+    async def get_active_ids(
+        self, db: AsyncSession, *, ids: Sequence[UUID], tenant_id: str
+    ) -> Set[UUID]:
+        result = await db.execute(
+            select(BusinessObjectModel.id).where(
+                BusinessObjectModel.id.in_(ids),
+                BusinessObjectModel.tenant_id == tenant_id,
+                BusinessObjectModel.is_active == True,
+            )
+        )
+        return set(result.scalars())
+
+    async def bulk_remove(
+        self, db: AsyncSession, *, ids: Sequence[UUID], tenant_id: str
+    ) -> List[UUID]:
+        result = await db.execute(
+            update(BusinessObjectModel)
+            .where(
+                BusinessObjectModel.id.in_(ids),
+                BusinessObjectModel.tenant_id == tenant_id,
+                BusinessObjectModel.is_active == True,
+            )
+            .values(is_active=False, updated_at=datetime.utcnow())
+            .returning(BusinessObjectModel.id)
+        )
+        removed = result.scalars().all()
+        await db.commit()
+        self.invalidate_counts(tenant_id)
+
+        for id in removed:
+            analysis_cache_service.invalidate(id)
+        return removed
 
 
 business_object_service = BusinessObjectService()
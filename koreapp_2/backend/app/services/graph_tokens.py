@@ -0,0 +1,131 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from azure.core.credentials import AccessToken
+
+from app.core.cache import LRUCache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+TokenFetcher = Callable[[str, str], Awaitable[AccessToken]]
+AppTokenFetcher = Callable[[str], Awaitable[AccessToken]]
+
+
+class OnBehalfOfTokenCache:
+    def __init__(self, maxsize: int, refresh_margin: float):
+        self.refresh_margin = refresh_margin
+        self._tokens = LRUCache(maxsize=maxsize)
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.refresh_seconds_total = 0.0
+        self.refresh_seconds_max = 0.0
+
+    @staticmethod
+    def _key(user_assertion: str, scope: str) -> Tuple[str, str]:
+        return hashlib.sha256(user_assertion.encode()).hexdigest(), scope
+
+    async def get_token(
+        self, user_assertion: str, scope: str, fetch: TokenFetcher
+    ) -> str:
+        key = self._key(user_assertion, scope)
+        token = self._tokens.get(key)
+        if token is not None:
+            return token
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(key, user_assertion, scope, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _refresh(
+        self,
+        key: Tuple[str, str],
+        user_assertion: str,
+        scope: str,
+        fetch: TokenFetcher,
+    ) -> str:
+        started = time.perf_counter()
+        try:
+            access_token = await fetch(user_assertion, scope)
+        except Exception:
+            self.refresh_errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.refreshes += 1
+            self.refresh_seconds_total += elapsed
+            self.refresh_seconds_max = max(self.refresh_seconds_max, elapsed)
+
+        lifetime = access_token.expires_on - time.time() - self.refresh_margin
+        if lifetime > 0:
+            self._tokens.set(
+                key, access_token.token, expires_at=time.monotonic() + lifetime
+            )
+        return access_token.token
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._tokens.stats(),
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "refresh_latency_avg_ms": (
+                round(self.refresh_seconds_total / self.refreshes * 1000, 2)
+                if self.refreshes
+                else 0.0
+            ),
+            "refresh_latency_max_ms": round(self.refresh_seconds_max * 1000, 2),
+        }
+
+
+class AppTokenCache:
+    def __init__(self, refresh_margin: float):
+        self.refresh_margin = refresh_margin
+        self._tokens: Dict[str, AccessToken] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    async def get_token(self, scope: str, fetch: AppTokenFetcher) -> str:
+        token = self._tokens.get(scope)
+        if token is not None and token.expires_on - self.refresh_margin > time.time():
+            return token.token
+
+        task = self._inflight.get(scope)
+        if task is None:
+            task = asyncio.create_task(self._refresh(scope, fetch))
+            self._inflight[scope] = task
+            task.add_done_callback(lambda _: self._inflight.pop(scope, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _refresh(self, scope: str, fetch: AppTokenFetcher) -> str:
+        self.refreshes += 1
+        try:
+            access_token = await fetch(scope)
+        except Exception:
+            self.refresh_errors += 1
+            raise
+        self._tokens[scope] = access_token
+        return access_token.token
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "scopes": len(self._tokens),
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+        }
@@ -0,0 +1,395 @@
+import asyncio
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.models.business_object import ObjectType
+from app.models.relationship import Relationship as RelationshipModel
+from app.models.relationship import RelationshipType
+
+REVERSE_IMPACT_TYPES = {RelationshipType.DEPENDS_ON, RelationshipType.USES}
+
+RELATIONSHIP_PRIORITY = {
+    RelationshipType.DEPENDS_ON: 0,
+    RelationshipType.USES: 1,
+    RelationshipType.TRIGGERS: 2,
+    RelationshipType.PRODUCES: 3,
+    RelationshipType.CONTAINS: 4,
+}
+
+PRIORITY_TYPES = sorted(RELATIONSHIP_PRIORITY, key=RELATIONSHIP_PRIORITY.__getitem__)
+
+PRECOMPUTED_TYPES = (ObjectType.PROCESS, ObjectType.INTEGRATION)
+
+INCREMENTAL_MERGE_LIMIT = 5000
+
+Closure = Dict[int, Tuple[int, int]]
+
+SourceObject = aliased(BusinessObjectModel)
+TargetObject = aliased(BusinessObjectModel)
+
+
+def active_edges_statement(tenant_id: str) -> Select:
+    return (
+        select(
+            RelationshipModel.source_id,
+            RelationshipModel.target_id,
+            RelationshipModel.type,
+        )
+        .join(SourceObject, SourceObject.id == RelationshipModel.source_id)
+        .join(TargetObject, TargetObject.id == RelationshipModel.target_id)
+        .where(
+            RelationshipModel.tenant_id == tenant_id,
+            SourceObject.is_active == True,
+            TargetObject.is_active == True,
+        )
+    )
+
+
+async def graph_version(db: AsyncSession, tenant_id: str) -> Tuple:
+    result = await db.execute(
+        select(
+            select(func.count())
+            .where(RelationshipModel.tenant_id == tenant_id)
+            .scalar_subquery(),
+            select(func.max(RelationshipModel.created_at))
+            .where(RelationshipModel.tenant_id == tenant_id)
+            .scalar_subquery(),
+            select(func.max(BusinessObjectModel.updated_at))
+            .where(
+                BusinessObjectModel.tenant_id == tenant_id,
+                BusinessObjectModel.is_active == False,
+            )
+            .scalar_subquery(),
+        )
+    )
+    return tuple(result.one())
+
+
+def impact_edge(
+    source_id: UUID, target_id: UUID, type: RelationshipType
+) -> Tuple[UUID, UUID]:
+    if type in REVERSE_IMPACT_TYPES:
+        return target_id, source_id
+    return source_id, target_id
+
+
+class TenantImpactIndex:
+    def __init__(
+        self,
+        edges: Iterable[Tuple[UUID, UUID, RelationshipType]],
+        max_entries: int,
+    ):
+        self._node_ids: Dict[UUID, int] = {}
+        self._object_ids: List[UUID] = []
+        self.affects: Dict[int, Dict[int, List[int]]] = {}
+        self.closures: "OrderedDict[int, Closure]" = OrderedDict()
+        self._ranked: Dict[int, List[Tuple[UUID, int, RelationshipType]]] = {}
+        self.max_entries = max_entries
+        self.entries = 0
+        self.edge_count = 0
+        self.version: Optional[Tuple] = None
+        for source_id, target_id, type in edges:
+            self._link(source_id, target_id, type)
+
+    def _node(self, object_id: UUID) -> int:
+        node = self._node_ids.get(object_id)
+        if node is None:
+            node = self._node_ids[object_id] = len(self._object_ids)
+            self._object_ids.append(object_id)
+        return node
+
+    def _link(
+        self, source_id: UUID, target_id: UUID, type: RelationshipType
+    ) -> Tuple[int, int]:
+        changed, affected = impact_edge(source_id, target_id, type)
+        changed, affected = self._node(changed), self._node(affected)
+        priorities = self.affects.setdefault(changed, {}).setdefault(affected, [])
+        priorities.append(RELATIONSHIP_PRIORITY[type])
+        self.edge_count += 1
+        return changed, affected
+
+    def precompute(self, roots: List[UUID], limit: int) -> None:
+        for object_id in roots[:limit]:
+            if self.entries >= self.max_entries:
+                break
+            self.ranked(object_id)
+
+    def is_cached(self, object_id: UUID) -> bool:
+        return self._node_ids.get(object_id) in self.closures
+
+    def has_impact(self, object_id: UUID) -> bool:
+        return self._node_ids.get(object_id) in self.affects
+
+    def ranked(
+        self, object_id: UUID, max_depth: Optional[int] = None
+    ) -> List[Tuple[UUID, int, RelationshipType]]:
+        root = self._node_ids.get(object_id)
+        if root is None:
+            return []
+
+        ranked = self._ranked.get(root)
+        if ranked is None:
+            object_ids = self._object_ids
+            ranked = [
+                (object_ids[node], distance, PRIORITY_TYPES[priority])
+                for node, (distance, priority) in sorted(
+                    self._closure(root).items(),
+                    key=lambda item: (item[1], object_ids[item[0]].int),
+                )
+            ]
+            self._ranked[root] = ranked
+        else:
+            self.closures.move_to_end(root)
+
+        if max_depth is None:
+            return ranked
+        return ranked[: bisect_right(ranked, max_depth, key=lambda item: item[1])]
+
+    def add_edge(
+        self, source_id: UUID, target_id: UUID, type: RelationshipType
+    ) -> None:
+        changed, affected = self._link(source_id, target_id, type)
+
+        touched = [
+            (root, closure)
+            for root, closure in self.closures.items()
+            if root == changed or changed in closure
+        ]
+        if not touched:
+            return
+
+        downstream = self._compute(affected)
+        if len(downstream) > INCREMENTAL_MERGE_LIMIT:
+            for root, _ in touched:
+                self._drop(root)
+            return
+
+        for root, closure in touched:
+            distance = 0 if root == changed else closure[changed][0]
+            self._ranked.pop(root, None)
+            size = len(closure)
+            self._merge(
+                root, closure, affected, distance + 1, RELATIONSHIP_PRIORITY[type]
+            )
+            for node, (hops, priority) in downstream.items():
+                self._merge(root, closure, node, distance + 1 + hops, priority)
+            self.entries += len(closure) - size
+        self._evict()
+
+    def remove_edge(
+        self, source_id: UUID, target_id: UUID, type: RelationshipType
+    ) -> None:
+        changed, affected = impact_edge(source_id, target_id, type)
+        changed, affected = self._node_ids.get(changed), self._node_ids.get(affected)
+        priorities = self.affects.get(changed, {}).get(affected)
+        if not priorities or RELATIONSHIP_PRIORITY[type] not in priorities:
+            return
+        priorities.remove(RELATIONSHIP_PRIORITY[type])
+        if not priorities:
+            del self.affects[changed][affected]
+        self.edge_count -= 1
+
+        for root, closure in list(self.closures.items()):
+            if root == changed or changed in closure:
+                self._drop(root)
+
+    def _closure(self, root: int) -> Closure:
+        closure = self.closures.get(root)
+        if closure is None:
+            closure = self.closures[root] = self._compute(root)
+            self.entries += len(closure)
+            self._evict()
+        return closure
+
+    def _drop(self, root: int) -> None:
+        closure = self.closures.pop(root)
+        self._ranked.pop(root, None)
+        self.entries -= len(closure)
+
+    def _evict(self) -> None:
+        while self.entries > self.max_entries and len(self.closures) > 1:
+            self._drop(next(iter(self.closures)))
+
+    @staticmethod
+    def _merge(
+        root: int,
+        closure: Closure,
+        node: int,
+        distance: int,
+        priority: int,
+    ) -> None:
+        if node == root:
+            return
+        current = closure.get(node)
+        if current is None or (distance, priority) < current:
+            closure[node] = (distance, priority)
+
+    def _compute(self, root: int) -> Closure:
+        closure: Closure = {}
+        frontier = [root]
+        distance = 0
+        affects = self.affects
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for node in frontier:
+                neighbors = affects.get(node)
+                if not neighbors:
+                    continue
+                for affected, priorities in neighbors.items():
+                    priority = min(priorities)
+                    current = closure.get(affected)
+                    if current is None:
+                        if affected != root:
+                            closure[affected] = (distance, priority)
+                            next_frontier.append(affected)
+                    elif current[0] == distance and priority < current[1]:
+                        closure[affected] = (distance, priority)
+            frontier = next_frontier
+        return closure
+
+
+class ImpactService:
+    def __init__(self):
+        self._indexes = LRUCache(
+            maxsize=settings.IMPACT_INDEX_TENANTS,
+            ttl=settings.IMPACT_INDEX_TTL,
+        )
+        self.builds = 0
+        self.stale_rebuilds = 0
+        self.incremental_updates = 0
+        self.closure_hits = 0
+        self.closure_misses = 0
+
+    async def get_impact(
+        self,
+        db: AsyncSession,
+        *,
+        object_id: UUID,
+        tenant_id: str,
+        max_depth: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        index = await self._get_index(db, tenant_id)
+        if index.is_cached(object_id):
+            self.closure_hits += 1
+        else:
+            self.closure_misses += 1
+        ranked = index.ranked(object_id, max_depth)
+        page = ranked[skip : skip + limit]
+
+        objects = {}
+        if page:
+            result = await db.execute(
+                select(
+                    BusinessObjectModel.id,
+                    BusinessObjectModel.name,
+                    BusinessObjectModel.type,
+                ).where(
+                    BusinessObjectModel.id.in_([item[0] for item in page]),
+                    BusinessObjectModel.tenant_id == tenant_id,
+                )
+            )
+            objects = {row.id: row for row in result}
+
+        items = []
+        for affected_id, distance, via in page:
+            row = objects.get(affected_id)
+            items.append(
+                {
+                    "object_id": affected_id,
+                    "name": row.name if row else None,
+                    "object_type": row.type if row else None,
+                    "distance": distance,
+                    "relationship_type": via,
+                }
+            )
+        return {"object_id": object_id, "total": len(ranked), "items": items}
+
+    async def _get_index(self, db: AsyncSession, tenant_id: str) -> TenantImpactIndex:
+        version = await graph_version(db, tenant_id)
+        index = self._indexes.get(tenant_id)
+        if index is not None:
+            if index.version is None:
+                index.version = version
+            if index.version == version:
+                return index
+            self.stale_rebuilds += 1
+
+        edges = await db.execute(active_edges_statement(tenant_id))
+        edges = [tuple(row) for row in edges]
+
+        roots = await db.execute(
+            select(BusinessObjectModel.id).where(
+                BusinessObjectModel.tenant_id == tenant_id,
+                BusinessObjectModel.is_active == True,
+                BusinessObjectModel.type.in_(PRECOMPUTED_TYPES),
+            )
+        )
+        roots = list(roots.scalars())
+
+        index = await asyncio.to_thread(self._build, edges, roots)
+        index.version = version
+        self._indexes.set(tenant_id, index)
+        self.builds += 1
+        return index
+
+    @staticmethod
+    def _build(
+        edges: List[Tuple[UUID, UUID, RelationshipType]], roots: List[UUID]
+    ) -> TenantImpactIndex:
+        index = TenantImpactIndex(edges, settings.IMPACT_INDEX_MAX_ENTRIES)
+        index.precompute(
+            [object_id for object_id in roots if index.has_impact(object_id)],
+            settings.IMPACT_INDEX_PRECOMPUTE_LIMIT,
+        )
+        return index
+
+    def edge_added(
+        self,
+        tenant_id: str,
+        source_id: UUID,
+        target_id: UUID,
+        type: RelationshipType,
+    ) -> None:
+        index = self._indexes.get(tenant_id)
+        if index is not None:
+            index.add_edge(source_id, target_id, type)
+            index.version = None
+            self.incremental_updates += 1
+
+    def edge_removed(
+        self,
+        tenant_id: str,
+        source_id: UUID,
+        target_id: UUID,
+        type: RelationshipType,
+    ) -> None:
+        index = self._indexes.get(tenant_id)
+        if index is not None:
+            index.remove_edge(source_id, target_id, type)
+            index.version = None
+            self.incremental_updates += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._indexes.stats(),
+            "builds": self.builds,
+            "stale_rebuilds": self.stale_rebuilds,
+            "incremental_updates": self.incremental_updates,
+            "closure_hits": self.closure_hits,
+            "closure_misses": self.closure_misses,
+        }
+
+
+impact_service = ImpactService()
@@ -1,107 +1,492 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
 import httpx
-from azure.identity import OnBehalfOfCredential
+from azure.core.credentials import AccessToken
+from azure.identity.aio import ClientSecretCredential, OnBehalfOfCredential
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.services.graph_tokens import AppTokenCache, OnBehalfOfTokenCache
 
 logger = get_logger(__name__)
 
+RETRYABLE_STATUS_CODES = {429, 503}
+UNPROCESSED_STATUS_CODES = {429}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+GRAPH_BATCH_LIMIT = 20
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def split_batch_requests(
+    requests: List[Dict[str, Any]], limit: int = GRAPH_BATCH_LIMIT
+) -> List[List[Dict[str, Any]]]:
+    by_id = {request["id"]: request for request in requests}
+    if len(by_id) != len(requests):
+        raise ValueError("Batch request ids must be unique")
+
+    parent = {request_id: request_id for request_id in by_id}
+
+    def find(request_id: str) -> str:
+        while parent[request_id] != request_id:
+            parent[request_id] = parent[parent[request_id]]
+            request_id = parent[request_id]
+        return request_id
+
+    for request in requests:
+        for dependency in request.get("dependsOn", []):
+            if dependency not in by_id:
+                raise ValueError(
+                    f"Batch request '{request['id']}' depends on unknown request "
+                    f"'{dependency}'"
+                )
+            parent[find(request["id"])] = find(dependency)
+
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for request in requests:
+        groups.setdefault(find(request["id"]), []).append(request)
+
+    chunks: List[List[Dict[str, Any]]] = []
+    for group in groups.values():
+        if len(group) > limit:
+            raise ValueError(
+                f"A dependsOn chain of {len(group)} requests exceeds the batch "
+                f"limit of {limit}"
+            )
+        for chunk in chunks:
+            if len(chunk) + len(group) <= limit:
+                chunk.extend(group)
+                break
+        else:
+            chunks.append(list(group))
+    return chunks
+
+
+class GraphDeltaState:
+    def __init__(self, delta_link: Optional[str] = None):
+        self.delta_link = delta_link
+
 
 class MicrosoftGraphService:
-    def __init__(self):
-        self.base_url = "https://graph.microsoft.com/v1.0"
-        
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url or settings.MICROSOFT_GRAPH_BASE_URL
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self.token_cache = OnBehalfOfTokenCache(
+            maxsize=settings.GRAPH_TOKEN_CACHE_SIZE,
+            refresh_margin=settings.GRAPH_TOKEN_REFRESH_MARGIN,
+        )
+        self.app_token_cache = AppTokenCache(
+            refresh_margin=settings.GRAPH_TOKEN_REFRESH_MARGIN
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=settings.GRAPH_HTTP2,
+                transport=self._transport,
+                timeout=httpx.Timeout(
+                    settings.GRAPH_HTTP_TIMEOUT,
+                    connect=settings.GRAPH_CONNECT_TIMEOUT,
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.GRAPH_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GRAPH_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.GRAPH_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        access_token: str,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            **kwargs.pop("headers", {}),
+        }
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        retryable = RETRYABLE_STATUS_CODES if idempotent else UNPROCESSED_STATUS_CODES
+
+        attempt = 0
+        while True:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+            if (
+                response.status_code not in retryable
+                or attempt >= settings.GRAPH_MAX_RETRIES
+            ):
+                response.raise_for_status()
+                return response
+
+            delay = retry_after_seconds(response)
+            if delay is None:
+                delay = settings.GRAPH_RETRY_BACKOFF * 2**attempt
+                delay += random.uniform(0, delay / 2)
+            delay = min(delay, settings.GRAPH_RETRY_MAX_DELAY)
+
+            logger.warning(
+                f"Graph returned {response.status_code} for {method} {url}, "
+                f"retrying in {delay:.2f}s"
+            )
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def iter_collection(
+        self,
+        access_token: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        select: Optional[Sequence[str]] = None,
+        delta_state: Optional[GraphDeltaState] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        params = dict(params or {})
+        if select:
+            params["$select"] = ",".join(select)
+
+        async def fetch(
+            page_url: str, page_params: Optional[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            response = await self._request(
+                "GET", page_url, access_token, params=page_params
+            )
+            return response.json()
+
+        page = await fetch(url, params or None)
+        while True:
+            next_link = page.get("@odata.nextLink")
+            prefetch = (
+                asyncio.create_task(fetch(next_link, None)) if next_link else None
+            )
+            try:
+                for item in page.get("value", []):
+                    yield item
+            except BaseException:
+                if prefetch is not None:
+                    prefetch.cancel()
+                raise
+
+            if prefetch is None:
+                if delta_state is not None and "@odata.deltaLink" in page:
+                    delta_state.delta_link = page["@odata.deltaLink"]
+                return
+            page = await prefetch
+
+    def iter_user_files(
+        self,
+        access_token: str,
+        page_size: int = 200,
+        select: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_collection(
+            access_token,
+            f"{self.base_url}/me/drive/root/children",
+            params={"$top": page_size},
+            select=select,
+        )
+
+    def iter_calendar_events(
+        self,
+        access_token: str,
+        page_size: int = 50,
+        select: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_collection(
+            access_token,
+            f"{self.base_url}/me/events",
+            params={"$top": page_size, "$orderby": "start/dateTime"},
+            select=select,
+        )
+
+    def iter_drive_changes(
+        self,
+        access_token: str,
+        state: GraphDeltaState,
+        select: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if state.delta_link:
+            return self.iter_collection(
+                access_token, state.delta_link, delta_state=state
+            )
+        return self.iter_collection(
+            access_token,
+            f"{self.base_url}/me/drive/root/delta",
+            select=select,
+            delta_state=state,
+        )
+
+    def iter_calendar_changes(
+        self,
+        access_token: str,
+        state: GraphDeltaState,
+        start: datetime,
+        end: datetime,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if state.delta_link:
+            return self.iter_collection(
+                access_token, state.delta_link, delta_state=state
+            )
+        return self.iter_collection(
+            access_token,
+            f"{self.base_url}/me/calendarView/delta",
+            params={
+                "startDateTime": start.isoformat(),
+                "endDateTime": end.isoformat(),
+            },
+            delta_state=state,
+        )
+
+    async def batch(
+        self, access_token: str, requests: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        prepared = []
+        for index, request in enumerate(requests):
+            request = {"method": "GET", **request}
+            request["id"] = str(request.get("id", index))
+            if "dependsOn" in request:
+                request["dependsOn"] = [
+                    str(dependency) for dependency in request["dependsOn"]
+                ]
+            if "body" in request:
+                request["headers"] = {
+                    "Content-Type": "application/json",
+                    **request.get("headers", {}),
+                }
+            prepared.append(request)
+
+        semaphore = asyncio.Semaphore(settings.GRAPH_BATCH_CONCURRENCY)
+
+        async def send(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                response = await self._request(
+                    "POST",
+                    f"{self.base_url}/$batch",
+                    access_token,
+                    idempotent=all(
+                        request["method"] in IDEMPOTENT_METHODS for request in chunk
+                    ),
+                    json={"requests": chunk},
+                )
+                return response.json().get("responses", [])
+
+        chunk_responses = await asyncio.gather(
+            *(send(chunk) for chunk in split_batch_requests(prepared))
+        )
+
+        results = {}
+        for responses in chunk_responses:
+            for response in responses:
+                results[response["id"]] = response
+
+        for request in prepared:
+            if request["id"] not in results:
+                results[request["id"]] = {
+                    "id": request["id"],
+                    "status": 500,
+                    "body": {"error": {"code": "missingResponse"}},
+                }
+        return results
+
     async def get_access_token(self, user_token: str) -> str:
-        if not all([settings.AZURE_TENANT_ID, settings.AZURE_CLIENT_ID, settings.AZURE_CLIENT_SECRET]):
+        if not all(
+            [
+                settings.AZURE_TENANT_ID,
+                settings.AZURE_CLIENT_ID,
+                settings.AZURE_CLIENT_SECRET,
+            ]
+        ):
+            raise ValueError("Azure configuration is incomplete")
+
+        return await self.token_cache.get_token(
+            user_token, settings.MICROSOFT_GRAPH_SCOPE, self._exchange_token
+        )
+
+    async def get_app_access_token(self) -> str:
+        if not all(
+            [
+                settings.AZURE_TENANT_ID,
+                settings.AZURE_CLIENT_ID,
+                settings.AZURE_CLIENT_SECRET,
+            ]
+        ):
             raise ValueError("Azure configuration is incomplete")
-            
+
+        return await self.app_token_cache.get_token(
+            settings.MICROSOFT_GRAPH_SCOPE, self._app_token
+        )
+
+    async def _app_token(self, scope: str) -> AccessToken:
+        credential = ClientSecretCredential(
+            tenant_id=settings.AZURE_TENANT_ID,
+            client_id=settings.AZURE_CLIENT_ID,
+            client_secret=settings.AZURE_CLIENT_SECRET,
+        )
+
+        async with credential:
+            return await credential.get_token(scope)
+
+    async def _exchange_token(self, user_token: str, scope: str) -> AccessToken:
         credential = OnBehalfOfCredential(
             tenant_id=settings.AZURE_TENANT_ID,
             client_id=settings.AZURE_CLIENT_ID,
             client_secret=settings.AZURE_CLIENT_SECRET,
             user_assertion=user_token,
         )
-        
-        token = await credential.get_token(settings.MICROSOFT_GRAPH_SCOPE)
-        return token.token
+
+        async with credential:
+            return await credential.get_token(scope)
 
     async def get_user_profile(self, access_token: str) -> Dict[str, Any]:
-        headers = {"Authorization": f"Bearer {access_token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.base_url}/me", headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("GET", f"{self.base_url}/me", access_token)
+        return response.json()
 
     async def get_user_files(
         self, access_token: str, limit: int = 10
     ) -> List[Dict[str, Any]]:
-        headers = {"Authorization": f"Bearer {access_token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/me/drive/root/children",
-                headers=headers,
-                params={"$top": limit}
-            )
-            response.raise_for_status()
-            return response.json().get("value", [])
+        response = await self._request(
+            "GET",
+            f"{self.base_url}/me/drive/root/children",
+            access_token,
+            params={"$top": limit},
+        )
+        return response.json().get("value", [])
 
     async def send_teams_message(
         self, access_token: str, team_id: str, channel_id: str, message: str
     ) -> Dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "body": {
-                "content": message,
-                "contentType": "text"
-            }
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        payload = {"body": {"content": message, "contentType": "text"}}
+
+        response = await self._request(
+            "POST",
+            f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages",
+            access_token,
+            json=payload,
+        )
+        return response.json()
 
     async def create_sharepoint_item(
         self, access_token: str, site_id: str, list_id: str, item_data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/sites/{site_id}/lists/{list_id}/items",
-                headers=headers,
-                json={"fields": item_data}
+        response = await self._request(
+            "POST",
+            f"{self.base_url}/sites/{site_id}/lists/{list_id}/items",
+            access_token,
+            json={"fields": item_data},
+        )
+        return response.json()
+
+    async def create_sharepoint_items(
+        self,
+        access_token: str,
+        site_id: str,
+        list_id: str,
+        items: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        responses = await self.batch(
+            access_token,
+            [
+                {
+                    "id": str(index),
+                    "method": "POST",
+                    "url": f"/sites/{site_id}/lists/{list_id}/items",
+                    "body": {"fields": item_data},
+                }
+                for index, item_data in enumerate(items)
+            ],
+        )
+        return [responses[str(index)] for index in range(len(items))]
+
+    async def get_dashboard_data(
+        self, access_token: str, limit: int = 10
+    ) -> Dict[str, Any]:
+        responses = await self.batch(
+            access_token,
+            [
+                {"id": "profile", "url": "/me"},
+                {"id": "files", "url": f"/me/drive/root/children?$top={limit}"},
+                {
+                    "id": "events",
+                    "url": f"/me/events?$top={limit}&$orderby=start/dateTime",
+                },
+            ],
+        )
+
+        data: Dict[str, Any] = {"errors": {}}
+        for key, response in responses.items():
+            body = response.get("body") or {}
+            if response["status"] >= 400:
+                data[key] = None
+                data["errors"][key] = body.get("error", {"status": response["status"]})
+            else:
+                data[key] = body if key == "profile" else body.get("value", [])
+        return data
+
+    async def put_external_item(
+        self, access_token: str, connection_id: str, item: Dict[str, Any]
+    ) -> None:
+        body = {key: value for key, value in item.items() if key != "id"}
+        await self._request(
+            "PUT",
+            f"{self.base_url}/external/connections/{connection_id}/items/{item['id']}",
+            access_token,
+            json=body,
+        )
+
+    async def delete_external_item(
+        self, access_token: str, connection_id: str, item_id: str
+    ) -> None:
+        try:
+            await self._request(
+                "DELETE",
+                f"{self.base_url}/external/connections/{connection_id}/items/{item_id}",
+                access_token,
             )
-            response.raise_for_status()
-            return response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
 
     async def get_calendar_events(
         self, access_token: str, limit: int = 10
     ) -> List[Dict[str, Any]]:
-        headers = {"Authorization": f"Bearer {access_token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/me/events",
-                headers=headers,
-                params={"$top": limit, "$orderby": "start/dateTime"}
-            )
-            response.raise_for_status()
-            return response.json().get("value", [])
+        response = await self._request(
+            "GET",
+            f"{self.base_url}/me/events",
+            access_token,
+            params={"$top": limit, "$orderby": "start/dateTime"},
+        )
+        return response.json().get("value", [])
 
 
 microsoft_graph_service = MicrosoftGraphService()
@@ -0,0 +1,297 @@
+import asyncio
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, literal, or_, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.relationship import Relationship as RelationshipModel
+from app.models.relationship import RelationshipType
+from app.schemas.relationship import RelationshipCreate
+from app.services.impact import (
+    SourceObject,
+    TargetObject,
+    active_edges_statement,
+    graph_version,
+    impact_service,
+)
+
+DOWNSTREAM = "downstream"
+UPSTREAM = "upstream"
+DIRECTIONS = (DOWNSTREAM, UPSTREAM)
+
+Edge = Tuple[UUID, UUID, RelationshipType]
+
+
+class RelationshipAdjacency:
+    def __init__(self, edges: Iterable[Edge]):
+        self.outgoing: Dict[UUID, List[Edge]] = defaultdict(list)
+        self.incoming: Dict[UUID, List[Edge]] = defaultdict(list)
+        self.edge_count = 0
+        for edge in edges:
+            self.add(edge)
+
+    def add(self, edge: Edge) -> None:
+        self.outgoing[edge[0]].append(edge)
+        self.incoming[edge[1]].append(edge)
+        self.edge_count += 1
+
+    def walk(
+        self,
+        object_id: UUID,
+        direction: str,
+        max_depth: int,
+        types: Optional[Set[RelationshipType]] = None,
+    ) -> List[Tuple[UUID, UUID, RelationshipType, int]]:
+        index = self.outgoing if direction == DOWNSTREAM else self.incoming
+        far = 1 if direction == DOWNSTREAM else 0
+        visited = {object_id}
+        frontier = deque([(object_id, 0)])
+        edges = []
+        while frontier:
+            node, depth = frontier.popleft()
+            if depth >= max_depth:
+                continue
+            for edge in index.get(node, ()):
+                if types and edge[2] not in types:
+                    continue
+                edges.append((edge[0], edge[1], edge[2], depth + 1))
+                neighbor = edge[far]
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    frontier.append((neighbor, depth + 1))
+        return edges
+
+
+def graph_result(
+    object_id: UUID,
+    direction: str,
+    max_depth: int,
+    edges: Sequence[Tuple[UUID, UUID, RelationshipType, int]],
+) -> Dict[str, Any]:
+    far = 1 if direction == DOWNSTREAM else 0
+    depths: Dict[UUID, int] = {}
+    for edge in edges:
+        node = edge[far]
+        if node != object_id and edge[3] < depths.get(node, max_depth + 1):
+            depths[node] = edge[3]
+
+    return {
+        "object_id": object_id,
+        "direction": direction,
+        "max_depth": max_depth,
+        "nodes": [
+            {"object_id": node, "depth": depth}
+            for node, depth in sorted(depths.items(), key=lambda item: item[1])
+        ],
+        "edges": [
+            {
+                "source_id": source_id,
+                "target_id": target_id,
+                "type": type,
+                "depth": depth,
+            }
+            for source_id, target_id, type, depth in sorted(
+                edges, key=lambda edge: edge[3]
+            )
+        ],
+    }
+
+
+class RelationshipService:
+    def __init__(self):
+        self._adjacency = LRUCache(
+            maxsize=settings.RELATIONSHIP_GRAPH_CACHE_TENANTS,
+            ttl=settings.RELATIONSHIP_GRAPH_CACHE_TTL,
+        )
+        self.cte_traversals = 0
+        self.cached_traversals = 0
+        self.stale_rebuilds = 0
+
+    async def get(
+        self, db: AsyncSession, *, id: UUID, tenant_id: str
+    ) -> Optional[RelationshipModel]:
+        result = await db.execute(
+            select(RelationshipModel).where(
+                RelationshipModel.id == id,
+                RelationshipModel.tenant_id == tenant_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_object(
+        self, db: AsyncSession, *, object_id: UUID, tenant_id: str
+    ) -> List[RelationshipModel]:
+        result = await db.execute(
+            select(RelationshipModel)
+            .where(
+                or_(
+                    RelationshipModel.source_id == object_id,
+                    RelationshipModel.target_id == object_id,
+                ),
+                RelationshipModel.tenant_id == tenant_id,
+            )
+            .order_by(RelationshipModel.created_at.desc())
+        )
+        return result.scalars().all()
+
+    async def create(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: RelationshipCreate,
+        tenant_id: str,
+        created_by: str,
+    ) -> RelationshipModel:
+        if obj_in.source_id == obj_in.target_id:
+            raise ValueError("An object cannot be related to itself")
+
+        db_obj = RelationshipModel(
+            **obj_in.model_dump(),
+            tenant_id=tenant_id,
+            created_by=created_by,
+        )
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        self.invalidate(tenant_id)
+        impact_service.edge_added(
+            tenant_id, db_obj.source_id, db_obj.target_id, db_obj.type
+        )
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, db_obj: RelationshipModel) -> None:
+        await db.delete(db_obj)
+        await db.commit()
+        self.invalidate(db_obj.tenant_id)
+        impact_service.edge_removed(
+            db_obj.tenant_id, db_obj.source_id, db_obj.target_id, db_obj.type
+        )
+
+    def invalidate(self, tenant_id: str) -> None:
+        self._adjacency.pop(tenant_id)
+
+    async def get_graph(
+        self,
+        db: AsyncSession,
+        *,
+        object_id: UUID,
+        tenant_id: str,
+        direction: str = DOWNSTREAM,
+        max_depth: int = 3,
+        types: Optional[Sequence[RelationshipType]] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Invalid direction: {direction}")
+        if not 1 <= max_depth <= settings.RELATIONSHIP_GRAPH_MAX_DEPTH:
+            raise ValueError(
+                "max_depth must be between 1 and "
+                f"{settings.RELATIONSHIP_GRAPH_MAX_DEPTH}"
+            )
+
+        adjacency = await self._get_adjacency(db, tenant_id) if use_cache else None
+        if adjacency:
+            self.cached_traversals += 1
+            edges = adjacency.walk(
+                object_id, direction, max_depth, set(types) if types else None
+            )
+        else:
+            self.cte_traversals += 1
+            edges = await self._walk_cte(
+                db,
+                object_id=object_id,
+                tenant_id=tenant_id,
+                direction=direction,
+                max_depth=max_depth,
+                types=types,
+            )
+        return graph_result(object_id, direction, max_depth, edges)
+
+    async def _get_adjacency(
+        self, db: AsyncSession, tenant_id: str
+    ) -> Optional[RelationshipAdjacency]:
+        version = await graph_version(db, tenant_id)
+        entry = self._adjacency.get(tenant_id)
+        if entry is not None:
+            if entry[0] == version:
+                return entry[1]
+            self.stale_rebuilds += 1
+
+        limit = settings.RELATIONSHIP_GRAPH_CACHE_MAX_EDGES
+        result = await db.execute(active_edges_statement(tenant_id).limit(limit + 1))
+        rows = [tuple(row) for row in result]
+        adjacency = None
+        if len(rows) <= limit:
+            adjacency = await asyncio.to_thread(RelationshipAdjacency, rows)
+        self._adjacency.set(tenant_id, (version, adjacency))
+        return adjacency
+
+    async def _walk_cte(
+        self,
+        db: AsyncSession,
+        *,
+        object_id: UUID,
+        tenant_id: str,
+        direction: str,
+        max_depth: int,
+        types: Optional[Sequence[RelationshipType]],
+    ) -> List[Tuple[UUID, UUID, RelationshipType, int]]:
+        if direction == DOWNSTREAM:
+            near, far = RelationshipModel.source_id, RelationshipModel.target_id
+        else:
+            near, far = RelationshipModel.target_id, RelationshipModel.source_id
+
+        filters = [
+            RelationshipModel.tenant_id == tenant_id,
+            SourceObject.is_active == True,
+            TargetObject.is_active == True,
+        ]
+        if types:
+            filters.append(RelationshipModel.type.in_(types))
+
+        reach = select(
+            literal(object_id, PG_UUID(as_uuid=True)).label("object_id"),
+            literal(0).label("depth"),
+        ).cte("reach", recursive=True)
+        reach = reach.union(
+            select(far, reach.c.depth + 1)
+            .join_from(reach, RelationshipModel, near == reach.c.object_id)
+            .join(SourceObject, SourceObject.id == RelationshipModel.source_id)
+            .join(TargetObject, TargetObject.id == RelationshipModel.target_id)
+            .where(*filters, reach.c.depth < max_depth)
+        )
+        nodes = (
+            select(reach.c.object_id, func.min(reach.c.depth).label("depth"))
+            .group_by(reach.c.object_id)
+            .cte("nodes")
+        )
+
+        result = await db.execute(
+            select(
+                RelationshipModel.source_id,
+                RelationshipModel.target_id,
+                RelationshipModel.type,
+                nodes.c.depth + 1,
+            )
+            .join_from(nodes, RelationshipModel, near == nodes.c.object_id)
+            .join(SourceObject, SourceObject.id == RelationshipModel.source_id)
+            .join(TargetObject, TargetObject.id == RelationshipModel.target_id)
+            .where(*filters, nodes.c.depth < max_depth)
+        )
+        return [tuple(row) for row in result]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._adjacency.stats(),
+            "cached_traversals": self.cached_traversals,
+            "cte_traversals": self.cte_traversals,
+            "stale_rebuilds": self.stale_rebuilds,
+        }
+
+
+relationship_service = RelationshipService()
@@ -0,0 +1,130 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.services.analysis import analysis_service
+
+SEED_OBJECTS_SQL = text("""
+    INSERT INTO business_objects (
+        id, name, type, tenant_id, created_by, created_at, updated_at, is_active
+    )
+    SELECT gen_random_uuid(), 'Dashboard object ' || g, 'WORKFLOW'::objecttype,
+           :tenant_id, 'benchmark', now(), now(), true
+    FROM generate_series(1, :objects) AS g
+    """)
+
+SEED_ANALYSES_SQL = text("""
+    INSERT INTO analyses (
+        id, business_object_id, analysis_type, summary, confidence_score,
+        tenant_id, created_by, created_at
+    )
+    SELECT gen_random_uuid(), o.id, 'ai_analysis', 'Synthetic analysis ' || g, random(),
+           o.tenant_id, 'benchmark', now() - g * interval '1 minute'
+    FROM business_objects o CROSS JOIN generate_series(1, :per_object) AS g
+    WHERE o.tenant_id = :tenant_id
+    """)
+
+CLEANUP_SQL = [
+    text("DELETE FROM analyses WHERE tenant_id = :tenant_id"),
+    text("DELETE FROM business_objects WHERE tenant_id = :tenant_id"),
+]
+
+
+async def measure(run: Callable[[], Awaitable[None]], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def summarize(timings: List[float]) -> str:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return f"p50={statistics.median(timings):8.2f}ms p95={p95:8.2f}ms"
+
+
+async def run_benchmark(
+    database_url: str, pages: List[int], per_object: int, latest: int, iterations: int
+) -> None:
+    engine = create_async_engine(database_url)
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    tenant_id = "bench-analysis-batch"
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in CLEANUP_SQL:
+            await conn.execute(statement, {"tenant_id": tenant_id})
+        await conn.execute(
+            SEED_OBJECTS_SQL, {"tenant_id": tenant_id, "objects": max(pages)}
+        )
+        await conn.execute(
+            SEED_ANALYSES_SQL, {"tenant_id": tenant_id, "per_object": per_object}
+        )
+        await conn.execute(text("ANALYZE analyses"))
+
+    async with Session() as db:
+        result = await db.execute(
+            select(BusinessObjectModel.id).where(
+                BusinessObjectModel.tenant_id == tenant_id
+            )
+        )
+        object_ids = result.scalars().all()
+
+        for page in pages:
+            ids = object_ids[:page]
+
+            async def n_plus_one() -> None:
+                for object_id in ids:
+                    analyses = await analysis_service.get_by_object(
+                        db, object_id=object_id, tenant_id=tenant_id, as_rows=True
+                    )
+                    analyses[:latest]
+
+            async def batched() -> None:
+                await analysis_service.get_latest_for_objects(
+                    db, object_ids=ids, tenant_id=tenant_id, per_object=latest
+                )
+
+            print(
+                f"{page:>4} objects x {per_object} analyses, latest {latest}  "
+                f"n+1 {summarize(await measure(n_plus_one, iterations))}  "
+                f"batched {summarize(await measure(batched, iterations))}"
+            )
+
+    async with engine.begin() as conn:
+        for statement in CLEANUP_SQL:
+            await conn.execute(statement, {"tenant_id": tenant_id})
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Latest analyses per object: N+1 vs. batched"
+    )
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--per-object", type=int, default=20)
+    parser.add_argument("--latest", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(
+        run_benchmark(
+            args.database_url, args.pages, args.per_object, args.latest, args.iterations
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
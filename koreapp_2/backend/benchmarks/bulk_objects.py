@@ -0,0 +1,152 @@
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.models.business_object import ObjectType
+from app.schemas.business_object import BusinessObjectCreate, BusinessObjectUpdate
+from app.services.business_object import business_object_service
+
+CLEANUP_SQL = text("DELETE FROM business_objects WHERE tenant_id = :tenant_id")
+
+OBJECT_TYPES = list(ObjectType)
+
+
+def objects_in(size: int, prefix: str) -> List[BusinessObjectCreate]:
+    return [
+        BusinessObjectCreate(
+            name=f"{prefix} object {i}",
+            type=OBJECT_TYPES[i % len(OBJECT_TYPES)],
+            description=f"Synthetic business object {i}",
+            tags="bulk,benchmark",
+        )
+        for i in range(size)
+    ]
+
+
+def updates_in(size: int) -> List[BusinessObjectUpdate]:
+    return [
+        BusinessObjectUpdate(status="active", owner=f"owner-{i % 10}")
+        for i in range(size)
+    ]
+
+
+async def timed(run: Callable[[], Awaitable[None]]) -> float:
+    started = time.perf_counter()
+    await run()
+    return time.perf_counter() - started
+
+
+def report(operation: str, size: int, per_row: float, bulk: float) -> None:
+    print(
+        f"{operation:<7} {size:>6} rows  per-row {size / per_row:9.0f} rows/s  "
+        f"bulk {size / bulk:9.0f} rows/s  x{per_row / bulk:6.1f}"
+    )
+
+
+async def run_benchmark(database_url: str, sizes: List[int]) -> None:
+    engine = create_async_engine(database_url)
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    for size in sizes:
+        single_tenant = f"bench-bulk-single-{size}"
+        bulk_tenant = f"bench-bulk-{size}"
+        async with engine.begin() as conn:
+            for tenant_id in (single_tenant, bulk_tenant):
+                await conn.execute(CLEANUP_SQL, {"tenant_id": tenant_id})
+
+        async with Session() as db:
+
+            async def create_per_row() -> None:
+                for obj_in in objects_in(size, "single"):
+                    await business_object_service.create(
+                        db,
+                        obj_in=obj_in,
+                        tenant_id=single_tenant,
+                        created_by="benchmark",
+                    )
+
+            async def create_bulk() -> None:
+                await business_object_service.bulk_create(
+                    db,
+                    objs_in=objects_in(size, "bulk"),
+                    tenant_id=bulk_tenant,
+                    created_by="benchmark",
+                )
+
+            report(
+                "create", size, await timed(create_per_row), await timed(create_bulk)
+            )
+
+            result = await db.execute(
+                select(BusinessObjectModel).where(
+                    BusinessObjectModel.tenant_id == single_tenant
+                )
+            )
+            single_objects = result.scalars().all()
+            result = await db.execute(
+                select(BusinessObjectModel.id).where(
+                    BusinessObjectModel.tenant_id == bulk_tenant
+                )
+            )
+            bulk_ids = result.scalars().all()
+
+            async def update_per_row() -> None:
+                for db_obj, obj_in in zip(single_objects, updates_in(size)):
+                    await business_object_service.update(
+                        db, db_obj=db_obj, obj_in=obj_in
+                    )
+
+            async def update_bulk() -> None:
+                await business_object_service.bulk_update(
+                    db,
+                    items=list(zip(bulk_ids, updates_in(size))),
+                    tenant_id=bulk_tenant,
+                )
+
+            report(
+                "update", size, await timed(update_per_row), await timed(update_bulk)
+            )
+
+            async def remove_per_row() -> None:
+                for db_obj in single_objects:
+                    await business_object_service.remove(db, id=db_obj.id)
+
+            async def remove_bulk() -> None:
+                await business_object_service.bulk_remove(
+                    db, ids=bulk_ids, tenant_id=bulk_tenant
+                )
+
+            report(
+                "delete", size, await timed(remove_per_row), await timed(remove_bulk)
+            )
+
+        async with engine.begin() as conn:
+            for tenant_id in (single_tenant, bulk_tenant):
+                await conn.execute(CLEANUP_SQL, {"tenant_id": tenant_id})
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-row vs. bulk business object writes"
+    )
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.database_url, args.sizes))
+
+
+if __name__ == "__main__":
+    main()
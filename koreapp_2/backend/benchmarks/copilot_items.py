@@ -0,0 +1,91 @@
+import argparse
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, List
+from uuid import uuid4
+
+import app.db.base
+from app.ai.copilot_integration import (
+    CopilotConnectorSchema,
+    copilot_integration_service,
+    iter_external_items,
+)
+
+BASE_URL = "https://benchmark.local"
+
+
+def make_objects(count: int, tenants: int) -> List[SimpleNamespace]:
+    now = datetime.utcnow()
+    return [
+        SimpleNamespace(
+            id=uuid4(),
+            name=f"Object {i}",
+            description=f"Benchmark business object {i}",
+            type="process",
+            complexity="medium",
+            status="active",
+            owner="owner@benchmark.local",
+            updated_at=now,
+            tags="finance,reporting,quarterly" if i % 2 else "operations,planning",
+            created_by="benchmark-user",
+            tenant_id=f"tenant-{i % tenants}",
+        )
+        for i in range(count)
+    ]
+
+
+def rate(label: str, count: int, call: Callable[[], None], unit: str) -> None:
+    started = time.perf_counter()
+    call()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {count / elapsed:12,.0f} {unit}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Copilot item conversion throughput")
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    objects = make_objects(args.items, args.tenants)
+
+    rate(
+        "create_external_item",
+        args.items,
+        lambda: [
+            CopilotConnectorSchema.create_external_item(obj, BASE_URL)
+            for obj in objects
+        ],
+        "items",
+    )
+    rate(
+        "iter_external_items",
+        args.items,
+        lambda: list(iter_external_items(objects, BASE_URL)),
+        "items",
+    )
+    rate(
+        "openapi spec rendered",
+        args.requests,
+        lambda: [
+            json.dumps(copilot_integration_service.get_openapi_spec(BASE_URL)).encode()
+            for _ in range(args.requests)
+        ],
+        "requests",
+    )
+    rate(
+        "openapi spec cached",
+        args.requests,
+        lambda: [
+            copilot_integration_service.openapi_document(BASE_URL).body
+            for _ in range(args.requests)
+        ],
+        "requests",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import socket
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from app.services.microsoft_graph import MicrosoftGraphService
+
+stub_graph = FastAPI()
+
+
+@stub_graph.get("/v1.0/me")
+async def me():
+    return {"id": "benchmark-user", "displayName": "Benchmark User"}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def measure(
+    call: Callable[[], Awaitable[None]], calls: int, concurrency: int
+) -> List[float]:
+    timings: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            timings.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(timed() for _ in range(calls)))
+    return sorted(timings)
+
+
+def summarize(label: str, timings: List[float]) -> str:
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    return (
+        f"{label:<22} mean={statistics.mean(timings):7.2f}ms "
+        f"p50={statistics.median(timings):7.2f}ms p99={p99:7.2f}ms"
+    )
+
+
+async def run_benchmark(calls: int, concurrency: int) -> None:
+    port = free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(stub_graph, host="127.0.0.1", port=port, log_level="error")
+    )
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{port}/v1.0"
+
+    async def client_per_call() -> None:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{base_url}/me", headers={"Authorization": "Bearer benchmark"}
+            )
+            response.raise_for_status()
+            response.json()
+
+    service = MicrosoftGraphService(base_url=base_url)
+
+    async def pooled_client() -> None:
+        await service.get_user_profile("benchmark")
+
+    await client_per_call()
+    await pooled_client()
+
+    print(f"{calls} calls, concurrency {concurrency}")
+    print(
+        summarize("client per call", await measure(client_per_call, calls, concurrency))
+    )
+    print(
+        summarize(
+            "shared pooled client", await measure(pooled_client, calls, concurrency)
+        )
+    )
+
+    await service.aclose()
+    server.should_exit = True
+    await serve_task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Graph client per-call latency")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.calls, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
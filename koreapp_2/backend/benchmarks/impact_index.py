@@ -0,0 +1,89 @@
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, List
+from uuid import uuid4
+
+import app.db.base
+from app.models.relationship import RelationshipType
+from app.services.impact import TenantImpactIndex
+
+
+def measure(run: Callable[[], None], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def summarize(timings: List[float]) -> str:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return f"p50={statistics.median(timings):8.3f}ms p95={p95:8.3f}ms"
+
+
+def make_edges(objects: List, edges: int, rng: random.Random) -> List:
+    types = list(RelationshipType)
+    return [(*rng.sample(objects, 2), rng.choice(types)) for _ in range(edges)]
+
+
+def run(edges: int, fanout: float, roots: int, iterations: int) -> None:
+    rng = random.Random(42)
+    objects = [uuid4() for _ in range(max(int(edges / fanout), 2))]
+    graph = make_edges(objects, edges, rng)
+
+    started = time.perf_counter()
+    index = TenantImpactIndex(graph, max_entries=50_000_000)
+    build = (time.perf_counter() - started) * 1000
+
+    precomputed = rng.sample(objects, roots)
+    started = time.perf_counter()
+    for object_id in precomputed:
+        index.ranked(object_id)
+    precompute = (time.perf_counter() - started) * 1000
+    average = index.entries / max(len(index.closures), 1)
+
+    print(
+        f"fanout {fanout}: {edges} edges, {len(objects)} objects; build {build:.0f}ms, "
+        f"precompute {roots} closures {precompute:.0f}ms (~{average:.0f} affected each)"
+    )
+
+    picks = iter(precomputed * iterations)
+    lookups = measure(lambda: index.ranked(next(picks))[:100], iterations)
+    print(f"  precomputed lookup   {summarize(lookups)}")
+
+    cold = iter(rng.sample(objects, iterations))
+    closures = measure(lambda: index.ranked(next(cold))[:100], iterations)
+    print(f"  on-demand closure    {summarize(closures)}")
+
+    added = []
+
+    def add_edge() -> None:
+        edge = make_edges(objects, 1, rng)[0]
+        added.append(edge)
+        index.add_edge(*edge)
+
+    print(f"  incremental add      {summarize(measure(add_edge, iterations))}")
+    removals = iter(list(added))
+    removes = measure(lambda: index.remove_edge(*next(removals)), iterations)
+    print(f"  incremental remove   {summarize(removes)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Impact index build, lookup and update latency"
+    )
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--fanouts", type=float, nargs="+", default=[0.8, 1.5, 5])
+    parser.add_argument("--roots", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    for fanout in args.fanouts:
+        run(args.edges, fanout, args.roots, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
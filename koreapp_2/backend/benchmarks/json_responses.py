@@ -0,0 +1,133 @@
+import argparse
+import statistics
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+import app.db.base
+from app.models.business_object import ComplexityLevel, ObjectStatus, ObjectType
+from app.schemas.analysis import Analysis
+from app.schemas.business_object import BusinessObjectList
+
+
+def make_object_rows(count: int) -> List[Dict[str, Any]]:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": uuid4(),
+            "name": f"Object {i}",
+            "type": ObjectType.WORKFLOW,
+            "description": f"Benchmark business object {i} " * 8,
+            "status": ObjectStatus.ACTIVE,
+            "complexity": ComplexityLevel.MEDIUM,
+            "owner": "owner@benchmark.local",
+            "tags": "finance,reporting,quarterly",
+            "tenant_id": "benchmark-tenant",
+            "created_by": "benchmark-user",
+            "created_at": now,
+            "updated_at": now,
+            "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+
+def make_analysis_rows(count: int) -> List[Dict[str, Any]]:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": uuid4(),
+            "business_object_id": uuid4(),
+            "analysis_type": "ai_analysis",
+            "summary": "Benchmark analysis summary " * 10,
+            "insights": [{"text": f"Insight {j}", "score": j / 10} for j in range(20)],
+            "recommendations": [{"text": f"Recommendation {j}"} for j in range(10)],
+            "confidence_score": 0.87,
+            "metrics": {
+                "agent_results": {
+                    agent: {
+                        "status": "completed",
+                        "findings": [f"{agent} {j}" for j in range(10)],
+                    }
+                    for agent in (
+                        "planner",
+                        "db_architect",
+                        "backend_engineer",
+                        "qa_tester",
+                    )
+                }
+            },
+            "tenant_id": "benchmark-tenant",
+            "created_by": "benchmark-user",
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(render: Callable[[], bytes], iterations: int) -> List[float]:
+    render()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - started) * 1000)
+    return sorted(timings)
+
+
+def summarize(label: str, timings: List[float]) -> str:
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    return (
+        f"  {label:<26} {1000 / statistics.mean(timings):9,.0f} pages/s "
+        f"p50={statistics.median(timings):7.3f}ms p99={p99:7.3f}ms"
+    )
+
+
+def run(page_size: int, iterations: int) -> None:
+    object_rows = make_object_rows(page_size)
+    objects = [SimpleNamespace(**row) for row in object_rows]
+    page = {"total": 10000, "page": 1, "size": page_size, "pages": 10000 // page_size}
+
+    def objects_validated() -> bytes:
+        validated = BusinessObjectList(items=objects, **page)
+        content = BusinessObjectList.model_validate(validated)
+        return JSONResponse(jsonable_encoder(content)).body
+
+    def objects_fast() -> bytes:
+        return ORJSONResponse({"items": object_rows, "next_cursor": None, **page}).body
+
+    analysis_rows = make_analysis_rows(page_size)
+    analyses = [SimpleNamespace(**row) for row in analysis_rows]
+
+    def analyses_validated() -> bytes:
+        content = [Analysis.model_validate(analysis) for analysis in analyses]
+        return JSONResponse(jsonable_encoder(content)).body
+
+    def analyses_fast() -> bytes:
+        return ORJSONResponse(analysis_rows).body
+
+    print(f"page size {page_size}")
+    print(summarize("objects validated", measure(objects_validated, iterations)))
+    print(summarize("objects fast", measure(objects_fast, iterations)))
+    print(summarize("analyses validated", measure(analyses_validated, iterations)))
+    print(summarize("analyses fast", measure(analyses_fast, iterations)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Validated vs fast JSON list responses"
+    )
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    for page_size in args.page_sizes:
+        run(page_size, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.services.relationship import DOWNSTREAM, UPSTREAM, RelationshipService
+
+SEED_OBJECTS_SQL = text("""
+    INSERT INTO business_objects (
+        id, name, type, tenant_id, created_by, created_at, updated_at, is_active
+    )
+    SELECT
+        gen_random_uuid(),
+        'Graph object ' || g,
+        (ARRAY['WORKFLOW', 'DATA_OBJECT', 'PROCESS', 'INTEGRATION',
+               'REPORT'])[1 + g % 5]::objecttype,
+        :tenant_id,
+        'benchmark',
+        now(),
+        now(),
+        true
+    FROM generate_series(1, :size) AS g
+    """)
+
+SEED_EDGES_SQL = text("""
+    WITH numbered AS (
+        SELECT id, row_number() OVER (ORDER BY id) AS n
+        FROM business_objects
+        WHERE tenant_id = :tenant_id
+    )
+    INSERT INTO relationships (id, source_id, target_id, type, tenant_id, created_by)
+    SELECT
+        gen_random_uuid(),
+        s.id,
+        t.id,
+        (ARRAY['DEPENDS_ON', 'TRIGGERS', 'CONTAINS', 'USES',
+               'PRODUCES'])[1 + g % 5]::relationshiptype,
+        :tenant_id,
+        'benchmark'
+    FROM (
+        SELECT
+            g,
+            1 + floor(random() * :size)::int AS source_n,
+            1 + floor(random() * :size)::int AS target_n
+        FROM generate_series(1, :edges) AS g
+    ) AS pairs
+    JOIN numbered s ON s.n = pairs.source_n
+    JOIN numbered t ON t.n = pairs.target_n
+    WHERE s.id <> t.id
+    """)
+
+CLEANUP_SQL = [
+    text("DELETE FROM relationships WHERE tenant_id = :tenant_id"),
+    text("DELETE FROM business_objects WHERE tenant_id = :tenant_id"),
+]
+
+
+async def measure(run: Callable[[], Awaitable[None]], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def summarize(timings: List[float]) -> str:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return f"p50={statistics.median(timings):8.2f}ms p95={p95:8.2f}ms"
+
+
+async def run_benchmark(
+    database_url: str, edges: int, fanout: int, depths: List[int], iterations: int
+) -> None:
+    engine = create_async_engine(database_url)
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    tenant_id = f"bench-graph-{edges}"
+    size = max(edges // fanout, 2)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in CLEANUP_SQL:
+            await conn.execute(statement, {"tenant_id": tenant_id})
+        await conn.execute(SEED_OBJECTS_SQL, {"tenant_id": tenant_id, "size": size})
+        await conn.execute(
+            SEED_EDGES_SQL, {"tenant_id": tenant_id, "size": size, "edges": edges}
+        )
+        await conn.execute(text("ANALYZE business_objects"))
+        await conn.execute(text("ANALYZE relationships"))
+
+    service = RelationshipService()
+    async with Session() as db:
+        result = await db.execute(
+            select(BusinessObjectModel.id).where(
+                BusinessObjectModel.tenant_id == tenant_id
+            )
+        )
+        roots = random.Random(42).sample(result.scalars().all(), iterations)
+
+        started = time.perf_counter()
+        await service.get_graph(db, object_id=roots[0], tenant_id=tenant_id)
+        print(
+            f"{edges} edges, {size} objects; adjacency cache load "
+            f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+
+        for direction in (DOWNSTREAM, UPSTREAM):
+            for depth in depths:
+                picks = iter(roots * 2)
+                reached = []
+
+                async def recursive_cte() -> None:
+                    graph = await service.get_graph(
+                        db,
+                        object_id=next(picks),
+                        tenant_id=tenant_id,
+                        direction=direction,
+                        max_depth=depth,
+                        use_cache=False,
+                    )
+                    reached.append(len(graph["nodes"]))
+
+                async def cached() -> None:
+                    await service.get_graph(
+                        db,
+                        object_id=next(picks),
+                        tenant_id=tenant_id,
+                        direction=direction,
+                        max_depth=depth,
+                    )
+
+                cte = await measure(recursive_cte, iterations)
+                memory = await measure(cached, iterations)
+                print(
+                    f"{direction:<10} depth {depth}  "
+                    f"~{statistics.mean(reached):7.0f} nodes  "
+                    f"cte {summarize(cte)}  cached {summarize(memory)}"
+                )
+
+    async with engine.begin() as conn:
+        for statement in CLEANUP_SQL:
+            await conn.execute(statement, {"tenant_id": tenant_id})
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Relationship graph traversal latency")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(
+        run_benchmark(
+            args.database_url, args.edges, args.fanout, args.depths, args.iterations
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
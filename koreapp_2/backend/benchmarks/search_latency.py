@@ -0,0 +1,132 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.services.business_object import business_object_service
+
+SEED_SQL = text("""
+    INSERT INTO business_objects (
+        id, name, type, description, status, complexity, tags,
+        tenant_id, created_by, created_at, updated_at, is_active
+    )
+    SELECT
+        gen_random_uuid(),
+        (ARRAY['Invoice', 'Customer', 'Payroll', 'Shipment', 'Ledger',
+               'Forecast', 'Onboarding', 'Procurement'])[1 + g % 8]
+            || ' ' || (ARRAY['sync', 'approval', 'export', 'report',
+                             'reconciliation', 'intake'])[1 + g % 6]
+            || ' ' || g,
+        (ARRAY['WORKFLOW', 'DATA_OBJECT', 'PROCESS', 'INTEGRATION',
+               'REPORT'])[1 + g % 5]::objecttype,
+        'Handles ' || (ARRAY['monthly', 'daily', 'quarterly'])[1 + g % 3]
+            || ' processing for the ' || (ARRAY['finance', 'sales', 'hr',
+            'logistics'])[1 + g % 4] || ' department',
+        'ACTIVE'::objectstatus,
+        'MEDIUM'::complexitylevel,
+        (ARRAY['erp,finance', 'crm,sales', 'hr', 'logistics,warehouse'])[1 + g % 4],
+        :tenant_id,
+        'benchmark',
+        now() - (g || ' seconds')::interval,
+        now(),
+        true
+    FROM generate_series(1, :size) AS g
+    """)
+
+QUERIES = ["invoice", "recon", "custmer approval"]
+
+
+async def measure(run: Callable[[], Awaitable[None]], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def summarize(timings: List[float]) -> str:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return f"p50={statistics.median(timings):8.2f}ms p95={p95:8.2f}ms"
+
+
+async def run_benchmark(database_url: str, sizes: List[int], iterations: int) -> None:
+    engine = create_async_engine(database_url)
+    Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    for size in sizes:
+        tenant_id = f"bench-search-{size}"
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("DELETE FROM business_objects WHERE tenant_id = :tenant_id"),
+                {"tenant_id": tenant_id},
+            )
+            await conn.execute(SEED_SQL, {"tenant_id": tenant_id, "size": size})
+            await conn.execute(text("ANALYZE business_objects"))
+
+        async with Session() as db:
+            for term in QUERIES:
+
+                async def full_text() -> None:
+                    await business_object_service.get_multi(
+                        db, tenant_id=tenant_id, limit=20, search=term
+                    )
+
+                async def legacy_ilike() -> None:
+                    await db.execute(
+                        select(BusinessObjectModel)
+                        .where(
+                            BusinessObjectModel.tenant_id == tenant_id,
+                            BusinessObjectModel.is_active == True,
+                            or_(
+                                BusinessObjectModel.name.ilike(f"%{term}%"),
+                                BusinessObjectModel.description.ilike(f"%{term}%"),
+                            ),
+                        )
+                        .order_by(BusinessObjectModel.created_at.desc())
+                        .limit(20)
+                    )
+
+                await full_text()
+                fts = await measure(full_text, iterations)
+                ilike = await measure(legacy_ilike, iterations)
+                print(
+                    f"{size:>9} rows  {term!r:<20} "
+                    f"fts {summarize(fts)}  ilike {summarize(ilike)}"
+                )
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("DELETE FROM business_objects WHERE tenant_id = :tenant_id"),
+                {"tenant_id": tenant_id},
+            )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Business object search latency")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.database_url, args.sizes, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.analysis import Analysis as AnalysisModel
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.services.analysis import OBJECT_ANALYSES
+from app.services.business_object import (
+    PAGE_AFTER,
+    count_statement,
+    get_statement,
+    page_statement,
+)
+
+SEED_SQL = [
+    text("""
+        INSERT INTO business_objects (
+            id, name, type, tenant_id, created_by, created_at, updated_at, is_active
+        )
+        SELECT gen_random_uuid(), 'Hot object ' || g, 'WORKFLOW'::objecttype,
+               :tenant_id, 'benchmark', now() - g * interval '1 second', now(), true
+        FROM generate_series(1, 1000) AS g
+        """),
+    text("""
+        INSERT INTO analyses (
+            id, business_object_id, analysis_type, summary, tenant_id, created_by,
+            created_at
+        )
+        SELECT gen_random_uuid(), o.id, 'ai_analysis', 'Synthetic analysis',
+               o.tenant_id, 'benchmark', now() - g * interval '1 minute'
+        FROM business_objects o CROSS JOIN generate_series(1, 5) AS g
+        WHERE o.tenant_id = :tenant_id
+        """),
+]
+
+CLEANUP_SQL = [
+    text("DELETE FROM analyses WHERE tenant_id = :tenant_id"),
+    text("DELETE FROM business_objects WHERE tenant_id = :tenant_id"),
+]
+
+FILTERS = (False, False, False)
+
+
+def adhoc_get(id: Any, tenant_id: str):
+    return select(BusinessObjectModel).where(
+        BusinessObjectModel.id == id,
+        BusinessObjectModel.tenant_id == tenant_id,
+        BusinessObjectModel.is_active == True,
+    )
+
+
+def adhoc_page(tenant_id: str, cursor: Tuple[Any, Any], limit: int):
+    return (
+        select(BusinessObjectModel)
+        .where(
+            BusinessObjectModel.tenant_id == tenant_id,
+            BusinessObjectModel.is_active == True,
+            tuple_(BusinessObjectModel.created_at, BusinessObjectModel.id)
+            < tuple_(*cursor),
+        )
+        .order_by(BusinessObjectModel.created_at.desc(), BusinessObjectModel.id.desc())
+        .limit(limit)
+    )
+
+
+def adhoc_analyses(object_id: Any, tenant_id: str):
+    return (
+        select(AnalysisModel)
+        .where(
+            AnalysisModel.business_object_id == object_id,
+            AnalysisModel.tenant_id == tenant_id,
+        )
+        .order_by(AnalysisModel.created_at.desc())
+    )
+
+
+def per_call_us(run: Callable[[], Any], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        run()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def per_query_us(run: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    for _ in range(min(iterations, 20)):
+        await run()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await run()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def report(name: str, adhoc: float, cached: float, unit: str = "us/call") -> None:
+    print(
+        f"  {name:<16} ad-hoc {adhoc:9.1f} {unit}  cached {cached:9.1f} {unit}  "
+        f"saved {adhoc - cached:8.1f} "
+        f"({1_000_000 / cached:8.0f} vs {1_000_000 / adhoc:8.0f} calls/s)"
+    )
+
+
+async def run_benchmark(
+    database_url: str, iterations: int, thresholds: List[Optional[int]]
+) -> None:
+    tenant_id = "bench-statement-cache"
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in CLEANUP_SQL + SEED_SQL:
+            await conn.execute(statement, {"tenant_id": tenant_id})
+        await conn.execute(text("ANALYZE business_objects"))
+        await conn.execute(text("ANALYZE analyses"))
+        result = await conn.execute(
+            select(BusinessObjectModel.id, BusinessObjectModel.created_at)
+            .where(BusinessObjectModel.tenant_id == tenant_id)
+            .order_by(BusinessObjectModel.created_at.desc())
+            .offset(500)
+            .limit(1)
+        )
+        object_id, created_at = result.one()
+    await engine.dispose()
+
+    cursor = (created_at, object_id)
+    get_cached = get_statement(frozenset())
+    page_cached = page_statement(FILTERS, PAGE_AFTER, False, frozenset())
+
+    print("Statement construction + cache key (no database)")
+    report(
+        "get",
+        per_call_us(
+            lambda: adhoc_get(object_id, tenant_id)._generate_cache_key(), iterations
+        ),
+        per_call_us(lambda: get_cached._generate_cache_key(), iterations),
+    )
+    report(
+        "get_multi",
+        per_call_us(
+            lambda: adhoc_page(tenant_id, cursor, 20)._generate_cache_key(), iterations
+        ),
+        per_call_us(lambda: page_cached._generate_cache_key(), iterations),
+    )
+    report(
+        "get_by_object",
+        per_call_us(
+            lambda: adhoc_analyses(object_id, tenant_id)._generate_cache_key(),
+            iterations,
+        ),
+        per_call_us(lambda: OBJECT_ANALYSES._generate_cache_key(), iterations),
+    )
+
+    for threshold in thresholds:
+        engine = create_async_engine(
+            database_url, connect_args={"prepare_threshold": threshold}
+        )
+        Session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        print(f"Executed through AsyncSession, prepare_threshold={threshold}")
+        async with Session() as db:
+            params: Dict[str, Any] = {"id": object_id, "tenant_id": tenant_id}
+            report(
+                "get",
+                await per_query_us(
+                    lambda: db.execute(adhoc_get(object_id, tenant_id)), iterations
+                ),
+                await per_query_us(lambda: db.execute(get_cached, params), iterations),
+            )
+            page_params = {
+                "tenant_id": tenant_id,
+                "cursor_created_at": created_at,
+                "cursor_id": object_id,
+                "limit": 20,
+            }
+            report(
+                "get_multi",
+                await per_query_us(
+                    lambda: db.execute(adhoc_page(tenant_id, cursor, 20)), iterations
+                ),
+                await per_query_us(
+                    lambda: db.execute(page_cached, page_params), iterations
+                ),
+            )
+            analysis_params = {"object_id": object_id, "tenant_id": tenant_id}
+            report(
+                "get_by_object",
+                await per_query_us(
+                    lambda: db.execute(adhoc_analyses(object_id, tenant_id)), iterations
+                ),
+                await per_query_us(
+                    lambda: db.execute(OBJECT_ANALYSES, analysis_params), iterations
+                ),
+            )
+            db.expunge_all()
+        await engine.dispose()
+
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        for statement in CLEANUP_SQL:
+            await conn.execute(statement, {"tenant_id": tenant_id})
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-call overhead of ad-hoc vs. cached hot-path statements"
+    )
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument(
+        "--thresholds",
+        type=lambda value: None if value == "none" else int(value),
+        nargs="+",
+        default=[None, 5],
+        help="psycopg prepare_threshold values to compare ('none' disables prepares)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.database_url, args.iterations, args.thresholds))
+
+
+if __name__ == "__main__":
+    main()
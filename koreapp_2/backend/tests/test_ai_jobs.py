@@ -0,0 +1,224 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.ai.jobs import AI_OPTIMIZATION_TYPE, AIJobQueue, JobStatus
+from app.ai.orchestrator import AIOrchestrator
+from app.schemas.business_object import BusinessObjectCreate
+from app.schemas.user import User
+from app.services.analysis import analysis_service
+from app.services.business_object import business_object_service
+
+
+class RecordingQueue(AIJobQueue):
+    def __init__(self, **kwargs):
+        super().__init__(
+            **{
+                "workers": 1,
+                "tenant_concurrency": 1,
+                "max_pending": 100,
+                "max_retained": 100,
+                **kwargs,
+            }
+        )
+        self.order = []
+        self.running = {}
+        self.peak = {}
+        self.release = asyncio.Event()
+
+    async def _execute(self, job):
+        self.order.append(job.tenant_id)
+        self.running[job.tenant_id] = self.running.get(job.tenant_id, 0) + 1
+        self.peak[job.tenant_id] = max(
+            self.peak.get(job.tenant_id, 0), self.running[job.tenant_id]
+        )
+        try:
+            await self.release.wait()
+        finally:
+            self.running[job.tenant_id] -= 1
+        return {"tenant_id": job.tenant_id}
+
+
+async def submit_all(queue, tenants):
+    return [
+        await queue.submit(
+            "analyze", object_id=None, tenant_id=tenant, created_by="user"
+        )
+        for tenant in tenants
+    ]
+
+
+@pytest.mark.asyncio
+async def test_queue_round_robins_between_tenants():
+    queue = RecordingQueue()
+    queue.release.set()
+    jobs = await submit_all(queue, ["a", "a", "a", "b", "b"])
+
+    queue.start()
+    try:
+        await asyncio.wait_for(asyncio.gather(*(job.done.wait() for job in jobs)), 1)
+    finally:
+        await queue.stop()
+
+    assert queue.order == ["a", "b", "a", "b", "a"]
+    assert all(job.status == JobStatus.COMPLETED for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_queue_caps_running_jobs_per_tenant():
+    queue = RecordingQueue(workers=4, tenant_concurrency=2)
+    jobs = await submit_all(queue, ["a", "a", "a", "a", "b"])
+
+    queue.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert queue.running == {"a": 2, "b": 1}
+        assert queue.stats()["pending"] == 2
+
+        queue.release.set()
+        await asyncio.wait_for(asyncio.gather(*(job.done.wait() for job in jobs)), 1)
+    finally:
+        await queue.stop()
+
+    assert queue.peak == {"a": 2, "b": 1}
+    assert queue.stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_rejects_when_full():
+    queue = RecordingQueue(max_pending=2)
+    await submit_all(queue, ["a", "b"])
+
+    with pytest.raises(asyncio.QueueFull):
+        await submit_all(queue, ["c"])
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_running_jobs():
+    queue = RecordingQueue()
+    running, queued = await submit_all(queue, ["a", "a"])
+
+    queue.start()
+    await asyncio.sleep(0.05)
+    assert running.status == JobStatus.RUNNING
+    await queue.stop()
+
+    assert running.done.is_set()
+    assert running.status == JobStatus.FAILED
+    assert running.error == "cancelled"
+    assert queued.status == JobStatus.QUEUED
+    assert queue.stats()["workers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_reloads_object_in_its_own_session(db_engine, db_session):
+    obj = await business_object_service.create(
+        db_session,
+        obj_in=BusinessObjectCreate(name="Queued Object", type="workflow"),
+        tenant_id="job-tenant",
+        created_by="test-user-id",
+    )
+    queue = AIJobQueue(
+        workers=1,
+        tenant_concurrency=1,
+        max_pending=10,
+        max_retained=10,
+        session_factory=sessionmaker(
+            db_engine, class_=AsyncSession, expire_on_commit=False
+        ),
+    )
+    job = await queue.submit(
+        "analyze", obj.id, tenant_id="job-tenant", created_by="test-user-id"
+    )
+    await business_object_service.remove(db_session, id=obj.id)
+
+    queue.start()
+    try:
+        await asyncio.wait_for(job.done.wait(), 1)
+    finally:
+        await queue.stop()
+
+    assert job.status == JobStatus.FAILED
+    assert job.error == "Business object not found"
+    assert job.to_dict()["object_id"] == obj.id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["analyze", "optimize"])
+async def test_worker_runs_agents_without_an_open_session(
+    db_session, tracked_sessions, monkeypatch, kind
+):
+    open_during_run = []
+
+    class RecordingOrchestrator(AIOrchestrator):
+        async def analyze_object(self, business_object):
+            open_during_run.append(tracked_sessions.open)
+            return await super().analyze_object(business_object)
+
+        async def optimize_object(self, business_object):
+            open_during_run.append(tracked_sessions.open)
+            return await super().optimize_object(business_object)
+
+    monkeypatch.setattr("app.ai.jobs.AIOrchestrator", RecordingOrchestrator)
+    tenant_id = f"job-tenant-{uuid4()}"
+    obj = await business_object_service.create(
+        db_session,
+        obj_in=BusinessObjectCreate(name="Agent Object", type="workflow"),
+        tenant_id=tenant_id,
+        created_by="test-user-id",
+    )
+    queue = AIJobQueue(
+        workers=1,
+        tenant_concurrency=1,
+        max_pending=10,
+        max_retained=10,
+        session_factory=tracked_sessions,
+    )
+    job = await queue.submit(
+        kind, obj.id, tenant_id=tenant_id, created_by="test-user-id"
+    )
+
+    queue.start()
+    try:
+        await asyncio.wait_for(job.done.wait(), 5)
+    finally:
+        await queue.stop()
+
+    assert job.status == JobStatus.COMPLETED, job.error
+    assert open_during_run == [0]
+    assert tracked_sessions.open == 0
+    analyses = await analysis_service.get_by_object(
+        db_session, object_id=obj.id, tenant_id=tenant_id
+    )
+    assert [analysis.analysis_type for analysis in analyses] == [
+        "ai_analysis" if kind == "analyze" else AI_OPTIMIZATION_TYPE
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_job_wait_times_out_with_current_status(
+    client: AsyncClient, current_user: User
+):
+    response = await client.post(
+        "/api/v1/objects/", json={"name": "Job Object", "type": "workflow"}
+    )
+    response = await client.post(f"/api/v1/ai/jobs/analyze/{response.json()['id']}")
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    started = time.perf_counter()
+    response = await client.get(f"/api/v1/ai/jobs/{job_id}", params={"wait": 0.2})
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    assert response.json()["status"] == JobStatus.QUEUED
+    assert 0.2 <= elapsed < 1
+
+    current_user.tenant_id = "other-tenant"
+    response = await client.get(f"/api/v1/ai/jobs/{job_id}")
+    assert response.status_code == 404
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.ai.orchestrator import AgentExecutionPlan, AgentStep, AIAgent, AIOrchestrator
+from app.api.v1.endpoints.ai import _stream_events
+from app.schemas.user import User
+
+
+class SleepingAgent(AIAgent):
+    def __init__(self, name: str, delay: float, log: list):
+        super().__init__(name=name, role="Test", capabilities=[])
+        self.delay = delay
+        self.log = log
+
+    async def execute(self, task, context):
+        self.log.append(("start", self.name))
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.log.append(("cancelled", self.name))
+            raise
+        self.log.append(("end", self.name))
+        return {"agent": self.name}
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        assert event.startswith("event: ") and data.startswith("data: ")
+        events.append((event[len("event: ") :], json.loads(data[len("data: ") :])))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_optimize_stream_emits_agents_then_result(
+    client: AsyncClient, current_user: User
+):
+    response = await client.post(
+        "/api/v1/objects/", json={"name": "Streamed Object", "type": "workflow"}
+    )
+    response = await client.post(f"/api/v1/ai/optimize/{response.json()['id']}/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    assert [event for event, _ in events] == ["agent", "agent", "result", "done"]
+    assert {data["agent_key"] for _, data in events[:2]} == {
+        "planner",
+        "backend_engineer",
+    }
+    assert list(events[2][1]["agent_results"]) == ["planner", "backend_engineer"]
+    assert "Streamed Object" in events[2][1]["optimization_summary"]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_emits_step_then_message(
+    client: AsyncClient, current_user: User
+):
+    response = await client.post(
+        "/api/v1/ai/chat/stream", json={"message": "optimize my workflow"}
+    )
+
+    events = parse_sse(response.text)
+    assert [event for event, _ in events] == ["agent", "message", "done"]
+    assert events[0][1]["agent"] == "Backend-Engineer"
+    assert events[1][1]["text"] == AIOrchestrator()._chat_response("optimize")
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_errors_without_done():
+    async def failing():
+        yield "agent", {"agent_key": "planner"}
+        raise RuntimeError("agent crashed")
+
+    events = [chunk async for chunk in _stream_events(failing())]
+
+    assert parse_sse("".join(events)) == [
+        ("agent", {"agent_key": "planner"}),
+        ("error", {"detail": "agent crashed"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_disconnect_cancels_running_agents():
+    log = []
+    agents = {
+        "fast": SleepingAgent("fast", 0, log),
+        "slow": SleepingAgent("slow", 5, log),
+    }
+    plan = AgentExecutionPlan([AgentStep("fast", "task"), AgentStep("slow", "task")])
+
+    events = _stream_events(plan.stream(agents, {}))
+    first = await events.__anext__()
+    assert first.startswith("event: fast")
+    await events.aclose()
+
+    assert ("cancelled", "slow") in log
+    assert ("end", "slow") not in log
+    assert not [
+        task for task in asyncio.all_tasks() if task.get_name().startswith("agent:")
+    ]
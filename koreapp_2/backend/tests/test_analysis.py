@@ -0,0 +1,145 @@
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.schemas.user import User
+
+
+async def create_object(client: AsyncClient, name: str) -> str:
+    response = await client.post(
+        "/api/v1/objects/", json={"name": name, "type": "workflow"}
+    )
+    return response.json()["id"]
+
+
+async def get_latest(client: AsyncClient, object_ids, **params):
+    return await client.get(
+        "/api/v1/analysis/latest", params={"object_ids": object_ids, **params}
+    )
+
+
+async def post_latest(client: AsyncClient, object_ids, fast=False, **query):
+    return await client.post(
+        "/api/v1/analysis/latest",
+        params={"fast": fast},
+        json={"object_ids": object_ids, **query},
+    )
+
+
+@pytest.mark.asyncio
+async def test_latest_analyses_ranks_per_object(
+    client: AsyncClient, current_user: User
+):
+    first = await create_object(client, "First")
+    second = await create_object(client, "Second")
+    for round in range(1, 4):
+        items = [
+            {
+                "business_object_id": first,
+                "analysis_type": "ai_analysis",
+                "summary": f"first {round}",
+            }
+        ]
+        if round == 1:
+            items.append(
+                {
+                    "business_object_id": second,
+                    "analysis_type": "risk",
+                    "summary": "second 1",
+                }
+            )
+        response = await client.post("/api/v1/analysis/bulk", json=items)
+        assert response.status_code == 200
+        assert response.json()["errors"] == []
+
+    response = await get_latest(client, [second, first], per_object=2)
+    assert response.status_code == 200
+    assert [
+        (entry["business_object_id"], [a["summary"] for a in entry["analyses"]])
+        for entry in response.json()
+    ] == [(second, ["second 1"]), (first, ["first 3", "first 2"])]
+
+    fast = await get_latest(client, [second, first], per_object=2, fast=True)
+    assert fast.json() == response.json()
+    for fast in (False, True):
+        posted = await post_latest(client, [second, first], fast=fast, per_object=2)
+        assert posted.status_code == 200
+        assert posted.json() == response.json()
+
+    response = await get_latest(client, [first, second], analysis_type="risk")
+    assert [len(entry["analyses"]) for entry in response.json()] == [0, 1]
+    response = await post_latest(client, [first, second], analysis_type="risk")
+    assert [len(entry["analyses"]) for entry in response.json()] == [0, 1]
+
+    current_user.tenant_id = f"test-tenant-{uuid4()}"
+    response = await get_latest(client, [first, second])
+    assert [entry["analyses"] for entry in response.json()] == [[], []]
+
+
+@pytest.mark.asyncio
+async def test_latest_analyses_rejects_too_many_objects(
+    client: AsyncClient, current_user: User, monkeypatch
+):
+    monkeypatch.setattr(settings, "ANALYSIS_BATCH_MAX_OBJECTS", 2)
+
+    response = await get_latest(client, [str(uuid4()) for _ in range(3)])
+    assert response.status_code == 400
+    assert response.json()["detail"] == "At most 2 objects can be requested at once"
+
+    response = await get_latest(client, [str(uuid4()) for _ in range(2)])
+    assert response.status_code == 200
+
+    response = await post_latest(client, [str(uuid4()) for _ in range(3)])
+    assert response.status_code == 400
+    response = await post_latest(client, [str(uuid4())], per_object=21)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_analyses_report_per_item_errors(
+    client: AsyncClient, current_user: User
+):
+    own = await create_object(client, "Own")
+    removed = await create_object(client, "Removed")
+    await client.delete(f"/api/v1/objects/{removed}")
+    own_tenant = current_user.tenant_id
+    current_user.tenant_id = f"test-tenant-{uuid4()}"
+    foreign = await create_object(client, "Foreign")
+    current_user.tenant_id = own_tenant
+
+    missing = str(uuid4())
+    response = await client.post(
+        "/api/v1/analysis/bulk",
+        json=[
+            {"business_object_id": own, "analysis_type": "ai_analysis"},
+            {"business_object_id": missing, "analysis_type": "ai_analysis"},
+            {"analysis_type": "ai_analysis"},
+            {"business_object_id": foreign, "analysis_type": "ai_analysis"},
+            {"business_object_id": removed, "analysis_type": "ai_analysis"},
+            {"business_object_id": own, "analysis_type": "risk"},
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [
+        (item["business_object_id"], item["analysis_type"]) for item in data["items"]
+    ] == [(own, "ai_analysis"), (own, "risk")]
+    assert [
+        (error["index"], error["id"], error["errors"][0]["type"])
+        for error in data["errors"]
+    ] == [
+        (1, missing, "not_found"),
+        (2, None, "missing"),
+        (3, foreign, "not_found"),
+        (4, removed, "not_found"),
+    ]
+    assert data["errors"][0]["errors"][0]["loc"] == ["business_object_id"]
+
+    response = await client.post(
+        "/api/v1/analysis/bulk",
+        json=[{"business_object_id": missing, "analysis_type": "ai_analysis"}],
+    )
+    assert response.status_code == 200
+    assert response.json()["items"] == []
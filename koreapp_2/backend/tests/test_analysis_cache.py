@@ -0,0 +1,100 @@
+from uuid import uuid4
+
+import pytest
+
+from app.ai.orchestrator import AIOrchestrator
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.schemas.business_object import BusinessObjectCreate
+from app.services.analysis_cache import AnalysisCacheService, content_hash
+from app.services.business_object import business_object_service
+
+
+class CountingOrchestrator(AIOrchestrator):
+    def __init__(self, sessions=None):
+        super().__init__()
+        self.sessions = sessions
+        self.calls = 0
+
+    async def analyze_object(self, business_object):
+        assert self.sessions is None or self.sessions.open == 0
+        self.calls += 1
+        return {
+            "summary": f"Analysis {self.calls} of {business_object.name}",
+            "insights": ["insight"],
+            "recommendations": ["recommendation"],
+            "confidence_score": 0.9,
+            "agent_results": {},
+        }
+
+
+def test_content_hash_tracks_analyzed_fields_only():
+    obj = BusinessObjectModel(
+        id=uuid4(), name="Invoice", type="workflow", complexity="low", description="A"
+    )
+    digest = content_hash(obj)
+
+    obj.status = "inactive"
+    obj.tags = "finance"
+    assert content_hash(obj) == digest
+    assert (
+        content_hash(
+            BusinessObjectModel(
+                id=uuid4(),
+                name="Invoice",
+                type="workflow",
+                complexity="low",
+                description="A",
+            )
+        )
+        == digest
+    )
+
+    obj.description = "B"
+    assert content_hash(obj) != digest
+
+
+@pytest.mark.asyncio
+async def test_get_or_analyze_reuses_result_until_content_changes(
+    db_session, tracked_sessions
+):
+    tenant_id = f"cache-tenant-{uuid4()}"
+    obj = await business_object_service.create(
+        db_session,
+        obj_in=BusinessObjectCreate(name="Invoice", type="workflow", description="A"),
+        tenant_id=tenant_id,
+        created_by="test-user-id",
+    )
+    cache = AnalysisCacheService()
+    orchestrator = CountingOrchestrator(tracked_sessions)
+
+    async def analyze():
+        return await cache.get_or_analyze(
+            tracked_sessions,
+            business_object=obj,
+            orchestrator=orchestrator,
+            tenant_id=tenant_id,
+            created_by="test-user-id",
+        )
+
+    first, cached = await analyze()
+    assert not cached
+    second, cached = await analyze()
+    assert cached
+    assert second == first
+    assert orchestrator.calls == 1
+
+    cache.invalidate(obj.id)
+    third, cached = await analyze()
+    assert cached
+    assert third == first
+    assert orchestrator.calls == 1
+    assert cache.stats()["db_hits"] == 1
+
+    obj.description = "B"
+    await db_session.commit()
+    cache.invalidate(obj.id)
+    changed, cached = await analyze()
+    assert not cached
+    assert changed["summary"] == "Analysis 2 of Invoice"
+    assert orchestrator.calls == 2
+    assert cache.stats()["size"] == 1
@@ -1,55 +1,423 @@
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch
 
+from app.core.config import settings
+from app.schemas.analysis import AnalysisCreate
+from app.schemas.business_object import BusinessObjectCreate
+from app.schemas.relationship import RelationshipCreate
 from app.schemas.user import User
+from app.services.analysis import analysis_service
+from app.services.business_object import business_object_service, parse_include
+from app.services.relationship import relationship_service
 
 
 @pytest.mark.asyncio
-async def test_create_business_object(client: AsyncClient):
-    mock_user = User(
-        id="test-user-id",
-        tenant_id="test-tenant-id",
-        email="test@example.com",
-        name="Test User",
-        roles=["user"],
-        is_active=True
+async def test_create_business_object(client: AsyncClient, current_user: User):
+    response = await client.post(
+        "/api/v1/objects/",
+        json={
+            "name": "Test Object",
+            "type": "workflow",
+            "description": "Test description",
+            "status": "active",
+            "complexity": "medium",
+        },
     )
-    
-    with patch("app.core.deps.get_current_active_user", return_value=mock_user):
-        response = await client.post(
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Test Object"
+    assert data["type"] == "workflow"
+    assert data["tenant_id"] == current_user.tenant_id
+
+
+@pytest.mark.asyncio
+async def test_list_business_objects(client: AsyncClient, current_user: User):
+    await client.post(
+        "/api/v1/objects/", json={"name": "Listed Object", "type": "report"}
+    )
+
+    response = await client.get("/api/v1/objects/")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert [item["name"] for item in data["items"]] == ["Listed Object"]
+
+
+@pytest.mark.asyncio
+async def test_list_business_objects_fast(client: AsyncClient, current_user: User):
+    for i in range(3):
+        await client.post(
             "/api/v1/objects/",
-            json={
-                "name": "Test Object",
-                "type": "workflow",
-                "description": "Test description",
-                "status": "active",
-                "complexity": "medium"
-            }
-        )
-        
+            json={"name": f"Fast Object {i}", "type": "report", "tags": "a,b"},
+        )
+
+    pages = [
+        {"limit": 2},
+        {"limit": 2, "skip": 2},
+        {"limit": 2, "paginate": "cursor"},
+    ]
+    for params in pages:
+        response = await client.get("/api/v1/objects/", params={**params, "fast": True})
+        expected = await client.get("/api/v1/objects/", params=params)
+
         assert response.status_code == 200
-        data = response.json()
-        assert data["name"] == "Test Object"
-        assert data["type"] == "workflow"
+        assert expected.status_code == 200
+        assert response.json() == expected.json()
+        assert response.json()["items"]
+
+    next_cursor = expected.json()["next_cursor"]
+    assert next_cursor
+    params = {"limit": 2, "paginate": "cursor", "cursor": next_cursor}
+    response = await client.get("/api/v1/objects/", params={**params, "fast": True})
+    expected = await client.get("/api/v1/objects/", params=params)
+    assert response.json() == expected.json()
+    assert [item["name"] for item in response.json()["items"]] == ["Fast Object 0"]
 
 
 @pytest.mark.asyncio
-async def test_list_business_objects(client: AsyncClient):
-    mock_user = User(
-        id="test-user-id",
-        tenant_id="test-tenant-id",
-        email="test@example.com",
-        name="Test User",
-        roles=["user"],
-        is_active=True
+async def test_list_business_objects_with_cursor(
+    client: AsyncClient, current_user: User
+):
+    created = []
+    for i in range(5):
+        response = await client.post(
+            "/api/v1/objects/", json={"name": f"Cursor Object {i}", "type": "report"}
+        )
+        created.append(response.json()["id"])
+
+    response = await client.get(
+        "/api/v1/objects/", params={"paginate": "cursor", "limit": 2}
     )
-    
-    with patch("app.core.deps.get_current_active_user", return_value=mock_user):
-        response = await client.get("/api/v1/objects/")
-        
+    assert response.status_code == 200
+    page = response.json()
+    assert page["total"] == 5
+    assert page["page"] is None
+
+    seen = [item["id"] for item in page["items"]]
+    pages = 1
+    while page["next_cursor"]:
+        response = await client.get(
+            "/api/v1/objects/",
+            params={
+                "paginate": "cursor",
+                "cursor": page["next_cursor"],
+                "limit": 2,
+                "include_total": False,
+            },
+        )
         assert response.status_code == 200
-        data = response.json()
-        assert "items" in data
-        assert "total" in data
-        assert isinstance(data["items"], list)
+        page = response.json()
+        assert page["total"] is None
+        seen.extend(item["id"] for item in page["items"])
+        pages += 1
+
+    assert pages == 3
+    assert len(page["items"]) == 1
+    assert seen == list(reversed(created))
+
+
+@pytest.mark.asyncio
+async def test_list_business_objects_invalid_cursor(
+    client: AsyncClient, current_user: User
+):
+    response = await client.get(
+        "/api/v1/objects/", params={"paginate": "cursor", "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+    response = await client.get("/api/v1/objects/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "cursor requires paginate=cursor"
+
+    response = await client.get("/api/v1/objects/", params={"paginate": "pages"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_cursor_total_invalidated_by_writes(
+    client: AsyncClient, current_user: User
+):
+    async def total() -> int:
+        response = await client.get("/api/v1/objects/", params={"paginate": "cursor"})
+        return response.json()["total"]
+
+    assert await total() == 0
+    response = await client.post(
+        "/api/v1/objects/", json={"name": "Counted", "type": "report"}
+    )
+    assert await total() == 1
+
+    await client.post(
+        "/api/v1/objects/bulk", json=[{"name": "Bulk Counted", "type": "report"}]
+    )
+    assert await total() == 2
+
+    await client.delete(f"/api/v1/objects/{response.json()['id']}")
+    assert await total() == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_invalid_items(
+    client: AsyncClient, current_user: User
+):
+    response = await client.post(
+        "/api/v1/objects/bulk",
+        json=[
+            {"name": "Bulk Object 1", "type": "workflow"},
+            {"name": "Bulk Object 2", "type": "not-a-type"},
+            {"name": "Bulk Object 3", "type": "report"},
+            "not-an-object",
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data["items"]] == [
+        "Bulk Object 1",
+        "Bulk Object 3",
+    ]
+    assert {item["tenant_id"] for item in data["items"]} == {current_user.tenant_id}
+    assert [(error["index"], error["id"]) for error in data["errors"]] == [
+        (1, None),
+        (3, None),
+    ]
+    assert data["errors"][0]["errors"][0]["loc"] == ["type"]
+
+    response = await client.post(
+        "/api/v1/objects/bulk",
+        content='{"name": "NDJSON Object", "type": "workflow"}\n\n',
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert [item["name"] for item in response.json()["items"]] == ["NDJSON Object"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_and_delete_stay_in_tenant(
+    client: AsyncClient, current_user: User
+):
+    response = await client.post(
+        "/api/v1/objects/bulk",
+        json=[{"name": "Foreign Object", "type": "workflow"}],
+    )
+    foreign = response.json()["items"][0]
+    foreign_id = foreign["id"]
+    foreign_tenant = current_user.tenant_id
+
+    current_user.tenant_id = f"test-tenant-{uuid4()}"
+    response = await client.post(
+        "/api/v1/objects/bulk",
+        json=[{"name": "Own Object", "type": "workflow"}],
+    )
+    own_id = response.json()["items"][0]["id"]
+
+    response = await client.patch(
+        "/api/v1/objects/bulk",
+        content="\n".join(
+            [
+                f'{{"id": "{foreign_id}", "status": "inactive"}}',
+                f'{{"id": "{own_id}", "status": "inactive"}}',
+                '{"id": "missing"}',
+                f'{{"id": "{own_id}", "name": "Duplicate"}}',
+            ]
+        ),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [(item["id"], item["status"]) for item in data["items"]] == [
+        (own_id, "inactive")
+    ]
+    assert [
+        (error["index"], error["id"], error["errors"][0]["type"])
+        for error in data["errors"]
+    ] == [
+        (0, foreign_id, "not_found"),
+        (2, None, "uuid_parsing"),
+        (3, own_id, "duplicate"),
+    ]
+
+    response = await client.post(
+        "/api/v1/objects/bulk/delete", json=[foreign_id, {"id": own_id}, "bad-id"]
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["deleted"] == [own_id]
+    assert [(error["index"], error["id"]) for error in data["errors"]] == [
+        (0, foreign_id),
+        (2, None),
+    ]
+
+    current_user.tenant_id = foreign_tenant
+    response = await client.get(f"/api/v1/objects/{foreign_id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == foreign["status"] != "inactive"
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_explicit_nulls(
+    client: AsyncClient, current_user: User
+):
+    response = await client.post(
+        "/api/v1/objects/bulk",
+        json=[
+            {"name": "First", "type": "workflow"},
+            {"name": "Second", "type": "workflow"},
+        ],
+    )
+    first, second = [item["id"] for item in response.json()["items"]]
+
+    response = await client.patch(
+        "/api/v1/objects/bulk",
+        json=[
+            {"id": first, "name": None, "owner": "ops"},
+            {"id": second, "type": None},
+            {"id": second, "owner": None, "description": "Cleared owner"},
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [(item["id"], item["description"]) for item in data["items"]] == [
+        (second, "Cleared owner")
+    ]
+    assert [
+        (
+            error["index"],
+            error["id"],
+            error["errors"][0]["loc"],
+            error["errors"][0]["type"],
+        )
+        for error in data["errors"]
+    ] == [
+        (0, first, ["name"], "null_not_allowed"),
+        (1, second, ["type"], "null_not_allowed"),
+    ]
+
+    response = await client.get(f"/api/v1/objects/{first}")
+    assert (response.json()["name"], response.json()["owner"]) == ("First", None)
+
+
+@pytest.mark.asyncio
+async def test_bulk_payload_limits(
+    client: AsyncClient, current_user: User, monkeypatch
+):
+    monkeypatch.setattr(settings, "BULK_MAX_ITEMS", 2)
+    item = {"name": "Limit Object", "type": "workflow"}
+
+    response = await client.post("/api/v1/objects/bulk", json=[item] * 3)
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Bulk payload exceeds 2 items"
+
+    response = await client.post("/api/v1/objects/bulk/delete", json=[str(uuid4())] * 3)
+    assert response.status_code == 413
+
+    response = await client.post("/api/v1/objects/bulk", json=[item] * 2)
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+
+    for body in ["[]", "{}", "not json"]:
+        response = await client.post(
+            "/api/v1/objects/bulk",
+            content=body,
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_business_objects_include_constant_queries(
+    db_session, query_counter
+):
+    tenant_id = "include-tenant"
+    objects = await business_object_service.bulk_create(
+        db_session,
+        objs_in=[
+            BusinessObjectCreate(name=f"Include Object {i}", type="workflow")
+            for i in range(10)
+        ],
+        tenant_id=tenant_id,
+        created_by="test-user-id",
+    )
+    await analysis_service.bulk_create(
+        db_session,
+        objs_in=[
+            AnalysisCreate(business_object_id=obj["id"], analysis_type="ai_analysis")
+            for obj in objects
+        ],
+        tenant_id=tenant_id,
+        created_by="test-user-id",
+    )
+    for source, target in zip(objects, objects[1:]):
+        await relationship_service.create(
+            db_session,
+            obj_in=RelationshipCreate(
+                source_id=source["id"], target_id=target["id"], type="depends_on"
+            ),
+            tenant_id=tenant_id,
+            created_by="test-user-id",
+        )
+
+    counts = []
+    for limit in (2, 10):
+        db_session.expunge_all()
+        query_counter.clear()
+        page = await business_object_service.get_multi(
+            db_session,
+            tenant_id=tenant_id,
+            paginate="cursor",
+            limit=limit,
+            include_total=False,
+            include=parse_include("analyses,relationships"),
+        )
+        counts.append(len(query_counter))
+        assert len(page.items) == limit
+        assert all(len(item.analyses) == 1 for item in page.items)
+
+    assert counts[0] == counts[1] == 4
+
+
+@pytest.mark.asyncio
+async def test_search_business_objects(db_session):
+    tenant_id = f"search-tenant-{uuid4()}"
+    for objs_in in (
+        [
+            BusinessObjectCreate(name="Invoice Approval", type="workflow"),
+            BusinessObjectCreate(name="Payroll Report", type="report"),
+        ],
+        [
+            BusinessObjectCreate(
+                name="Vendor Sync",
+                type="integration",
+                description="Exports every approved invoice to the ERP",
+            ),
+        ],
+    ):
+        await business_object_service.bulk_create(
+            db_session, objs_in=objs_in, tenant_id=tenant_id, created_by="test-user-id"
+        )
+
+    async def names(search: str):
+        page = await business_object_service.get_multi(
+            db_session, tenant_id=tenant_id, search=search
+        )
+        assert page.total == len(page.items)
+        return [item.name for item in page.items]
+
+    assert await names("invo") == ["Invoice Approval", "Vendor Sync"]
+    assert await names("payrol rep") == ["Payroll Report"]
+    assert await names("Invoce Aprovel") == ["Invoice Approval"]
+    assert await names("shipping") == []
+    assert await names("%%%") == []
+    assert sorted(await names("  ")) == [
+        "Invoice Approval",
+        "Payroll Report",
+        "Vendor Sync",
+    ]
+
+    with pytest.raises(ValueError):
+        await business_object_service.get_multi(
+            db_session, tenant_id=tenant_id, search="invo", paginate="cursor"
+        )
@@ -0,0 +1,91 @@
+import gc
+import hashlib
+import weakref
+
+import pytest
+from httpx import AsyncClient
+
+from app.ai.copilot_integration import CopilotIntegrationService
+from app.core.config import settings
+from app.schemas.user import User
+
+
+def test_documents_are_cached_per_instance():
+    service = CopilotIntegrationService()
+
+    document = service.connection_schema_document("connection-a")
+    assert service.connection_schema_document("connection-a") is document
+    assert service.connection_schema_document("connection-b").etag != document.etag
+    assert (
+        CopilotIntegrationService().connection_schema_document("connection-a")
+        is not document
+    )
+    assert document.etag == f'"{hashlib.sha256(document.body).hexdigest()[:32]}"'
+
+    reference = weakref.ref(service)
+    del service
+    gc.collect()
+    assert reference() is None
+
+
+@pytest.mark.asyncio
+async def test_openapi_document_honours_if_none_match(client: AsyncClient):
+    response = await client.get("/api/v1/copilot/openapi.json")
+    assert response.status_code == 200
+    assert response.json()["servers"][0]["url"] == "http://localhost"
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    etag = response.headers["etag"]
+
+    for if_none_match in [etag, f'"stale", {etag}', f'"a,b", W/{etag}', "*"]:
+        response = await client.get(
+            "/api/v1/copilot/openapi.json", headers={"If-None-Match": if_none_match}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    for if_none_match in ['"stale"', 'W/"stale", "other"', etag.strip('"')]:
+        response = await client.get(
+            "/api/v1/copilot/openapi.json", headers={"If-None-Match": if_none_match}
+        )
+        assert response.status_code == 200
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_connection_schema_etag_is_per_connection(
+    client: AsyncClient, current_user: User, monkeypatch
+):
+    monkeypatch.setattr(
+        settings,
+        "COPILOT_CONNECTIONS",
+        {
+            "first": current_user.tenant_id,
+            "second": current_user.tenant_id,
+            "foreign": "other-tenant",
+        },
+    )
+    first = await client.get("/api/v1/copilot/connections/first/schema")
+    second = await client.get("/api/v1/copilot/connections/second/schema")
+    assert first.json()["id"] == "first"
+    assert first.headers["etag"] != second.headers["etag"]
+    assert first.headers["cache-control"] == "private, max-age=3600"
+    assert first.headers["vary"] == "Authorization"
+
+    for connection_id in ["foreign", "unknown"]:
+        response = await client.get(
+            f"/api/v1/copilot/connections/{connection_id}/schema"
+        )
+        assert response.status_code == 404
+
+    response = await client.get(
+        "/api/v1/copilot/connections/first/schema",
+        headers={"If-None-Match": second.headers["etag"]},
+    )
+    assert response.status_code == 200
+    response = await client.get(
+        "/api/v1/copilot/connections/first/schema",
+        headers={"If-None-Match": f'W/{first.headers["etag"]}'},
+    )
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == "private, max-age=3600"
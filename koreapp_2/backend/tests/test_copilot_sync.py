@@ -0,0 +1,195 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+
+from app.ai.copilot_integration import copilot_integration_service
+from app.core.config import settings
+from app.models.business_object import BusinessObject as BusinessObjectModel
+from app.models.copilot_sync import CopilotIndexedItem
+from app.schemas.business_object import BusinessObjectCreate, BusinessObjectUpdate
+from app.schemas.user import User
+from app.services.business_object import business_object_service
+from app.services.microsoft_graph import microsoft_graph_service
+
+
+class RecordingGraph:
+    def __init__(self):
+        self.puts = []
+        self.deletes = []
+        self.fail = set()
+
+    async def put_external_item(self, access_token, connection_id, item):
+        if item["id"] in self.fail:
+            raise RuntimeError("Graph unavailable")
+        self.puts.append(item["properties"]["title"])
+
+    async def delete_external_item(self, access_token, connection_id, item_id):
+        self.deletes.append(item_id)
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    graph = RecordingGraph()
+    monkeypatch.setattr(
+        microsoft_graph_service, "put_external_item", graph.put_external_item
+    )
+    monkeypatch.setattr(
+        microsoft_graph_service, "delete_external_item", graph.delete_external_item
+    )
+    return graph
+
+
+@pytest.fixture
+def tenant_id():
+    return f"copilot-tenant-{uuid4()}"
+
+
+async def create_objects(db_session, tenant_id, *names):
+    return await business_object_service.bulk_create(
+        db_session,
+        objs_in=[BusinessObjectCreate(name=name, type="workflow") for name in names],
+        tenant_id=tenant_id,
+        created_by="test-user-id",
+    )
+
+
+async def sync(db_session, tenant_id, full=False):
+    return await copilot_integration_service.sync_tenant(
+        db_session,
+        tenant_id=tenant_id,
+        connection_id="connection",
+        base_url="https://app.test",
+        access_token="token",
+        full=full,
+    )
+
+
+async def indexed_count(db_session, tenant_id):
+    result = await db_session.execute(
+        select(func.count()).where(CopilotIndexedItem.tenant_id == tenant_id)
+    )
+    return result.scalar()
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_only_pushes_changed_objects(
+    db_session, graph, tenant_id
+):
+    objects = await create_objects(db_session, tenant_id, "A", "B", "C")
+
+    stats = await sync(db_session, tenant_id, full=True)
+    assert (stats["indexed"], stats["skipped"], stats["full"]) == (3, 0, True)
+    assert sorted(graph.puts) == ["A", "B", "C"]
+    assert await indexed_count(db_session, tenant_id) == 3
+
+    stats = await sync(db_session, tenant_id)
+    assert (stats["indexed"], stats["skipped"]) == (0, 3)
+
+    await business_object_service.bulk_update(
+        db_session,
+        items=[(objects[0]["id"], BusinessObjectUpdate(name="Renamed"))],
+        tenant_id=tenant_id,
+    )
+    stats = await sync(db_session, tenant_id)
+    assert (stats["indexed"], stats["skipped"]) == (1, 2)
+    assert graph.puts[-1] == "Renamed"
+
+    stats = await sync(db_session, tenant_id, full=True)
+    assert stats["indexed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_deletes_items_for_removed_objects(db_session, graph, tenant_id):
+    objects = await create_objects(db_session, tenant_id, "Kept", "Removed")
+    await sync(db_session, tenant_id, full=True)
+
+    await business_object_service.bulk_remove(
+        db_session, ids=[objects[1]["id"]], tenant_id=tenant_id
+    )
+    stats = await sync(db_session, tenant_id)
+    assert stats["deleted"] == 1
+    assert graph.deletes == [str(objects[1]["id"])]
+    assert await indexed_count(db_session, tenant_id) == 1
+
+    stats = await sync(db_session, tenant_id)
+    assert stats["deleted"] == 0
+    assert graph.deletes == [str(objects[1]["id"])]
+
+
+@pytest.mark.asyncio
+async def test_watermark_uses_database_clock_and_catches_late_commits(
+    db_session, graph, tenant_id
+):
+    objects = await create_objects(db_session, tenant_id, "Early")
+    stats = await sync(db_session, tenant_id, full=True)
+
+    result = await db_session.execute(select(func.timezone("UTC", func.now())))
+    margin = timedelta(seconds=settings.COPILOT_SYNC_WATERMARK_MARGIN)
+    expected = result.scalar() - margin
+    assert abs(stats["watermark"] - expected) < timedelta(seconds=5)
+
+    late = await create_objects(db_session, tenant_id, "Late")
+    await db_session.execute(
+        update(BusinessObjectModel)
+        .where(BusinessObjectModel.id == late[0]["id"])
+        .values(updated_at=objects[0]["updated_at"] - timedelta(seconds=10))
+    )
+    await db_session.commit()
+
+    stats = await sync(db_session, tenant_id)
+    assert stats["indexed"] == 1
+    assert graph.puts[-1] == "Late"
+
+
+@pytest.mark.asyncio
+async def test_failed_items_hold_the_watermark_and_are_retried(
+    db_session, graph, tenant_id
+):
+    objects = await create_objects(db_session, tenant_id, "A", "B", "C")
+    graph.fail = {str(objects[1]["id"])}
+
+    stats = await sync(db_session, tenant_id)
+    assert (stats["indexed"], stats["failed"]) == (2, 1)
+    assert stats["watermark"] is None
+    assert await indexed_count(db_session, tenant_id) == 2
+
+    graph.fail = set()
+    stats = await sync(db_session, tenant_id)
+    assert (stats["indexed"], stats["skipped"], stats["failed"]) == (1, 2, 0)
+    assert graph.puts[-1] == "B"
+    assert stats["watermark"] is not None
+
+
+@pytest.mark.asyncio
+async def test_sync_endpoint_requires_role_and_tenant_connection(
+    client: AsyncClient, current_user: User, graph, monkeypatch
+):
+    async def app_token():
+        return "token"
+
+    monkeypatch.setattr(microsoft_graph_service, "get_app_access_token", app_token)
+    monkeypatch.setattr(
+        settings,
+        "COPILOT_CONNECTIONS",
+        {"own": current_user.tenant_id, "foreign": "other-tenant"},
+    )
+    await client.post("/api/v1/objects/", json={"name": "Synced", "type": "workflow"})
+
+    response = await client.post("/api/v1/copilot/connections/own/sync")
+    assert response.status_code == 403
+
+    current_user.roles = [settings.COPILOT_SYNC_ROLE]
+    for connection_id in ["foreign", "unknown"]:
+        response = await client.post(
+            f"/api/v1/copilot/connections/{connection_id}/sync"
+        )
+        assert response.status_code == 404
+    assert graph.puts == []
+
+    response = await client.post("/api/v1/copilot/connections/own/sync")
+    assert response.status_code == 200
+    assert response.json()["indexed"] == 1
+    assert graph.puts == ["Synced"]
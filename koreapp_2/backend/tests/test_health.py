@@ -1,6 +1,13 @@
 import pytest
 from httpx import AsyncClient
 
+from app.core.config import settings
+from app.schemas.user import User
+
+STATS_PATHS = [
+    f"/api/v1/health/{name}" for name in ("caches", "jobs", "replicas", "pools")
+]
+
 
 @pytest.mark.asyncio
 async def test_health_live(client: AsyncClient):
@@ -18,3 +25,23 @@ async def test_health_ready(client: AsyncClient):
     data = response.json()
     assert data["status"] == "ready"
     assert data["database"] == "connected"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", STATS_PATHS)
+async def test_health_stats_require_authentication(client: AsyncClient, path):
+    response = await client.get(path)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", STATS_PATHS)
+async def test_health_stats_require_admin_role(
+    client: AsyncClient, current_user: User, path
+):
+    response = await client.get(path)
+    assert response.status_code == 403
+
+    current_user.roles = [settings.ADMIN_ROLE]
+    response = await client.get(path)
+    assert response.status_code == 200
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.deps import get_current_user, user_cache
+from app.core.jwks import JWKSKeyCache
+from app.core.security import token_claims_cache, token_digest, verify_azure_token
+
+JWKS_URL = "https://login.test/tenant/discovery/v2.0/keys"
+
+
+def make_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return private_key, jwk
+
+
+def make_token(private_key, kid: str, **claims) -> str:
+    payload = {"oid": "user-id", "tid": "tenant-id", "exp": int(time.time()) + 600}
+    payload.update(claims)
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+def serve_jwks(document: dict, fetches: list) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        fetches.append(request.url)
+        return httpx.Response(200, json=document)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_verify_azure_token_checks_signature_and_caches_claims(monkeypatch):
+    private_key, jwk = make_key("key-1")
+    fetches = []
+    cache = JWKSKeyCache(
+        JWKS_URL,
+        ttl=3600,
+        refetch_interval=60,
+        transport=serve_jwks({"keys": [jwk]}, fetches),
+    )
+    monkeypatch.setattr("app.core.security.jwks_key_cache", cache)
+    token_claims_cache.clear()
+
+    token = make_token(private_key, "key-1")
+    assert (await verify_azure_token(token))["oid"] == "user-id"
+    assert (await verify_azure_token(token))["oid"] == "user-id"
+    assert len(fetches) == 1
+    assert len(token_claims_cache) == 1
+
+    forged_key, _ = make_key("key-1")
+    with pytest.raises(HTTPException) as exc:
+        await verify_azure_token(make_token(forged_key, "key-1"))
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_jwks_refetches_on_rollover_with_rate_limit():
+    old_key, old_jwk = make_key("old")
+    new_key, new_jwk = make_key("new")
+    document = {"keys": [old_jwk]}
+    fetches = []
+    cache = JWKSKeyCache(
+        JWKS_URL, ttl=3600, refetch_interval=60, transport=serve_jwks(document, fetches)
+    )
+
+    await cache.get_signing_key("old")
+    document["keys"] = [old_jwk, new_jwk]
+    cache._last_attempt -= 60
+
+    assert (await cache.get_signing_key("new")).key_id == "new"
+    assert len(fetches) == 2
+
+    with pytest.raises(jwt.InvalidTokenError):
+        await cache.get_signing_key("unknown")
+    assert len(fetches) == 2
+    assert cache.stats()["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_jwks_throttles_refetches_while_no_keys_are_cached():
+    _, jwk = make_key("key-1")
+    fetches = []
+    healthy = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        fetches.append(request.url)
+        if not healthy:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"keys": [jwk]})
+
+    cache = JWKSKeyCache(
+        JWKS_URL, ttl=3600, refetch_interval=60, transport=httpx.MockTransport(handler)
+    )
+
+    results = await asyncio.gather(
+        *(cache.get_signing_key("key-1") for _ in range(5)), return_exceptions=True
+    )
+    assert all(isinstance(result, jwt.InvalidTokenError) for result in results)
+    assert len(fetches) == 1
+
+    healthy = True
+    with pytest.raises(jwt.InvalidTokenError):
+        await cache.get_signing_key("key-1")
+    assert len(fetches) == 1
+    assert cache.stats()["rate_limited"] == 5
+
+    cache._last_attempt -= 60
+    assert (await cache.get_signing_key("key-1")).key_id == "key-1"
+    assert len(fetches) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_returns_copies_of_the_cached_user(monkeypatch):
+    private_key, jwk = make_key("key-1")
+    fetches = []
+    cache = JWKSKeyCache(
+        JWKS_URL,
+        ttl=3600,
+        refetch_interval=60,
+        transport=serve_jwks({"keys": [jwk]}, fetches),
+    )
+    monkeypatch.setattr("app.core.security.jwks_key_cache", cache)
+    token_claims_cache.clear()
+    user_cache.clear()
+    hits, claim_hits = user_cache.hits, token_claims_cache.hits
+    token = make_token(private_key, "key-1", email="user@example.com", roles=["admin"])
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    first = await get_current_user(credentials)
+    first.tenant_id = "other-tenant"
+    first.roles.append("owner")
+    second = await get_current_user(credentials)
+
+    assert second is not first
+    assert second.tenant_id == "tenant-id"
+    assert second.roles == ["admin"]
+    assert user_cache.hits == hits + 1
+    assert token_claims_cache.hits == claim_hits
+    assert len(fetches) == 1
+
+    user_cache.set(token_digest(token), second, expires_at=time.monotonic() - 1)
+    third = await get_current_user(credentials)
+    assert third.tenant_id == "tenant-id"
+    assert token_claims_cache.hits == claim_hits + 1
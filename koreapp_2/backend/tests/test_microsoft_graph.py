@@ -0,0 +1,282 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from azure.core.credentials import AccessToken
+
+from app.services.graph_tokens import AppTokenCache, OnBehalfOfTokenCache
+from app.services.microsoft_graph import GraphDeltaState, MicrosoftGraphService
+
+
+@pytest.mark.asyncio
+async def test_graph_request_retries_throttled_calls():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"id": "user-id"})
+
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0", transport=httpx.MockTransport(handler)
+    )
+    profile = await service.get_user_profile("token")
+    await service.aclose()
+
+    assert profile == {"id": "user-id"}
+    assert len(calls) == 3
+    assert calls[0].headers["Authorization"] == "Bearer token"
+
+
+@pytest.mark.asyncio
+async def test_graph_request_raises_after_max_retries(monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.GRAPH_MAX_RETRIES", 1)
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(503, headers={"Retry-After": "0"})
+        ),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await service.get_user_profile("token")
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method,status,attempts",
+    [("GET", 503, 3), ("POST", 429, 3), ("POST", 503, 1)],
+)
+async def test_batch_retries_writes_only_when_throttled(
+    monkeypatch, method, status, attempts
+):
+    monkeypatch.setattr("app.core.config.settings.GRAPH_MAX_RETRIES", 2)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(status, headers={"Retry-After": "0"})
+
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0", transport=httpx.MockTransport(handler)
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        await service.batch(
+            "token", [{"id": "1", "method": method, "url": "/me/events", "body": {}}]
+        )
+    await service.aclose()
+
+    assert len(calls) == attempts
+
+
+@pytest.mark.asyncio
+async def test_token_cache_reuses_and_single_flights_refreshes():
+    cache = OnBehalfOfTokenCache(maxsize=10, refresh_margin=60)
+    exchanges = []
+
+    async def fetch(assertion, scope):
+        exchanges.append(assertion)
+        await asyncio.sleep(0.05)
+        return AccessToken(f"graph-{assertion}", int(time.time()) + 3600)
+
+    tokens = await asyncio.gather(
+        *(cache.get_token("user-a", "scope", fetch) for _ in range(5))
+    )
+    assert tokens == ["graph-user-a"] * 5
+    assert await cache.get_token("user-a", "scope", fetch) == "graph-user-a"
+    assert exchanges == ["user-a"]
+    assert cache.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_token_cache_does_not_keep_tokens_inside_refresh_margin():
+    cache = OnBehalfOfTokenCache(maxsize=10, refresh_margin=600)
+
+    async def fetch(assertion, scope):
+        return AccessToken("short-lived", int(time.time()) + 300)
+
+    await cache.get_token("user-a", "scope", fetch)
+    await cache.get_token("user-a", "scope", fetch)
+    assert cache.stats()["refreshes"] == 2
+
+
+def fake_batch_transport(batches: list) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1.0/$batch"
+        payload = json.loads(request.content)
+        batches.append(payload["requests"])
+
+        responses = []
+        for item in payload["requests"]:
+            if item["url"].startswith("/missing"):
+                responses.append(
+                    {
+                        "id": item["id"],
+                        "status": 404,
+                        "body": {"error": {"code": "itemNotFound"}},
+                    }
+                )
+            else:
+                responses.append(
+                    {
+                        "id": item["id"],
+                        "status": 201 if item["method"] == "POST" else 200,
+                        "body": {"echo": item.get("body"), "url": item["url"]},
+                    }
+                )
+        return httpx.Response(200, json={"responses": list(reversed(responses))})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_app_token_cache_is_separate_and_refreshes_inside_margin():
+    cache = AppTokenCache(refresh_margin=600)
+    fetches = []
+
+    async def fetch(scope):
+        fetches.append(scope)
+        await asyncio.sleep(0.05)
+        lifetime = 300 if len(fetches) == 1 else 3600
+        return AccessToken(f"app-{len(fetches)}", int(time.time()) + lifetime)
+
+    tokens = await asyncio.gather(*(cache.get_token("scope", fetch) for _ in range(3)))
+    assert tokens == ["app-1"] * 3
+    assert cache.stats()["coalesced"] == 2
+
+    assert await cache.get_token("scope", fetch) == "app-2"
+    assert await cache.get_token("scope", fetch) == "app-2"
+    assert fetches == ["scope", "scope"]
+
+
+@pytest.mark.asyncio
+async def test_batch_splits_requests_and_reports_item_errors():
+    batches = []
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0", transport=fake_batch_transport(batches)
+    )
+    requests = [{"id": str(i), "url": f"/users/{i}"} for i in range(44)]
+    requests.append({"id": "missing", "url": "/missing/item"})
+
+    responses = await service.batch("token", requests)
+    await service.aclose()
+
+    assert [len(batch) for batch in batches] == [20, 20, 5]
+    assert responses["7"]["status"] == 200
+    assert responses["missing"]["status"] == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_depends_on_chains_together():
+    batches = []
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0", transport=fake_batch_transport(batches)
+    )
+    requests = [{"id": str(i), "url": f"/users/{i}"} for i in range(19)]
+    requests += [
+        {"id": "create", "method": "POST", "url": "/sites/s/lists/l/items", "body": {}},
+        {"id": "read", "url": "/sites/s/lists/l/items", "dependsOn": ["create"]},
+    ]
+
+    await service.batch("token", requests)
+    await service.aclose()
+
+    chain_batches = [
+        batch
+        for batch in batches
+        if {"create", "read"} & {item["id"] for item in batch}
+    ]
+    assert len(chain_batches) == 1
+    assert all(len(batch) <= 20 for batch in batches)
+
+
+@pytest.mark.asyncio
+async def test_batch_normalizes_depends_on_ids():
+    batches = []
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0", transport=fake_batch_transport(batches)
+    )
+    requests = [{"id": i, "url": f"/users/{i}"} for i in range(19)]
+    requests.append({"id": 19, "url": "/users/19", "dependsOn": [0]})
+
+    responses = await service.batch("token", requests)
+    await service.aclose()
+
+    dependent = next(item for batch in batches for item in batch if item["id"] == "19")
+    assert dependent["dependsOn"] == ["0"]
+    assert [batch for batch in batches if {"0", "19"} <= {item["id"] for item in batch}]
+    assert responses["19"]["status"] == 200
+
+
+@pytest.mark.asyncio
+async def test_create_sharepoint_items_preserves_input_order():
+    batches = []
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0", transport=fake_batch_transport(batches)
+    )
+
+    results = await service.create_sharepoint_items(
+        "token", "site", "list", [{"Title": f"Item {i}"} for i in range(25)]
+    )
+    await service.aclose()
+
+    assert len(batches) == 2
+    assert [result["body"]["echo"]["fields"]["Title"] for result in results] == [
+        f"Item {i}" for i in range(25)
+    ]
+    assert batches[0][0]["headers"]["Content-Type"] == "application/json"
+
+
+def paged_transport(requests: list) -> httpx.MockTransport:
+    pages = {
+        "/v1.0/me/drive/root/delta": {
+            "value": [{"id": "1"}, {"id": "2"}],
+            "@odata.nextLink": "https://graph.test/v1.0/me/drive/root/delta?token=page2",
+        },
+        "/v1.0/me/drive/root/delta?token=page2": {
+            "value": [{"id": "3"}],
+            "@odata.deltaLink": "https://graph.test/v1.0/me/drive/root/delta?token=delta1",
+        },
+        "/v1.0/me/drive/root/delta?token=delta1": {
+            "value": [{"id": "2", "deleted": {}}],
+            "@odata.deltaLink": "https://graph.test/v1.0/me/drive/root/delta?token=delta2",
+        },
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        key = request.url.path
+        if request.url.params.get("token"):
+            key += f"?token={request.url.params['token']}"
+        return httpx.Response(200, json=pages[key])
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_delta_iteration_follows_pages_and_resumes_from_delta_link():
+    requests = []
+    service = MicrosoftGraphService(
+        base_url="https://graph.test/v1.0", transport=paged_transport(requests)
+    )
+    state = GraphDeltaState()
+
+    items = [
+        item
+        async for item in service.iter_drive_changes(
+            "token", state, select=["id", "name"]
+        )
+    ]
+    assert [item["id"] for item in items] == ["1", "2", "3"]
+    assert state.delta_link.endswith("token=delta1")
+    assert requests[0].url.params["$select"] == "id,name"
+
+    changes = [item async for item in service.iter_drive_changes("token", state)]
+    await service.aclose()
+
+    assert changes == [{"id": "2", "deleted": {}}]
+    assert state.delta_link.endswith("token=delta2")
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+
+from app.ai.orchestrator import AgentExecutionPlan, AgentStep, AIAgent
+
+
+class RecordingAgent(AIAgent):
+    def __init__(self, name: str, delay: float, log: list):
+        super().__init__(name=name, role="Test", capabilities=[])
+        self.delay = delay
+        self.log = log
+
+    async def execute(self, task, context):
+        self.log.append(
+            ("start", self.name, sorted(context.get("upstream_results", {})))
+        )
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.name))
+        return {"agent": self.name, "task": task}
+
+
+@pytest.mark.asyncio
+async def test_plan_runs_independent_agents_concurrently():
+    log = []
+    agents = {name: RecordingAgent(name, 0.2, log) for name in ["a", "b", "c", "d"]}
+    plan = AgentExecutionPlan(
+        [
+            AgentStep("a", "task a"),
+            AgentStep("b", "task b"),
+            AgentStep("c", "task c"),
+            AgentStep("d", "task d", depends_on=["c"]),
+        ]
+    )
+
+    started = time.perf_counter()
+    results = await plan.run(agents, {})
+    elapsed = time.perf_counter() - started
+
+    assert set(results) == {"a", "b", "c", "d"}
+    assert elapsed < 0.6
+    assert log.index(("end", "c")) < log.index(("start", "d", ["c"]))
+
+
+@pytest.mark.asyncio
+async def test_plan_times_out_slow_agent():
+    agents = {"slow": RecordingAgent("slow", 1.0, [])}
+    plan = AgentExecutionPlan([AgentStep("slow", "task", timeout=0.05)])
+
+    results = await plan.run(agents, {})
+
+    assert results["slow"]["status"] == "timed_out"
+
+
+def test_plan_rejects_dependency_cycle():
+    with pytest.raises(ValueError):
+        AgentExecutionPlan(
+            [
+                AgentStep("a", "task a", depends_on=["b"]),
+                AgentStep("b", "task b", depends_on=["a"]),
+            ]
+        )
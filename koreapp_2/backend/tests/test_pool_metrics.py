@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    instrument_engine,
+    pool_monitors,
+)
+
+
+@pytest.mark.asyncio
+async def test_pool_monitor_tracks_checkouts_and_timeouts(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    monitor = instrument_engine(
+        engine, "test", pool_size=1, max_overflow=0, adaptive=True, window=0
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert monitor.stats()["in_use"] == 1
+
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = monitor.stats()
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["in_use"] == 0
+        assert stats["peak_in_use"] == 1
+        assert stats["suggestion"]["reason"] == "pool exhausted"
+        assert stats["suggestion"]["pool_size"] == 2
+    finally:
+        pool_monitors.remove(monitor)
+        await engine.dispose()
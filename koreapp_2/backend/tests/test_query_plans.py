@@ -0,0 +1,119 @@
+from typing import Any, Awaitable, Callable, List, Set
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select, text
+
+from app.models.relationship import Relationship as RelationshipModel
+from app.services.analysis import analysis_service
+from app.services.business_object import business_object_service
+
+SEED_RELATIONSHIPS_SQL = [
+    text("""
+        INSERT INTO business_objects (
+            id, name, type, tenant_id, created_by, created_at, updated_at, is_active
+        )
+        SELECT gen_random_uuid(), 'Plan object ' || g, 'WORKFLOW'::objecttype,
+               'plan-tenant', 'plan-user', now(), now(), true
+        FROM generate_series(1, 40) AS g
+        """),
+    text("""
+        INSERT INTO relationships (
+            id, source_id, target_id, type, tenant_id, created_by
+        )
+        SELECT gen_random_uuid(), s.id, t.id, 'USES'::relationshiptype,
+               'plan-tenant', 'plan-user'
+        FROM business_objects s CROSS JOIN business_objects t
+        WHERE s.tenant_id = 'plan-tenant' AND t.tenant_id = 'plan-tenant'
+        """),
+    text("ANALYZE relationships"),
+]
+
+
+def index_names(plan: Any) -> Set[str]:
+    names = set()
+    if isinstance(plan, dict):
+        if "Index Name" in plan:
+            names.add(plan["Index Name"])
+        for value in plan.values():
+            names |= index_names(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            names |= index_names(value)
+    return names
+
+
+async def explain_last_query(
+    db_session, call: Callable[[], Awaitable[Any]]
+) -> Set[str]:
+    statements: List[tuple] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    connection = await db_session.connection()
+    await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    return index_names(result.scalar())
+
+
+@pytest.mark.asyncio
+async def test_object_page_uses_partial_tenant_index(db_session):
+    indexes = await explain_last_query(
+        db_session,
+        lambda: business_object_service.get_multi(
+            db=db_session,
+            tenant_id="plan-tenant",
+            paginate="cursor",
+            include_total=False,
+        ),
+    )
+    await db_session.rollback()
+    assert "ix_business_objects_tenant_created_id_active" in indexes
+
+
+@pytest.mark.asyncio
+async def test_object_analyses_use_composite_index(db_session):
+    indexes = await explain_last_query(
+        db_session,
+        lambda: analysis_service.get_by_object(
+            db=db_session, object_id=uuid4(), tenant_id="plan-tenant"
+        ),
+    )
+    await db_session.rollback()
+    assert "ix_analyses_object_tenant_created" in indexes
+
+
+@pytest.mark.asyncio
+async def test_relationship_lookups_use_endpoint_indexes(db_session):
+    for statement in SEED_RELATIONSHIPS_SQL:
+        await db_session.execute(statement)
+
+    object_id = uuid4()
+    plans = {}
+    for column, index in (
+        (RelationshipModel.source_id, "ix_relationships_source_tenant"),
+        (RelationshipModel.target_id, "ix_relationships_target_tenant"),
+    ):
+        plans[index] = await explain_last_query(
+            db_session,
+            lambda: db_session.execute(
+                select(RelationshipModel).where(
+                    column == object_id, RelationshipModel.tenant_id == "plan-tenant"
+                )
+            ),
+        )
+    await db_session.rollback()
+
+    for index, indexes in plans.items():
+        assert index in indexes
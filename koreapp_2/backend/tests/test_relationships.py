@@ -0,0 +1,250 @@
+from itertools import product
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from app.models.relationship import Relationship as RelationshipModel
+from app.models.relationship import RelationshipType
+from app.schemas.business_object import BusinessObjectCreate
+from app.schemas.relationship import RelationshipCreate
+from app.schemas.user import User
+from app.services.business_object import business_object_service
+from app.services.impact import TenantImpactIndex, impact_service
+from app.services.relationship import (
+    DIRECTIONS,
+    DOWNSTREAM,
+    UPSTREAM,
+    RelationshipAdjacency,
+    graph_result,
+    relationship_service,
+)
+
+
+def test_adjacency_walk_handles_cycles_and_type_filter():
+    a, b, c, d = (uuid4() for _ in range(4))
+    adjacency = RelationshipAdjacency(
+        [
+            (a, b, RelationshipType.DEPENDS_ON),
+            (b, c, RelationshipType.USES),
+            (c, a, RelationshipType.TRIGGERS),
+            (c, d, RelationshipType.USES),
+        ]
+    )
+
+    graph = graph_result(a, DOWNSTREAM, 5, adjacency.walk(a, DOWNSTREAM, 5))
+    assert [(node["object_id"], node["depth"]) for node in graph["nodes"]] == [
+        (b, 1),
+        (c, 2),
+        (d, 3),
+    ]
+    assert len(graph["edges"]) == 4
+
+    upstream = adjacency.walk(d, UPSTREAM, 2, {RelationshipType.USES})
+    assert [(edge[0], edge[3]) for edge in upstream] == [(c, 1), (b, 2)]
+
+    assert adjacency.walk(a, DOWNSTREAM, 1, {RelationshipType.USES}) == []
+
+
+def test_impact_index_updates_incrementally():
+    a, b, c, d = (uuid4() for _ in range(4))
+    edges = [
+        (b, a, RelationshipType.DEPENDS_ON),
+        (a, c, RelationshipType.TRIGGERS),
+        (c, d, RelationshipType.PRODUCES),
+    ]
+    index = TenantImpactIndex(edges, max_entries=1000)
+    assert [(item[0], item[1]) for item in index.ranked(a)] == [(b, 1), (c, 1), (d, 2)]
+    assert index.ranked(a)[0][2] == RelationshipType.DEPENDS_ON
+
+    index.add_edge(d, a, RelationshipType.USES)
+    edges.append((d, a, RelationshipType.USES))
+    assert index.ranked(a) == TenantImpactIndex(edges, 1000).ranked(a)
+    assert [item[0] for item in index.ranked(a, max_depth=1)] == [b, d, c]
+
+    index.remove_edge(a, c, RelationshipType.TRIGGERS)
+    assert [item[0] for item in index.ranked(a)] == [b, d]
+
+
+@pytest.mark.asyncio
+async def test_impact_index_tracks_other_workers_and_removed_objects(db_session):
+    tenant_id = f"impact-tenant-{uuid4()}"
+    a, b, c, d, e = [
+        (
+            await business_object_service.create(
+                db_session,
+                obj_in=BusinessObjectCreate(name=name, type="process"),
+                tenant_id=tenant_id,
+                created_by="test-user-id",
+            )
+        ).id
+        for name in "ABCDE"
+    ]
+
+    async def relate(source_id, target_id, type):
+        await relationship_service.create(
+            db_session,
+            obj_in=RelationshipCreate(
+                source_id=source_id, target_id=target_id, type=type
+            ),
+            tenant_id=tenant_id,
+            created_by="test-user-id",
+        )
+
+    async def impact():
+        result = await impact_service.get_impact(
+            db_session, object_id=a, tenant_id=tenant_id
+        )
+        return [item["object_id"] for item in result["items"]]
+
+    await relate(b, a, RelationshipType.DEPENDS_ON)
+    await relate(a, c, RelationshipType.TRIGGERS)
+    builds = impact_service.stats()["builds"]
+    assert sorted(await impact()) == sorted([b, c])
+    assert impact_service.stats()["builds"] == builds + 1
+
+    await relate(d, a, RelationshipType.USES)
+    assert d in await impact()
+    assert impact_service.stats()["builds"] == builds + 1
+
+    db_session.add(
+        RelationshipModel(
+            source_id=e,
+            target_id=a,
+            type=RelationshipType.DEPENDS_ON,
+            tenant_id=tenant_id,
+            created_by="other-worker",
+        )
+    )
+    await db_session.commit()
+    stale_rebuilds = impact_service.stats()["stale_rebuilds"]
+    assert e in await impact()
+    assert impact_service.stats()["stale_rebuilds"] == stale_rebuilds + 1
+
+    await business_object_service.remove(db_session, id=c)
+    assert sorted(await impact()) == sorted([b, d, e])
+
+
+def normalize(graph):
+    return (
+        sorted((node["object_id"], node["depth"]) for node in graph["nodes"]),
+        sorted(
+            (edge["source_id"], edge["target_id"], edge["type"], edge["depth"])
+            for edge in graph["edges"]
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_graph_matches_recursive_cte(db_session):
+    tenant_id = f"graph-tenant-{uuid4()}"
+    a, b, c, d, e = [
+        (
+            await business_object_service.create(
+                db_session,
+                obj_in=BusinessObjectCreate(name=name, type="workflow"),
+                tenant_id=tenant_id,
+                created_by="test-user-id",
+            )
+        ).id
+        for name in "ABCDE"
+    ]
+    for source_id, target_id, type in [
+        (a, b, RelationshipType.DEPENDS_ON),
+        (b, c, RelationshipType.USES),
+        (c, a, RelationshipType.TRIGGERS),
+        (c, d, RelationshipType.USES),
+        (b, d, RelationshipType.CONTAINS),
+        (d, e, RelationshipType.PRODUCES),
+    ]:
+        await relationship_service.create(
+            db_session,
+            obj_in=RelationshipCreate(
+                source_id=source_id, target_id=target_id, type=type
+            ),
+            tenant_id=tenant_id,
+            created_by="test-user-id",
+        )
+
+    async def graphs(object_id, direction, max_depth, types=None):
+        return [
+            normalize(
+                await relationship_service.get_graph(
+                    db_session,
+                    object_id=object_id,
+                    tenant_id=tenant_id,
+                    direction=direction,
+                    max_depth=max_depth,
+                    types=types,
+                    use_cache=use_cache,
+                )
+            )
+            for use_cache in (True, False)
+        ]
+
+    for root, direction, max_depth, types in product(
+        [a, c, e], DIRECTIONS, [1, 2, 3, 5], [None, [RelationshipType.USES]]
+    ):
+        cached, cte = await graphs(root, direction, max_depth, types)
+        assert cached == cte
+
+    cached, cte = await graphs(a, DOWNSTREAM, 5)
+    assert cached == cte
+    assert dict(cached[0]) == {b: 1, c: 2, d: 2, e: 3}
+
+    await business_object_service.remove(db_session, id=e)
+    db_session.add(
+        RelationshipModel(
+            source_id=d,
+            target_id=a,
+            type=RelationshipType.DEPENDS_ON,
+            tenant_id=tenant_id,
+            created_by="other-worker",
+        )
+    )
+    await db_session.commit()
+    stale_rebuilds = relationship_service.stats()["stale_rebuilds"]
+    cached, cte = await graphs(d, DOWNSTREAM, 5)
+    assert cached == cte
+    assert relationship_service.stats()["stale_rebuilds"] == stale_rebuilds + 1
+    assert dict(cached[0]) == {a: 1, b: 2, c: 3}
+
+
+@pytest.mark.asyncio
+async def test_relationship_graph_endpoint(client: AsyncClient, current_user: User):
+    ids = []
+    for name in ("Order", "Invoice", "Ledger"):
+        response = await client.post(
+            "/api/v1/objects/", json={"name": name, "type": "workflow"}
+        )
+        ids.append(response.json()["id"])
+    order, invoice, ledger = ids
+    for source_id, target_id in [(order, invoice), (invoice, ledger)]:
+        response = await client.post(
+            "/api/v1/relationships/",
+            json={"source_id": source_id, "target_id": target_id, "type": "triggers"},
+        )
+        assert response.status_code == 200
+
+    response = await client.get(
+        f"/api/v1/relationships/graph/{order}", params={"max_depth": 1}
+    )
+    assert response.status_code == 200
+    assert [node["object_id"] for node in response.json()["nodes"]] == [invoice]
+
+    response = await client.get(
+        f"/api/v1/relationships/graph/{ledger}", params={"direction": "upstream"}
+    )
+    assert [
+        (node["object_id"], node["depth"]) for node in response.json()["nodes"]
+    ] == [(invoice, 1), (order, 2)]
+    assert [edge["depth"] for edge in response.json()["edges"]] == [1, 2]
+
+    response = await client.get(
+        f"/api/v1/relationships/graph/{order}", params={"direction": "sideways"}
+    )
+    assert response.status_code == 400
+
+    current_user.tenant_id = f"test-tenant-{uuid4()}"
+    response = await client.get(f"/api/v1/relationships/graph/{order}")
+    assert response.status_code == 404
@@ -0,0 +1,113 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.db.routing import ReplicaSet, RoutingSession
+from app.schemas.business_object import BusinessObjectCreate
+from app.services.business_object import business_object_service
+
+RoutingBase = declarative_base()
+
+
+class Item(RoutingBase):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for engine, name in ((primary, "primary"), (replica, "replica")):
+        async with engine.begin() as conn:
+            await conn.run_sync(RoutingBase.metadata.create_all)
+            await conn.execute(Item.__table__.insert().values(id=1, name=name))
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+def routing_sessionmaker(primary, replicas):
+    return sessionmaker(
+        primary,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        expire_on_commit=False,
+    )
+
+
+async def read_name(db, use_replica=True):
+    result = await db.execute(
+        select(Item.name).where(Item.id == 1).execution_options(use_replica=use_replica)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_reads_route_to_replica_until_write(engines):
+    primary, replica = engines
+    replicas = ReplicaSet([replica], check_interval=1, check_timeout=1, max_lag=30)
+    Session = routing_sessionmaker(primary, replicas)
+
+    async with Session() as db:
+        assert await read_name(db) == "replica"
+        assert await read_name(db, use_replica=False) == "primary"
+
+        db.add(Item(id=2, name="written"))
+        await db.commit()
+
+        assert await read_name(db) == "primary"
+
+    async with Session() as db:
+        assert await read_name(db) == "replica"
+    assert replicas.stats()["routed_reads"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_replica_is_ejected(engines, tmp_path):
+    primary, replica = engines
+    broken = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"
+    )
+    replicas = ReplicaSet([broken], check_interval=1, check_timeout=1, max_lag=30)
+
+    await replicas.check()
+    assert replicas.healthy == []
+    assert replicas.stats()["ejections"] == 1
+
+    async with routing_sessionmaker(primary, replicas)() as db:
+        assert await read_name(db) == "primary"
+    await broken.dispose()
+
+
+@pytest.mark.asyncio
+async def test_object_get_reads_primary_unless_asked(db_engine):
+    replica = create_async_engine(db_engine.url)
+    replicas = ReplicaSet([replica], check_interval=1, check_timeout=1, max_lag=30)
+    Session = routing_sessionmaker(db_engine, replicas)
+    try:
+        async with Session() as db:
+            obj = await business_object_service.create(
+                db,
+                obj_in=BusinessObjectCreate(name="Routed Object", type="workflow"),
+                tenant_id="replica-tenant",
+                created_by="test-user-id",
+            )
+
+        async with Session() as db:
+            assert await business_object_service.get(
+                db, id=obj.id, tenant_id="replica-tenant"
+            )
+            assert replicas.stats()["routed_reads"] == 0
+
+            assert await business_object_service.get(
+                db, id=obj.id, tenant_id="replica-tenant", use_replica=True
+            )
+            assert replicas.stats()["routed_reads"] == 1
+    finally:
+        await replica.dispose()